@@ -1,9 +1,16 @@
+import logging
+import os
+
 from flask import Flask, g
 from flask_cors import CORS
 
-from config.db_config import get_database_uri
+from config.db_config import get_database_uri, get_replica_uris
 from services import db
 from services.error_handlers import register_error_handlers
+from services.sql_stats import register_request_hooks
+from services.metrics import register_metrics
+from services.password_hasher import dummy_password_hash
+from services.profiler import request_profiler
 
 from routes.health import health_bp
 from routes.members import members_bp
@@ -13,11 +20,34 @@ from routes.payments import payments_bp
 from routes.checkins import checkins_bp
 from routes.workout_plans import workout_plans_bp
 from routes.classes import classes_bp
+from routes.schedules import schedules_bp
+from routes.admin import admin_bp
+from routes.auth import auth_bp
+from routes.metrics import metrics_bp
+from services.purge_service import purge_service
+
+
+def configure_logging():
+    """Send the app's own "fittrack.*" loggers to stderr at INFO.
+
+    Only the "fittrack" logger is touched, so the host's (or a WSGI server's)
+    root logging configuration stays as it is. A handler is added only when no
+    handler would receive the records already.
+    """
+    logger = logging.getLogger("fittrack")
+    logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        logger.addHandler(handler)
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
 
+    # One line per request from services.sql_stats (and other fittrack loggers)
+    configure_logging()
+
     # Enable CORS for all routes (allows frontend on port 8000 to access backend)
     CORS(app)
 
@@ -25,11 +55,14 @@ def create_app() -> Flask:
     database_uri = get_database_uri()
 
     # Initialize database
-    db.init_db(database_uri)
+    db.init_db(database_uri, get_replica_uris())
 
     # Create tables
     db.create_all_tables()
 
+    # Hash the dummy password now, not during the first unknown-email login
+    dummy_password_hash()
+
     # Attach database session to request context
     @app.before_request
     def attach_session():
@@ -47,6 +80,15 @@ def create_app() -> Flask:
             session.close()
         db.close_session()
 
+    # SQL query count / timing per request (Server-Timing header in debug mode)
+    register_request_hooks(app)
+
+    # Request/DB latency histograms and pool stats for GET /api/metrics
+    register_metrics(app)
+
+    # Opt-in cProfile sampling (FITTRACK_PROFILE_SAMPLE_RATE / FITTRACK_PROFILE_SECRET)
+    request_profiler.init_app(app)
+
     # error handlers (FitTrackError וכו')
     register_error_handlers(app)
 
@@ -59,6 +101,14 @@ def create_app() -> Flask:
     app.register_blueprint(checkins_bp, url_prefix="/api")
     app.register_blueprint(workout_plans_bp, url_prefix="/api")
     app.register_blueprint(classes_bp, url_prefix="/api")
+    app.register_blueprint(schedules_bp, url_prefix="/api")
+    app.register_blueprint(admin_bp, url_prefix="/api")
+    app.register_blueprint(auth_bp, url_prefix="/api")
+    app.register_blueprint(metrics_bp, url_prefix="/api")
+
+    # Purge soft-deleted members off-peak (enable on one worker only)
+    if os.getenv("FITTRACK_PURGER", "").lower() in ("1", "true", "yes"):
+        purge_service.start_scheduler()
 
     return app
 
@@ -0,0 +1 @@
+"""End-to-end API benchmarks on generated datasets (see bench/run.py)."""
@@ -0,0 +1,214 @@
+"""
+Performance regression gate for the hot API endpoints.
+
+Runs a quick benchmark profile (small generated datasets, few requests) several
+times, takes the median of every metric across runs to smooth out noise, and
+compares the medians with the baselines stored in bench/baselines.json:
+
+- Query budgets are hard limits. Query counts are deterministic, so going over
+  QUERY_BUDGETS fails no matter what the baseline says.
+- Queries per request may not grow beyond the recorded baseline.
+- p50 / p95 latency may not grow by more than their relative tolerance (plus a
+  small absolute slack, so sub-millisecond jitter never fails the gate).
+- Every measured request must succeed.
+
+Latency baselines only mean something on the machine that recorded them;
+with --queries-only (e.g. on shared CI runners) latency is reported but not enforced.
+Endpoints in LATENCY_TOLERANCES get their own, wider tolerances. The same query
+budgets are asserted on every pytest run by tests/test_query_budgets.py.
+
+Usage (from the server directory):
+    python -m bench.gate                 # exit status 1 on any regression
+    python -m bench.gate --queries-only
+    python -m bench.gate --update        # re-record bench/baselines.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+from datetime import datetime
+
+from bench.run import SERVER_DIR, benchmark_size, git_commit
+
+BASELINES_PATH = os.path.join(SERVER_DIR, "bench", "baselines.json")
+
+# Quick profile: small enough to run on every change, large enough to show N+1s and scans
+GATE_SIZES = (1000, 5000)
+GATE_MONTHS = 6
+GATE_SEED = 42
+GATE_REQUESTS = 30
+GATE_WARMUP = 5
+GATE_RUNS = 3  # Medians across this many independent runs
+
+P50_TOLERANCE = 0.25  # Allowed relative p50 increase over baseline
+P95_TOLERANCE = 0.50  # p95 is noisier
+LATENCY_SLACK_MS = 1.0  # Absolute slack on top of the relative tolerances
+
+# Maximum SQL statements per request (transaction control excluded); hard assertions
+QUERY_BUDGETS = {
+    "POST /checkins": 9,
+    "GET /classes (member)": 3,
+    "GET /classes (trainer)": 3,
+    "POST /classes/<id>/sessions": 8,
+    "GET /members": 3,
+    "GET /payments": 2,
+    "POST /members/<id>/subscriptions": 8,
+}
+
+# Per-endpoint (p50, p95) tolerances for endpoints noisier than the defaults. GET /payments
+# is an unpaginated scan of every payment (~312 ms p50 at 5k members), so its timing
+# varies more with I/O; it is still gated against its own per-size baseline.
+LATENCY_TOLERANCES = {
+    "GET /payments": (0.40, 0.75),
+}
+
+
+def measure(sizes=GATE_SIZES, runs: int = GATE_RUNS) -> dict:
+    """Run the quick profile `runs` times per size; returns median metrics per size and endpoint."""
+    measured = {}
+    for members in sizes:
+        samples = []
+        for run in range(runs):
+            print(f"{members:,} members: run {run + 1}/{runs}")
+            samples.append(benchmark_size(members, GATE_MONTHS, GATE_SEED, GATE_REQUESTS, GATE_WARMUP,
+                                          endpoints=list(QUERY_BUDGETS)))
+        measured[str(members)] = {name: _median_metrics([sample[name] for sample in samples])
+                                  for name in samples[0]}
+    return measured
+
+
+def _median_metrics(results: list[dict]) -> dict:
+    if any("skipped" in result for result in results):
+        return {"skipped": results[0].get("skipped", "no suitable rows in this dataset")}
+    return {
+        "p50_ms": round(statistics.median(r["p50_ms"] for r in results), 3),
+        "p95_ms": round(statistics.median(r["p95_ms"] for r in results), 3),
+        "throughput_rps": round(statistics.median(r["throughput_rps"] for r in results), 1),
+        "queries_per_request": round(statistics.median(r["queries_per_request"] for r in results), 2),
+        "max_queries": max(r["max_queries"] for r in results),
+        "errors": max(r["errors"] for r in results),
+    }
+
+
+def check(measured: dict, baselines: dict, enforce_latency: bool = True) -> list[str]:
+    """Compare measured medians with budgets and baselines; returns failure messages."""
+    failures = []
+    for size, endpoints in measured.items():
+        for name, result in endpoints.items():
+            label = f"{name} @ {int(size):,} members"
+            if "skipped" in result:
+                failures.append(f"{label}: not measured ({result['skipped']})")
+                continue
+
+            budget = QUERY_BUDGETS.get(name)
+            if budget is not None and result["max_queries"] > budget:
+                failures.append(f"{label}: {result['max_queries']} queries per request, budget is {budget}")
+            if result["errors"]:
+                failures.append(f"{label}: {result['errors']} request(s) failed")
+
+            baseline = baselines.get(size, {}).get(name)
+            if baseline is None:
+                if baselines:
+                    print(f"  note: no baseline for {label}")
+                continue
+            if result["queries_per_request"] > baseline["queries_per_request"] + 0.01:
+                failures.append(f"{label}: {result['queries_per_request']} queries per request, "
+                                f"baseline {baseline['queries_per_request']}")
+            if not enforce_latency:
+                continue
+            p50_tolerance, p95_tolerance = LATENCY_TOLERANCES.get(name, (P50_TOLERANCE, P95_TOLERANCE))
+            for metric, tolerance in (("p50_ms", p50_tolerance), ("p95_ms", p95_tolerance)):
+                limit = baseline[metric] * (1 + tolerance) + LATENCY_SLACK_MS
+                if result[metric] > limit:
+                    failures.append(f"{label}: {metric} {result[metric]:.2f} > {limit:.2f} "
+                                    f"(baseline {baseline[metric]:.2f} +{tolerance:.0%} +{LATENCY_SLACK_MS}ms)")
+    return failures
+
+
+def print_comparison(measured: dict, baselines: dict):
+    print(f"\n  {'endpoint':34s} {'size':>6s} {'p50 ms':>15s} {'p95 ms':>15s} {'queries':>11s}")
+    for size, endpoints in measured.items():
+        for name, result in endpoints.items():
+            if "skipped" in result:
+                continue
+            baseline = baselines.get(size, {}).get(name, {})
+
+            def pair(metric, fmt):
+                value = format(result[metric], fmt)
+                return f"{value} ({format(baseline[metric], fmt)})" if metric in baseline else value
+
+            print(f"  {name:34s} {size:>6s} {pair('p50_ms', '.2f'):>15s} {pair('p95_ms', '.2f'):>15s} "
+                  f"{pair('queries_per_request', '.1f'):>11s}")
+    print("  (baseline in parentheses)")
+
+
+def load_baselines() -> dict:
+    if not os.path.exists(BASELINES_PATH):
+        return {"meta": {}, "baselines": {}}
+    with open(BASELINES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(measured: dict):
+    data = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "months": GATE_MONTHS,
+            "seed": GATE_SEED,
+            "requests": GATE_REQUESTS,
+            "warmup": GATE_WARMUP,
+            "runs": GATE_RUNS,
+        },
+        "baselines": measured,
+    }
+    with open(BASELINES_PATH, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail on performance regressions against stored baselines")
+    parser.add_argument("--update", action="store_true", help="Record new baselines instead of checking")
+    parser.add_argument("--queries-only", action="store_true", help="Do not enforce latency (other hardware)")
+    parser.add_argument("--runs", type=int, default=GATE_RUNS, help="Repeated runs per size (median is used)")
+    args = parser.parse_args()
+
+    stored = load_baselines()
+    measured = measure(runs=args.runs)
+
+    if args.update:
+        # Never record a baseline that already breaks a hard budget
+        failures = check(measured, {}, enforce_latency=False)
+        if failures:
+            print("\nNot updating baselines:")
+            for failure in failures:
+                print(f"  ✗ {failure}")
+            return 1
+        save_baselines(measured)
+        print_comparison(measured, stored["baselines"])
+        print(f"\n✓ Baselines written to {BASELINES_PATH}")
+        return 0
+
+    enforce_latency = not args.queries_only
+    recorded_on = stored["meta"].get("platform")
+    if enforce_latency and recorded_on and recorded_on != platform.platform():
+        print(f"Warning: baselines were recorded on {recorded_on}; latency comparisons may not be meaningful")
+
+    print_comparison(measured, stored["baselines"])
+    failures = check(measured, stored["baselines"], enforce_latency)
+    if failures:
+        print(f"\n✗ {len(failures)} performance regression(s):")
+        for failure in failures:
+            print(f"  ✗ {failure}")
+        return 1
+    print("\n✓ No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
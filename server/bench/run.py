@@ -0,0 +1,471 @@
+"""
+Benchmark the hot API endpoints on generated datasets.
+
+For every dataset size a SQLite database is generated once with the seed.py
+generator (cached in bench/data/, keyed by size, months, seed and date) and
+copied to a scratch file, so every run starts from identical data. Each size
+is then benchmarked in its own process (fresh engine, caches and metrics)
+through the Flask test client, or through a local WSGI server with --server.
+
+Per endpoint the results hold throughput, p50/p95/p99/mean latency, queries
+per request and non-2xx responses. They are written as JSON (by default to
+bench/results/<git commit>.json) so runs can be compared across commits.
+
+Usage (from the server directory):
+    python -m bench.run --sizes 1000,10000 --months 12
+    python -m bench.run --sizes 1000 --server --requests 500
+    python -m bench.run --sizes 1000 --compare bench/results/abc1234.json
+    python -m bench.run --database-url mysql+pymysql://user:pw@localhost/fittrack_bench
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from itertools import cycle
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(SERVER_DIR, "bench", "data")
+RESULTS_DIR = os.path.join(SERVER_DIR, "bench", "results")
+
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_MONTHS = 12
+DEFAULT_SEED = 42
+DEFAULT_REQUESTS = 200  # Measured requests per endpoint
+DEFAULT_WARMUP = 20  # Unmeasured requests per endpoint (caches, statement compilation)
+
+
+# ----------------------------------------------------------------------
+# Datasets
+# ----------------------------------------------------------------------
+
+def dataset_path(members: int, months: int, seed: int, today: date) -> str:
+    return os.path.join(DATA_DIR, f"members{members}_months{months}_seed{seed}_{today.isoformat()}.db")
+
+
+def ensure_dataset(members: int, months: int, seed: int, today: date) -> str:
+    """Generate the dataset unless it is already cached; returns its path."""
+    path = dataset_path(members, months, seed, today)
+    if os.path.exists(path):
+        return path
+    os.makedirs(DATA_DIR, exist_ok=True)
+    partial = path + ".partial"
+    for leftover in (partial, partial + "-wal", partial + "-shm"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+    print(f"Generating dataset: {members:,} members, {months} months (seed {seed})...")
+    env = dict(os.environ, SQLITE_PATH=partial)
+    env.pop("DATABASE_URL", None)
+    env.pop("DATABASE_REPLICA_URLS", None)
+    subprocess.run(
+        [sys.executable, "seed.py", "--members", str(members), "--months", str(months), "--seed", str(seed)],
+        cwd=SERVER_DIR, env=env, check=True, stdout=subprocess.DEVNULL,
+    )
+    _checkpoint(partial)
+    os.replace(partial, path)
+    return path
+
+
+def _checkpoint(path: str):
+    """Fold the WAL into the main file so the database is a single copyable file."""
+    import sqlite3
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        connection.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        connection.close()
+
+
+# ----------------------------------------------------------------------
+# Worker: benchmark one dataset in this process
+# ----------------------------------------------------------------------
+
+class _Fixtures:
+    """IDs the scenarios cycle through, read from the dataset before timing starts."""
+
+    def __init__(self, session, limit: int):
+        from sqlalchemy import text
+
+        def ids(sql, **params):
+            return [row[0] for row in session.execute(text(sql), params).all()]
+
+        today = date.today()
+        now = datetime.now()
+        self.admin_id = ids("SELECT id FROM users WHERE role = 'admin' AND deleted_at IS NULL ORDER BY id LIMIT 1")[0]
+        self.trainer_id = ids("SELECT id FROM users WHERE role = 'trainer' AND deleted_at IS NULL ORDER BY id LIMIT 1")[0]
+        self.plan_id = ids("SELECT id FROM plans ORDER BY id LIMIT 1")[0]
+        # Members who can check in: active account with a current subscription
+        self.checkin_members = ids(
+            "SELECT DISTINCT s.member_id FROM subscriptions s JOIN users u ON u.id = s.member_id "
+            "WHERE s.status = 'active' AND s.start_date <= :today AND s.end_date >= :today "
+            "AND u.status = 'active' AND u.deleted_at IS NULL ORDER BY s.member_id LIMIT :limit",
+            today=today, limit=limit,
+        )
+        # Members with upcoming bookings, so their class listing is not empty
+        self.booked_members = ids(
+            "SELECT DISTINCT se.member_id FROM sessions se JOIN gym_classes c ON c.id = se.gym_class_id "
+            "JOIN users u ON u.id = se.member_id WHERE se.status = 'active' AND c.start_time >= :now "
+            "AND u.status = 'active' AND u.deleted_at IS NULL ORDER BY se.member_id LIMIT :limit",
+            now=now, limit=limit,
+        )
+        # Members without an active or frozen subscription can start a new one
+        self.unsubscribed_members = ids(
+            "SELECT u.id FROM users u WHERE u.role = 'member' AND u.deleted_at IS NULL AND NOT EXISTS ("
+            "SELECT 1 FROM subscriptions s WHERE s.member_id = u.id AND s.status IN ('active', 'frozen')) "
+            "ORDER BY u.id LIMIT :limit",
+            limit=limit,
+        )
+        self.registrations = self._free_registrations(session, now, limit)
+
+    @staticmethod
+    def _free_registrations(session, now, limit: int) -> list[tuple[int, int]]:
+        """(class_id, member_id) pairs that fit into open spots of upcoming classes."""
+        from sqlalchemy import text
+
+        members = [row[0] for row in session.execute(text(
+            "SELECT id FROM users WHERE role = 'member' AND deleted_at IS NULL ORDER BY id LIMIT 5000"
+        )).all()]
+        classes = session.execute(text(
+            "SELECT c.id, c.capacity - COUNT(se.id) FROM gym_classes c "
+            "LEFT JOIN sessions se ON se.gym_class_id = c.id AND se.status = 'active' "
+            "WHERE c.start_time >= :now GROUP BY c.id, c.capacity ORDER BY c.start_time, c.id"
+        ), {"now": now}).all()
+        taken = set(session.execute(text(
+            "SELECT se.gym_class_id, se.member_id FROM sessions se JOIN gym_classes c ON c.id = se.gym_class_id "
+            "WHERE c.start_time >= :now"
+        ), {"now": now}).all())
+
+        pairs, member_cycle = [], cycle(members)
+        for class_id, free in classes:
+            while free > 0 and len(pairs) < limit:
+                member_id = next(member_cycle)
+                if (class_id, member_id) in taken:
+                    continue
+                taken.add((class_id, member_id))
+                pairs.append((class_id, member_id))
+                free -= 1
+            if len(pairs) >= limit:
+                break
+        return pairs
+
+
+def _scenarios(fixtures: _Fixtures) -> dict:
+    """Endpoint name -> (requests, repeatable).
+
+    Requests are (method, path, json body, user id) tuples, cycled through
+    while measuring. Non-repeatable scenarios (registration, subscription
+    creation) would fail the second time round, so each request is sent once.
+    """
+    admin, trainer = fixtures.admin_id, fixtures.trainer_id
+    return {
+        "POST /checkins": (
+            [("POST", "/api/checkins", {"member_id": m}, m) for m in fixtures.checkin_members], True
+        ),
+        "GET /classes (member)": (
+            [("GET", "/api/classes", None, m) for m in fixtures.booked_members], True
+        ),
+        "GET /classes (trainer)": (
+            [("GET", "/api/classes", None, trainer)], True
+        ),
+        "POST /classes/<id>/sessions": (
+            [("POST", f"/api/classes/{class_id}/sessions", {"member_id": m}, admin)
+             for class_id, m in fixtures.registrations], False
+        ),
+        "GET /members": (
+            [("GET", "/api/members", None, admin)], True
+        ),
+        "GET /payments": (
+            [("GET", "/api/payments", None, admin)], True
+        ),
+        "POST /members/<id>/subscriptions": (
+            [("POST", f"/api/members/{m}/subscriptions", {"plan_id": fixtures.plan_id}, admin)
+             for m in fixtures.unsubscribed_members], False
+        ),
+    }
+
+
+class _TestClientTransport:
+    """Send requests through Flask's test client (no network, no server)."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def send(self, method: str, path: str, body, user_id: int) -> int:
+        response = self.client.open(path, method=method, json=body, headers={"X-User-ID": str(user_id)})
+        return response.status_code
+
+    def close(self):
+        pass
+
+
+class _WsgiServerTransport:
+    """Send requests over HTTP to a local WSGI server running in a background thread."""
+
+    def __init__(self, app):
+        from werkzeug.serving import make_server
+        self.server = make_server("127.0.0.1", 0, app, threaded=False)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def send(self, method: str, path: str, body, user_id: int) -> int:
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port)
+        try:
+            headers = {"X-User-ID": str(user_id)}
+            payload = None
+            if body is not None:
+                payload = json.dumps(body)
+                headers["Content-Type"] = "application/json"
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+    def close(self):
+        self.server.shutdown()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def _measure(transport, requests: list[tuple], repeatable: bool, count: int, warmup: int, query_counter: list) -> dict:
+    """Send `warmup` + `count` requests (cycling through `requests`) and summarize the measured ones."""
+    if not repeatable and len(requests) < count + warmup:
+        # Not enough distinct requests in this dataset: shrink the run instead of repeating
+        warmup = min(warmup, len(requests) // 10)
+        count = len(requests) - warmup
+    sequence = cycle(requests)
+
+    for _ in range(warmup):
+        transport.send(*next(sequence))
+
+    latencies, queries, errors = [], [], 0
+    started = time.perf_counter()
+    for _ in range(count):
+        method, path, body, user_id = next(sequence)
+        before = query_counter[0]
+        request_started = time.perf_counter()
+        status = transport.send(method, path, body, user_id)
+        latencies.append(time.perf_counter() - request_started)
+        queries.append(query_counter[0] - before)
+        if status >= 300:
+            errors += 1
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 1) if elapsed else None,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "queries_per_request": round(statistics.fmean(queries), 2),
+        "max_queries": max(queries),
+    }
+
+
+def run_worker(database: str, requests: int, warmup: int, use_server: bool, endpoints: list[str] | None) -> dict:
+    """Benchmark every endpoint against `database`, a SQLite file or a URL (called in a fresh process)."""
+    if "://" in database:
+        os.environ["DATABASE_URL"] = database
+    else:
+        os.environ["SQLITE_PATH"] = database
+        os.environ.pop("DATABASE_URL", None)
+    os.environ.pop("DATABASE_REPLICA_URLS", None)
+
+    import warnings
+    from sqlalchemy.exc import SAWarning
+    from app import create_app
+    from services import db
+    from services.sql_stats import statement_listeners
+
+    # Mapper configuration warnings are printed once per process, i.e. once per run
+    warnings.simplefilter("ignore", SAWarning)
+
+    app = create_app()
+    # Per-request log lines and budget warnings would drown the report (queries are measured below)
+    logging.getLogger("fittrack").setLevel(logging.ERROR)
+
+    query_counter = [0]
+
+    def count_statement(statement, parameters, seconds):
+        query_counter[0] += 1
+
+    statement_listeners.append(count_statement)
+
+    session = db.get_session()
+    try:
+        fixtures = _Fixtures(session, limit=requests + warmup)
+    finally:
+        session.close()
+        db.close_session()
+
+    transport = _WsgiServerTransport(app) if use_server else _TestClientTransport(app)
+    results = {}
+    try:
+        for name, (scenario, repeatable) in _scenarios(fixtures).items():
+            if endpoints and name not in endpoints:
+                continue
+            if not scenario:
+                results[name] = {"skipped": "no suitable rows in this dataset"}
+                continue
+            results[name] = _measure(transport, scenario, repeatable, requests, warmup, query_counter)
+    finally:
+        transport.close()
+    return results
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_worker_process(database: str, requests: int, warmup: int, use_server: bool,
+                        endpoints: list[str] | None) -> dict:
+    with tempfile.TemporaryDirectory(prefix="fittrack-bench-") as scratch:
+        output = os.path.join(scratch, "results.json")
+        command = [
+            sys.executable, "-m", "bench.run", "--worker", database, "--worker-output", output,
+            "--requests", str(requests), "--warmup", str(warmup),
+        ]
+        if use_server:
+            command.append("--server")
+        for endpoint in endpoints or ():
+            command += ["--endpoint", endpoint]
+        subprocess.run(command, cwd=SERVER_DIR, check=True, stdout=subprocess.DEVNULL)
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def benchmark_size(members: int, months: int, seed: int, requests: int, warmup: int,
+                   use_server: bool = False, endpoints: list[str] | None = None) -> dict:
+    """Benchmark one dataset size on a fresh copy of its SQLite dataset; returns per-endpoint results."""
+    dataset = ensure_dataset(members, months, seed, date.today())
+    with tempfile.TemporaryDirectory(prefix="fittrack-bench-") as scratch:
+        database = os.path.join(scratch, "bench.db")
+        shutil.copyfile(dataset, database)
+        return _run_worker_process(database, requests, warmup, use_server, endpoints)
+
+
+def run_benchmarks(sizes, months: int = DEFAULT_MONTHS, seed: int = DEFAULT_SEED, requests: int = DEFAULT_REQUESTS,
+                   warmup: int = DEFAULT_WARMUP, use_server: bool = False, endpoints: list[str] | None = None,
+                   database_url: str | None = None) -> dict:
+    """Benchmark every size (or the existing database at `database_url`); returns the JSON-ready report."""
+    import sqlalchemy
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "dataset_date": date.today().isoformat(),
+            "database": database_url.split("://")[0] if database_url else "sqlite",
+            "transport": "wsgi-server" if use_server else "test-client",
+            "months": months,
+            "seed": seed,
+            "requests": requests,
+            "warmup": warmup,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+    if database_url:
+        # An existing (e.g. MySQL) database seeded with seed.py --members; writes made by the run persist
+        print("Benchmarking the database at --database-url...")
+        report["results"]["database-url"] = _run_worker_process(database_url, requests, warmup, use_server, endpoints)
+        return report
+    for members in sizes:
+        print(f"Benchmarking {members:,} members...")
+        report["results"][str(members)] = benchmark_size(members, months, seed, requests, warmup, use_server, endpoints)
+    return report
+
+
+def print_report(report: dict, baseline: dict | None = None):
+    """Print one table per dataset size, with changes against `baseline` when given."""
+    for size, endpoints in report["results"].items():
+        print(f"\n{int(size):,} members" if size.isdigit() else f"\n{size}")
+        print(f"  {'endpoint':34s} {'rps':>8s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'queries':>8s} {'errors':>6s}")
+        for name, result in endpoints.items():
+            if "skipped" in result:
+                print(f"  {name:34s} skipped: {result['skipped']}")
+                continue
+            line = (f"  {name:34s} {result['throughput_rps']:>8.1f} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                    f"{result['p99_ms']:>9.2f} {result['queries_per_request']:>8.1f} {result['errors']:>6d}")
+            previous = (baseline or {}).get("results", {}).get(size, {}).get(name)
+            if previous and "p50_ms" in previous and previous["p50_ms"]:
+                change = (result["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+                line += f"   p50 {change:+.0f}%, queries {previous['queries_per_request']:.1f} -> {result['queries_per_request']:.1f}"
+            print(line)
+
+
+def _parse_sizes(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot API endpoints on generated datasets")
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES),
+                        help="Comma-separated member counts (default: %(default)s)")
+    parser.add_argument("--months", type=int, default=DEFAULT_MONTHS, help="Months of generated history")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Dataset seed")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Unmeasured requests per endpoint")
+    parser.add_argument("--server", action="store_true", help="Go through a local WSGI server instead of the test client")
+    parser.add_argument("--endpoint", action="append", help="Only run this endpoint (repeatable)")
+    parser.add_argument("--database-url", help="Benchmark this already-seeded database (e.g. MySQL) instead of generated SQLite datasets")
+    parser.add_argument("--output", help="Results file (default: bench/results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        results = run_worker(args.worker, args.requests, args.warmup, args.server, args.endpoint)
+        with open(args.worker_output, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        return
+
+    report = run_benchmarks(args.sizes, args.months, args.seed, args.requests, args.warmup, args.server,
+                            args.endpoint, args.database_url)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['meta']['commit'] or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,83 @@ MAX_PHONE_LENGTH = 20
 MAX_STATUS_LENGTH = 20
 MIN_NAME_LENGTH = 2
 
+# ============================================================================
+# PAGINATION
+# ============================================================================
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+PROFILE_RECENT_LIMIT = 10  # Recent check-ins / payments listed on a member profile
+PROFILE_WINDOW_DAYS = 30  # Window summarized on a member profile
+DEFAULT_SEARCH_LIMIT = 10  # Typeahead results per member search
+MAX_SEARCH_LIMIT = 50
+MIN_SEARCH_QUERY_LENGTH = 2
+
+# ============================================================================
+# SCHEDULING
+# ============================================================================
+MAX_CLASS_DURATION_MINUTES = 300  # Upper bound enforced by ClassCreate
+CONFLICT_INDEX_REFRESH_SECONDS = 300  # Reload to pick up writes from other workers
+
+# ============================================================================
+# SQL INSTRUMENTATION
+# ============================================================================
+DEFAULT_QUERY_BUDGET = 25  # Queries per request before a budget warning (override with @query_budget)
+N_PLUS_ONE_THRESHOLD = 5  # Same statement this many times in one request is flagged as N+1
+SLOWEST_STATEMENTS_TRACKED = 3  # Slowest statements reported per request
+SLOW_QUERY_THRESHOLD_MS = 100  # Statements slower than this go to the slow-query log (FITTRACK_SLOW_QUERY_MS)
+SLOW_QUERY_MAX_SHAPES = 500  # Distinct statement shapes kept by the slow-query log
+SLOW_QUERY_SAMPLES_PER_SHAPE = 5  # Most recent parameter samples kept per shape
+
+# ============================================================================
+# METRICS
+# ============================================================================
+# Histogram bucket upper bounds in seconds (fixed so recording is a bisect + increment)
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_QUERY_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# ============================================================================
+# PROFILING (opt-in, see services/profiler.py)
+# ============================================================================
+PROFILE_DIR = "profiles"  # Relative to the server directory unless FITTRACK_PROFILE_DIR is set
+PROFILE_MAX_FILES = 50  # Oldest profiles are deleted beyond this
+PROFILE_SIGNATURE_MAX_AGE_SECONDS = 300  # X-Profile header signatures expire after this
+
+# ============================================================================
+# PASSWORD HASHING
+# ============================================================================
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 100_000  # Raise to strengthen; old hashes upgrade on next login
+LEGACY_PASSWORD_HASH_ITERATIONS = 100_000  # Cost of unversioned "salt$hash" values
+HASH_WORKERS = 4  # Concurrent hashing threads per process
+HASH_QUEUE_LIMIT = 32  # Hash jobs allowed to wait for a worker before rejecting
+HASH_QUEUE_TIMEOUT_SECONDS = 2.0  # Wait this long for a queue slot before 503
+
+# ============================================================================
+# BULK IMPORT
+# ============================================================================
+IMPORT_CHUNK_SIZE = 500  # Rows validated, hashed and inserted per committed batch
+IMPORT_HASH_WORKERS = None  # import_members.py hashing processes (None = one per CPU)
+
+# ============================================================================
+# SYNTHETIC DATA (seed.py --members N --months M)
+# ============================================================================
+DATAGEN_SEED = 42  # Same seed + same reference date = same dataset
+DATAGEN_CHUNK_SIZE = 10_000  # Rows per executemany INSERT
+DATAGEN_PASSWORD = "Passw0rd!"  # Shared by every generated member/trainer (hashed once)
+DATAGEN_MEMBERS_PER_TRAINER = 1000
+DATAGEN_CLASSES_PER_TRAINER_DAY = 2
+DATAGEN_FUTURE_DAYS = 14  # Classes are also scheduled this far ahead
+DATAGEN_VISITS_PER_MONTH = 5.0  # Mean check-ins per member per subscribed month
+
+# ============================================================================
+# BULK DELETION
+# ============================================================================
+DELETE_CHUNK_SIZE = 5000  # Rows per committed batch when purging soft-deleted members
+PURGE_CHUNK_PAUSE_SECONDS = 0.05  # Breathing room for other writers between chunks
+PURGE_INTERVAL_SECONDS = 600  # How often the background purger wakes up
+PURGE_OFF_PEAK_START_HOUR = 1  # Background purging window (local time, [start, end))
+PURGE_OFF_PEAK_END_HOUR = 5
+
 # ============================================================================
 # PASSWORD REQUIREMENTS
 # ============================================================================
@@ -48,6 +125,19 @@ class MemberStatus(str, Enum):
         return [status.value for status in cls]
 
 
+class UserRole(str, Enum):
+    """User roles (users.role discriminator values)."""
+    MEMBER = "member"
+    TRAINER = "trainer"
+    ADMIN = "admin"
+    RECEPTION = "reception"
+
+    @classmethod
+    def values(cls):
+        """Return list of all role values."""
+        return [role.value for role in cls]
+
+
 class SubscriptionStatus(str, Enum):
     """Subscription status values."""
     ACTIVE = "active"
@@ -97,6 +187,17 @@ class SessionStatus(str, Enum):
         return [status.value for status in cls]
 
 
+class RegistrationMode(str, Enum):
+    """Bulk class registration modes."""
+    ALL_OR_NOTHING = "all_or_nothing"
+    BEST_EFFORT = "best_effort"
+
+    @classmethod
+    def values(cls):
+        """Return list of all mode values."""
+        return [mode.value for mode in cls]
+
+
 class DayOfWeek(str, Enum):
     """Day of week values."""
     SUNDAY = "Sunday"
@@ -112,6 +213,21 @@ class DayOfWeek(str, Enum):
         """Return list of all day values."""
         return [day.value for day in cls]
 
+    def weekday(self) -> int:
+        """Return the matching date.weekday() number (Monday=0 ... Sunday=6)."""
+        return _WEEKDAY_NUMBERS[self.value]
+
+
+_WEEKDAY_NUMBERS = {
+    "Monday": 0,
+    "Tuesday": 1,
+    "Wednesday": 2,
+    "Thursday": 3,
+    "Friday": 4,
+    "Saturday": 5,
+    "Sunday": 6,
+}
+
 
 class DifficultyLevel(str, Enum):
     """Workout difficulty level values."""
@@ -132,3 +248,6 @@ DEFAULT_MEMBER_STATUS = MemberStatus.ACTIVE
 DEFAULT_SUBSCRIPTION_STATUS = SubscriptionStatus.ACTIVE
 DEFAULT_PAYMENT_STATUS = PaymentStatus.PENDING
 DEFAULT_SESSION_STATUS = SessionStatus.ACTIVE
+DEFAULT_SCHEDULE_HORIZON_DAYS = 28
+MAX_SCHEDULE_HORIZON_DAYS = 365
+MAX_BULK_REGISTRATION = 300  # Matches the largest allowed class capacity
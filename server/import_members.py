@@ -0,0 +1,52 @@
+"""
+Import members from a CSV or NDJSON file.
+
+Columns / keys: full_name, email, phone, national_id, password
+Usage:
+    python import_members.py members.csv
+    python import_members.py members.ndjson --report errors.json
+"""
+import argparse
+import json
+import os
+
+from config.db_config import get_database_uri
+from config.constants import IMPORT_CHUNK_SIZE, IMPORT_HASH_WORKERS
+from services.db import init_db
+from services.import_service import MemberImportService, IMPORT_FORMATS, iter_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-import members")
+    parser.add_argument("path", help="CSV or NDJSON file")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="File format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Rows per committed batch")
+    parser.add_argument("--workers", type=int, default=IMPORT_HASH_WORKERS, help="Password hashing processes")
+    parser.add_argument("--report", help="Write the full JSON report to this file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    init_db(get_database_uri())
+
+    service = MemberImportService(chunk_size=args.chunk_size, workers=args.workers or os.cpu_count() or 1)
+    try:
+        with open(args.path, newline="", encoding="utf-8-sig") as f:
+            report = service.import_members(iter_rows(f, fmt))
+    finally:
+        service.shutdown()
+
+    print(f"✓ Imported {report['imported']} of {report['total']} rows")
+    if report["failed"]:
+        print(f"✗ {report['failed']} row(s) rejected")
+        for error in report["errors"][:20]:
+            print(f"  line {error['line']}: {'; '.join(error['errors'])}")
+        if report["failed"] > 20:
+            print("  ...")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ from models.workout_item import WorkoutItem
 from models.payment import Payment
 from models.checkin import Checkin
 from models.waiting_list import WaitingList
+from models.class_schedule import ClassSchedule
 
 
 def migrate():
@@ -4,5 +4,6 @@ from models.trainer import Trainer
 from models.admin import Admin
 from models.reception import Reception
 from models.waiting_list import WaitingList
+from models.class_schedule import ClassSchedule
 
-__all__ = ['User', 'Member', 'Trainer', 'Admin', 'Reception', 'WaitingList']
+__all__ = ['User', 'Member', 'Trainer', 'Admin', 'Reception', 'WaitingList', 'ClassSchedule']
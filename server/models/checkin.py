@@ -1,11 +1,15 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from services.db import Base
 
 
 class Checkin(Base):
     __tablename__ = "checkins"
+    __table_args__ = (
+        # Recent check-ins for one member (profile window) are a range scan
+        Index("ix_checkins_member_created_at", "member_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -0,0 +1,66 @@
+from datetime import datetime, date, timedelta
+from sqlalchemy import Column, Integer, String, Text, Date, Time, DateTime
+from sqlalchemy.orm import relationship
+from services.db import Base
+from config.constants import DayOfWeek
+
+
+class ClassSchedule(Base):
+    """
+    Weekly recurring class definition.
+    Occurrences are materialized as GymClass rows (linked by schedule_id)
+    by ScheduleService for a rolling horizon.
+    """
+    __tablename__ = "class_schedules"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(120), nullable=False)
+    instructor = Column(String(120), nullable=False)
+    days_of_week = Column(String(80), nullable=False)  # Comma separated DayOfWeek values
+    start_time = Column(Time, nullable=False)  # Time of day for every occurrence
+    duration_minutes = Column(Integer, nullable=False, default=60)
+    capacity = Column(Integer, nullable=False, default=20)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)  # Open-ended when NULL
+    exception_dates = Column(Text, nullable=True)  # Comma separated ISO dates to skip
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    occurrences = relationship("GymClass", back_populates="schedule")
+
+    def get_days(self) -> list[DayOfWeek]:
+        """Return the weekdays this schedule runs on."""
+        return [DayOfWeek(d) for d in self.days_of_week.split(",") if d]
+
+    def get_exception_dates(self) -> set[date]:
+        """Return the dates on which the class is skipped."""
+        if not self.exception_dates:
+            return set()
+        return {date.fromisoformat(d) for d in self.exception_dates.split(",") if d}
+
+    def iter_occurrences(self, from_date: date, to_date: date):
+        """Yield occurrence start datetimes between from_date and to_date (inclusive)."""
+        first = max(from_date, self.start_date)
+        last = min(to_date, self.end_date) if self.end_date else to_date
+        weekdays = {d.weekday() for d in self.get_days()}
+        skipped = self.get_exception_dates()
+
+        day = first
+        while day <= last:
+            if day.weekday() in weekdays and day not in skipped:
+                yield datetime.combine(day, self.start_time)
+            day += timedelta(days=1)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "instructor": self.instructor,
+            "days_of_week": [d.value for d in self.get_days()],
+            "start_time": self.start_time.isoformat(),
+            "duration_minutes": self.duration_minutes,
+            "capacity": self.capacity,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "exception_dates": sorted(d.isoformat() for d in self.get_exception_dates()),
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -1,23 +1,36 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from services.db import Base
 
 
 class GymClass(Base):
     __tablename__ = "gym_classes"
+    __table_args__ = (
+        Index("ix_gym_classes_instructor_start_time", "instructor", "start_time"),
+        UniqueConstraint("schedule_id", "start_time", name="uq_gym_classes_schedule_start_time"),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(120), nullable=False)
     instructor = Column(String(120), nullable=False)
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=False, default=60)
     capacity = Column(Integer, nullable=False, default=20)
+    schedule_id = Column(Integer, ForeignKey("class_schedules.id"), nullable=True, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
+    schedule = relationship("ClassSchedule", back_populates="occurrences")
     sessions = relationship("Session", back_populates="gym_class", cascade="all, delete-orphan")
 
-    def to_dict(self, include_stats: bool = False):
+    def to_dict(self, include_stats: bool = False, stats: dict | None = None):
+        """Serialize the class.
+
+        Args:
+            include_stats: Add registration stats under "stats"
+            stats: Pre-computed {"active": n, "canceled": n} counts for this class.
+                When omitted, stats are computed from the loaded sessions.
+        """
         data = {
             "id": self.id,
             "title": self.title,
@@ -25,11 +38,16 @@ class GymClass(Base):
             "start_time": self.start_time.isoformat(),
             "duration_minutes": self.duration_minutes,
             "capacity": self.capacity,
+            "schedule_id": self.schedule_id,
             "created_at": self.created_at.isoformat(),
         }
         if include_stats:
-            active_count = sum(1 for s in self.sessions if s.status == "active")
-            canceled_count = sum(1 for s in self.sessions if s.status == "canceled")
+            if stats is not None:
+                active_count = stats.get("active", 0)
+                canceled_count = stats.get("canceled", 0)
+            else:
+                active_count = sum(1 for s in self.sessions if s.status == "active")
+                canceled_count = sum(1 for s in self.sessions if s.status == "canceled")
             data["stats"] = {
                 "active_registrations": active_count,
                 "canceled_registrations": canceled_count,
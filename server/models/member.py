@@ -17,6 +17,7 @@ class Member(User):
     # Member-specific fields
     national_id = Column(String(20), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
+    no_show_count = Column(Integer, nullable=False, default=0, server_default="0")  # Used for overbooking decisions
 
     # Member-specific relationships
     subscriptions = relationship("Subscription", back_populates="member", cascade="all, delete-orphan")
@@ -57,5 +58,6 @@ class Member(User):
         base_dict = super().to_dict()
         base_dict.update({
             "national_id": self.national_id,
+            "no_show_count": self.no_show_count,
         })
         return base_dict
@@ -1,11 +1,16 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from services.db import Base
 
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Covers membership checks (class, member, status) and per-class counts
+        Index("ix_sessions_class_member_status", "gym_class_id", "member_id", "status"),
+        Index("ix_sessions_member_id", "member_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     gym_class_id = Column(Integer, ForeignKey("gym_classes.id"), nullable=False)
@@ -15,6 +20,7 @@ class Session(Base):
     attended = Column(Boolean, nullable=False, default=False)
     registered_at = Column(DateTime, nullable=True)
     canceled_at = Column(DateTime, nullable=True)
+    attendance_marked_at = Column(DateTime, nullable=True)  # NULL until attendance is taken
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     gym_class = relationship("GymClass", back_populates="sessions")
@@ -27,5 +33,6 @@ class Session(Base):
             "member_id": self.member_id,
             "status": self.status,
             "attended": self.attended,
+            "attendance_marked_at": self.attendance_marked_at.isoformat() if self.attendance_marked_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
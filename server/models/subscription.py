@@ -23,25 +23,28 @@ class Subscription(Base):
     plan = relationship("Plan", back_populates="subscriptions")
     payments = relationship("Payment", foreign_keys="[Payment.subscription_id]", cascade="all, delete-orphan")
 
-    def recompute_status(self, today: date | None = None):
+    def current_status(self, today: date | None = None) -> str:
+        """Status derived from the dates, without modifying the row."""
         today = today or date.today()
         if self.frozen_until and self.frozen_until >= today:
-            self.status = SubscriptionStatus.FROZEN.value
-            return self.status
+            return SubscriptionStatus.FROZEN.value
         if self.end_date < today:
-            self.status = SubscriptionStatus.EXPIRED.value
+            return SubscriptionStatus.EXPIRED.value
+        if self.status == SubscriptionStatus.CANCELED.value:
             return self.status
-        if self.status not in (SubscriptionStatus.CANCELED.value,):
-            self.status = SubscriptionStatus.ACTIVE.value
+        return SubscriptionStatus.ACTIVE.value
+
+    def recompute_status(self, today: date | None = None):
+        self.status = self.current_status(today)
         return self.status
 
     def to_dict(self):
-        self.recompute_status()
+        # Derived, not written back: serializing must not dirty the session on read paths
         return {
             "id": self.id,
             "member_id": self.member_id,
             "plan_id": self.plan_id,
-            "status": self.status,
+            "status": self.current_status(),
             "start_date": self.start_date.isoformat() if self.start_date else None,
             "end_date": self.end_date.isoformat() if self.end_date else None,
             "remaining_entries": self.remaining_entries,
@@ -1,7 +1,9 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, DateTime, Date
+from sqlalchemy import Column, Integer, String, DateTime, Date, Index, event
+from sqlalchemy.orm import Session as OrmSession, with_loader_criteria
 from services.db import Base
 from config.constants import DEFAULT_MEMBER_STATUS
+from utils.validators import normalize_name, normalize_phone
 
 
 class User(Base):
@@ -29,6 +31,17 @@ class User(Base):
     date_of_birth = Column(Date, nullable=True)
     status = Column(String(20), nullable=False, default=DEFAULT_MEMBER_STATUS.value)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    deleted_at = Column(DateTime, nullable=True, index=True)  # Soft delete marker, purged later
+
+    # Normalized copies for indexed prefix search (kept current by _sync_search_columns)
+    first_name_norm = Column(String(50), nullable=True, index=True)
+    last_name_norm = Column(String(50), nullable=True, index=True)
+    phone_digits = Column(String(20), nullable=True, index=True)
+
+    __table_args__ = (
+        # Keyset pagination of a single role (GET /members) walks this index in id order
+        Index("ix_users_role_id", "role", "id"),
+    )
 
     # Configure polymorphic inheritance
     __mapper_args__ = {
@@ -71,3 +84,31 @@ class User(Base):
             "status": self.status,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+@event.listens_for(User, "before_insert", propagate=True)
+@event.listens_for(User, "before_update", propagate=True)
+def _sync_search_columns(mapper, connection, target):
+    """Keep the normalized search columns in step with name and phone edits.
+
+    Core bulk inserts bypass this hook and must fill the columns themselves.
+    """
+    target.first_name_norm = normalize_name(target.first_name)
+    target.last_name_norm = normalize_name(target.last_name)
+    target.phone_digits = normalize_phone(target.phone)
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _exclude_soft_deleted_users(execute_state):
+    """Hide soft-deleted users (and members, trainers, ...) from every ORM SELECT.
+
+    Pass execution_options(include_deleted=True) to see them, e.g. when purging.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(User, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+        )
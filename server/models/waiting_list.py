@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from services.db import Base
 
@@ -8,19 +8,29 @@ class WaitingList(Base):
     """
     Simple waiting list for gym classes.
     When a class is full, members can join the waiting list.
+
+    Queue order is the autoincrement id (monotonic, assigned by the database
+    on INSERT), so joining never has to read the current length of the queue.
+    Positions are dense 1-based ranks computed on read; see
+    WaitingListService.get_waitlist.
     """
     __tablename__ = "waiting_lists"
+    __table_args__ = (
+        UniqueConstraint("gym_class_id", "member_id", name="uq_waiting_lists_class_member"),
+    )
 
     id = Column(Integer, primary_key=True)
     gym_class_id = Column(Integer, ForeignKey("gym_classes.id"), nullable=False, index=True)
     member_id = Column(Integer, ForeignKey("members.id"), nullable=False, index=True)
-    position = Column(Integer, nullable=False)  # Position in queue
     joined_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
     gym_class = relationship("GymClass")
     member = relationship("Member")
 
+    # Rank in queue, filled in by the service when the entry is read (not stored)
+    position = None
+
     def to_dict(self):
         return {
             "id": self.id,
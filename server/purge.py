@@ -0,0 +1,34 @@
+"""
+Purge soft-deleted members and all their related rows.
+
+Run from cron during off-peak hours, e.g.:
+    python purge.py --chunk-size 5000
+"""
+import argparse
+
+from config.db_config import get_database_uri
+from config.constants import DELETE_CHUNK_SIZE, PURGE_CHUNK_PAUSE_SECONDS
+from services.db import init_db
+from services.purge_service import purge_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Purge soft-deleted members")
+    parser.add_argument("--chunk-size", type=int, default=DELETE_CHUNK_SIZE, help="Rows deleted per committed chunk")
+    parser.add_argument("--pause", type=float, default=PURGE_CHUNK_PAUSE_SECONDS, help="Seconds to sleep between chunks")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of members to purge")
+    args = parser.parse_args()
+
+    init_db(get_database_uri())
+
+    pending = len(purge_service.pending_member_ids(limit=args.limit))
+    print(f"Purging {pending} soft-deleted member(s)...")
+    purged = purge_service.purge_pending(max_members=args.limit, chunk_size=args.chunk_size, pause_seconds=args.pause)
+    progress = purge_service.get_progress()
+    print(f"✓ Purged {purged} member(s), {progress['rows_deleted']} rows deleted, {progress['pending_members']} pending")
+    if progress["last_error"]:
+        print(f"✗ Last error: {progress['last_error']}")
+
+
+if __name__ == "__main__":
+    main()
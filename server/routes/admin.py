@@ -0,0 +1,70 @@
+from flask import Blueprint, request, send_file
+from http import HTTPStatus
+
+from services.password_hasher import password_hasher
+from services.profiler import request_profiler
+from services.purge_service import purge_service
+from services.slow_query_log import slow_query_log
+from utils.auth import require_role
+
+admin_bp = Blueprint("admin", __name__)
+
+
+@admin_bp.route("/admin/purge", methods=["GET"])
+@require_role('admin')
+def get_purge_progress():
+    """Progress of the soft-deleted member purge - Admin only."""
+    return purge_service.get_progress(), HTTPStatus.OK
+
+
+@admin_bp.route("/admin/purge", methods=["POST"])
+@require_role('admin')
+def post_purge():
+    """Start purging soft-deleted members now instead of waiting for off-peak - Admin only."""
+    started = purge_service.start_in_background()
+    return {"started": started, **purge_service.get_progress()}, HTTPStatus.ACCEPTED
+
+
+@admin_bp.route("/admin/hashing", methods=["GET"])
+@require_role('admin')
+def get_hashing_metrics():
+    """Password hashing pool usage and queue depth - Admin only."""
+    return password_hasher.get_metrics(), HTTPStatus.OK
+
+
+@admin_bp.route("/admin/profiles", methods=["GET"])
+@require_role('admin')
+def get_profiles():
+    """Saved request profiles, newest first - Admin only."""
+    return {
+        "enabled": request_profiler.enabled,
+        "sample_rate": request_profiler.sample_rate,
+        "profiles": request_profiler.list_profiles(),
+    }, HTTPStatus.OK
+
+
+@admin_bp.route("/admin/profiles/<name>", methods=["GET"])
+@require_role('admin')
+def download_profile(name: str):
+    """Download a pstats profile - Admin only."""
+    return send_file(request_profiler.profile_path(name), mimetype="application/octet-stream",
+                     as_attachment=True, download_name=name)
+
+
+@admin_bp.route("/admin/slow-queries", methods=["GET"])
+@require_role('admin')
+def get_slow_queries():
+    """Top slow statement shapes by total time, with EXPLAIN plans - Admin only."""
+    limit = request.args.get("limit", 20, type=int)
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.top(limit=max(1, limit)),
+    }, HTTPStatus.OK
+
+
+@admin_bp.route("/admin/slow-queries", methods=["DELETE"])
+@require_role('admin')
+def reset_slow_queries():
+    """Clear the slow-query log - Admin only."""
+    slow_query_log.reset()
+    return {"reset": True}, HTTPStatus.OK
@@ -0,0 +1,19 @@
+from flask import Blueprint, request
+from http import HTTPStatus
+from schemas.member_schema import LoginRequest
+from services.member_service import MemberService
+
+auth_bp = Blueprint("auth", __name__)
+member_service = MemberService()
+
+
+@auth_bp.route("/auth/login", methods=["POST"])
+def login():
+    """Check member credentials.
+
+    Returns the member; clients send its id as X-User-ID afterwards.
+    Outdated password hashes are upgraded on success.
+    """
+    payload = LoginRequest.model_validate(request.get_json(force=True))
+    member_dict = member_service.authenticate(email=payload.email, password=payload.password)
+    return member_dict, HTTPStatus.OK
@@ -1,11 +1,14 @@
+from datetime import datetime
 from flask import Blueprint, request, g
 from http import HTTPStatus
+from config.constants import DEFAULT_PAGE_SIZE
 from schemas.class_schema import ClassCreate
-from schemas.session_schema import SessionCreate
+from schemas.session_schema import SessionCreate, BulkSessionCreate, AttendanceMark
 from services.class_service import ClassService
 from services.session_service import SessionService
 from services.waiting_list_service import WaitingListService
-from services.exceptions import ForbiddenError
+from services.exceptions import ForbiddenError, BadRequestError
+from services.sql_stats import query_budget
 from utils.auth import require_role, login_required
 
 
@@ -15,29 +18,48 @@ session_service = SessionService()
 waiting_list_service = WaitingListService()
 
 
+def _parse_datetime_arg(name: str) -> datetime | None:
+    """Parse an optional ISO-8601 datetime query parameter."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise BadRequestError(f"'{name}' must be an ISO-8601 datetime")
+
+
 @classes_bp.route("/classes", methods=["GET"])
+@query_budget(5)
 @login_required
 def get_classes():
-    """Get classes - All classes for admin/trainer, only registered classes for members."""
+    """Get one page of classes - All classes for admin/trainer, only registered classes for members.
+
+    Query params: from, to (ISO-8601, default from=now), instructor, cursor, limit.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    """
     current_user = g.current_user
-    
-    # Admin and trainer can view all classes
+
     if current_user.role in ['trainer', 'admin']:
-        classes = class_service.list_classes()
-        return [c.to_dict(include_stats=True) for c in classes], HTTPStatus.OK
-    
-    # Members can only view classes they are registered in
-    if current_user.role == 'member':
-        all_classes = class_service.list_classes()
-        member_classes = []
-        for cls in all_classes:
-            participants = session_service.get_participants(cls.id)
-            participant_ids = [p.id for p in participants]
-            if current_user.id in participant_ids:
-                member_classes.append(cls)
-        return [c.to_dict(include_stats=True) for c in member_classes], HTTPStatus.OK
-    
-    raise ForbiddenError("You don't have permission to view classes")
+        member_id = None
+    elif current_user.role == 'member':
+        # Members can only view classes they are registered in
+        member_id = current_user.id
+    else:
+        raise ForbiddenError("You don't have permission to view classes")
+
+    classes, next_cursor = class_service.list_classes(
+        start=_parse_datetime_arg("from"),
+        end=_parse_datetime_arg("to"),
+        instructor=request.args.get("instructor"),
+        cursor=request.args.get("cursor"),
+        limit=request.args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+        member_id=member_id,
+    )
+    counts = class_service.get_registration_counts([c.id for c in classes])
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return [c.to_dict(include_stats=True, stats=counts[c.id]) for c in classes], HTTPStatus.OK, headers
 
 
 @classes_bp.route("/classes", methods=["POST"])
@@ -52,6 +74,8 @@ def post_class():
     
     # Pass trainer_id if current user is a trainer (for OOP permission check)
     trainer_id = g.current_user.id if g.current_user.role == 'trainer' else None
+    # Store display name before service call (to avoid DetachedInstanceError)
+    display_name = g.current_user.get_display_name()
     
     gym_class = class_service.create_class(
         title=payload.title,
@@ -62,38 +86,56 @@ def post_class():
         trainer_id=trainer_id
     )
     
-    # Include creator display name in response
-    result = gym_class.to_dict(include_stats=True)
-    result['created_by'] = g.current_user.get_display_name()
+    # Include creator display name in response (a new class has no registrations yet)
+    result = gym_class.to_dict(include_stats=True, stats={})
+    result['created_by'] = display_name
     return result, HTTPStatus.CREATED
 
 
+def _require_class_access(class_id: int, action: str = "view this class"):
+    """Authorize the current user for a class-scoped read endpoint.
+
+    Admin and trainer can access any class. Members only classes they are
+    actively registered in, decided with an indexed EXISTS query that is
+    memoized for the rest of the request.
+
+    Raises:
+        ForbiddenError: If the user may not access the class
+    """
+    current_user = g.current_user
+
+    if current_user.role in ['trainer', 'admin']:
+        return
+
+    if current_user.role == 'member':
+        memo = g.setdefault('class_access', {})
+        key = (class_id, current_user.id)
+        if key not in memo:
+            memo[key] = session_service.is_registered(class_id, current_user.id)
+        if not memo[key]:
+            raise ForbiddenError("You are not registered in this class")
+        return
+
+    raise ForbiddenError(f"You don't have permission to {action}")
+
+
 @classes_bp.route("/classes/<int:class_id>", methods=["GET"])
 @login_required
 def get_one_class(class_id: int):
     """Get class details - Admin/Trainer can view any, members only if registered."""
-    current_user = g.current_user
     gym_class = class_service.get_class(class_id)
-    
-    # Admin and trainer can view any class
-    if current_user.role in ['trainer', 'admin']:
-        return gym_class.to_dict(include_stats=True), HTTPStatus.OK
-    
-    # Members can only view classes they are registered in
-    if current_user.role == 'member':
-        participants = session_service.get_participants(class_id)
-        participant_ids = [p.id for p in participants]
-        if current_user.id not in participant_ids:
-            raise ForbiddenError("You are not registered in this class")
-        return gym_class.to_dict(include_stats=True), HTTPStatus.OK
-    
-    raise ForbiddenError("You don't have permission to view this class")
+    _require_class_access(class_id)
+
+    counts = class_service.get_registration_counts([class_id])
+    return gym_class.to_dict(include_stats=True, stats=counts[class_id]), HTTPStatus.OK
 
 @classes_bp.route("/classes/<int:class_id>", methods=["PUT"])
 @require_role('trainer', 'admin')
 def put_class(class_id: int):
     """Update gym class - Trainer and Admin only."""
     payload = ClassCreate.model_validate(request.get_json(force=True))
+    # Store display name before service call (to avoid DetachedInstanceError)
+    display_name = g.current_user.get_display_name()
     gym_class = class_service.update_class(
         class_id=class_id,
         title=payload.title,
@@ -102,16 +144,19 @@ def put_class(class_id: int):
         duration_minutes=payload.duration_minutes,
         capacity=payload.capacity,
     )
-    result = gym_class.to_dict(include_stats=True)
-    result['updated_by'] = g.current_user.get_display_name()
+    counts = class_service.get_registration_counts([gym_class.id])
+    result = gym_class.to_dict(include_stats=True, stats=counts[gym_class.id])
+    result['updated_by'] = display_name
     return result, HTTPStatus.OK
 
 @classes_bp.route("/classes/<int:class_id>", methods=["DELETE"])
 @require_role('trainer', 'admin')
 def delete_class(class_id: int):
     """Delete gym class - Trainer and Admin only."""
+    # Store display name before service call (to avoid DetachedInstanceError)
+    display_name = g.current_user.get_display_name()
     class_service.delete_class(class_id)
-    return {"deleted": True, "id": class_id, "deleted_by": g.current_user.get_display_name()}, HTTPStatus.OK
+    return {"deleted": True, "id": class_id, "deleted_by": display_name}, HTTPStatus.OK
 
 
 @classes_bp.route("/classes/<int:class_id>/sessions", methods=["POST"])
@@ -121,27 +166,26 @@ def post_session(class_id: int):
     s = session_service.register_member_to_class(class_id=class_id, member_id=payload.member_id)
     return s.to_dict(), HTTPStatus.CREATED
 
+@classes_bp.route("/classes/<int:class_id>/sessions/bulk", methods=["POST"])
+@require_role('trainer', 'admin')
+def post_sessions_bulk(class_id: int):
+    """Register a list of members in one request - Trainer and Admin only."""
+    payload = BulkSessionCreate.model_validate(request.get_json(force=True))
+    result = session_service.register_members_bulk(
+        class_id=class_id,
+        member_ids=payload.member_ids,
+        mode=payload.mode,
+        waitlist_overflow=payload.waitlist_overflow,
+    )
+    return result, HTTPStatus.OK
+
 @classes_bp.route("/classes/<int:class_id>/sessions", methods=["GET"])
 @login_required
 def get_sessions(class_id: int):
     """Get sessions for a class - Trainer, Admin, or members of the class only."""
-    current_user = g.current_user
-    
-    # Trainer and admin can view any class sessions
-    if current_user.role in ['trainer', 'admin']:
-        sessions = session_service.get_class_sessions(class_id=class_id)
-        return [s.to_dict() for s in sessions], HTTPStatus.OK
-    
-    # Members can view sessions only if they are registered in the class
-    if current_user.role == 'member':
-        members = session_service.get_participants(class_id=class_id)
-        member_ids = [m.id for m in members]
-        if current_user.id not in member_ids:
-            raise ForbiddenError("You are not registered in this class")
-        sessions = session_service.get_class_sessions(class_id=class_id)
-        return [s.to_dict() for s in sessions], HTTPStatus.OK
-    
-    raise ForbiddenError("You don't have permission to view class sessions")
+    _require_class_access(class_id, "view class sessions")
+    sessions = session_service.get_class_sessions(class_id=class_id)
+    return [s.to_dict() for s in sessions], HTTPStatus.OK
 
 
 @classes_bp.route("/classes/<int:class_id>/sessions/<int:member_id>", methods=["DELETE"])
@@ -151,49 +195,34 @@ def delete_session(class_id: int, member_id: int):
     return s.to_dict(), HTTPStatus.OK
 
 
+@classes_bp.route("/classes/<int:class_id>/attendance", methods=["POST"])
+@require_role('trainer', 'admin')
+def post_attendance(class_id: int):
+    """Mark attended and no-show members for a class - Trainer and Admin only."""
+    payload = AttendanceMark.model_validate(request.get_json(force=True))
+    result = session_service.mark_attendance(
+        class_id=class_id,
+        attended_ids=payload.attended,
+        no_show_ids=payload.no_show,
+    )
+    return result, HTTPStatus.OK
+
+
 @classes_bp.route("/classes/<int:class_id>/participants", methods=["GET"])
 @login_required
 def get_class_participants(class_id: int):
     """Get participants in a class - Trainer, Admin, or members of the class only."""
-    current_user = g.current_user
-    
-    # Trainer and admin can view any class participants
-    if current_user.role in ['trainer', 'admin']:
-        members = session_service.get_participants(class_id=class_id)
-        return [m.to_dict() for m in members], HTTPStatus.OK
-    
-    # Members can view participants only if they are registered in the class
-    if current_user.role == 'member':
-        members = session_service.get_participants(class_id=class_id)
-        # Check if current member is in the class
-        member_ids = [m.id for m in members]
-        if current_user.id not in member_ids:
-            raise ForbiddenError("You are not registered in this class")
-        return [m.to_dict() for m in members], HTTPStatus.OK
-    
-    raise ForbiddenError("You don't have permission to view class participants")
+    _require_class_access(class_id, "view class participants")
+    members = session_service.get_participants(class_id=class_id)
+    return [m.to_dict() for m in members], HTTPStatus.OK
 
 
 @classes_bp.route("/classes/<int:class_id>/stats", methods=["GET"])
 @login_required
 def get_stats(class_id: int):
     """Get class statistics - Trainer, Admin, or members of the class only."""
-    current_user = g.current_user
-    
-    # Trainer and admin can view any class stats
-    if current_user.role in ['trainer', 'admin']:
-        return session_service.get_class_stats(class_id=class_id), HTTPStatus.OK
-    
-    # Members can view stats only if they are registered in the class
-    if current_user.role == 'member':
-        members = session_service.get_participants(class_id=class_id)
-        # Check if current member is in the class
-        member_ids = [m.id for m in members]
-        if current_user.id not in member_ids:
-            raise ForbiddenError("You are not registered in this class")
-        return session_service.get_class_stats(class_id=class_id), HTTPStatus.OK
-    
-    raise ForbiddenError("You don't have permission to view class stats")
+    _require_class_access(class_id, "view class stats")
+    return session_service.get_class_stats(class_id=class_id), HTTPStatus.OK
 
 
 @classes_bp.route("/classes/<int:class_id>/waitlist", methods=["GET"])
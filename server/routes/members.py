@@ -1,28 +1,60 @@
+import io
 from flask import Blueprint, request, g
 from http import HTTPStatus
+from config.constants import DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_LIMIT, UserRole
 from schemas.member_schema import MemberCreate, MemberUpdate
 from services.member_service import MemberService
+from services.import_service import MemberImportService, iter_rows
 from services.exceptions import ForbiddenError
+from services.sql_stats import query_budget
 from utils.auth import login_required, require_role
 from models.admin import Admin
 
 members_bp = Blueprint("members", __name__)
 member_service = MemberService()
+import_service = MemberImportService()
 
 @members_bp.route("/members", methods=["GET"])
 @require_role('admin')
 def get_members():
-    """List all members - Admin only."""
+    """List one page of members - Admin only.
+
+    Query params: fields (comma-separated), status, role (default member),
+    cursor (next_cursor from the previous page), limit.
+    """
     current_user = g.current_user
-    
-    members_list = member_service.list_members()
+    # Store display name before service call to avoid DetachedInstanceError
+    requested_by = current_user.get_display_name()
+
+    fields = request.args.get("fields")
+    members_list, next_cursor = member_service.list_members(
+        fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+        status=request.args.get("status"),
+        role=request.args.get("role", UserRole.MEMBER.value),
+        cursor=request.args.get("cursor", type=int),
+        limit=request.args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+    )
     
     # Include requester info using OOP method
     return {
         'members': members_list,
-        'requested_by': current_user.get_display_name()
+        'next_cursor': next_cursor,
+        'requested_by': requested_by
     }, HTTPStatus.OK.value
 
+@members_bp.route("/members/search", methods=["GET"])
+@require_role('admin', 'reception')
+def search_members():
+    """Typeahead member search by name, email, phone or national ID - Admin and reception.
+
+    Query params: q (prefix, at least 2 characters), limit.
+    """
+    results = member_service.search_members(
+        q=request.args.get("q", ""),
+        limit=request.args.get("limit", DEFAULT_SEARCH_LIMIT, type=int),
+    )
+    return {"results": results}, HTTPStatus.OK
+
 @members_bp.route("/members", methods=["POST"])
 @require_role('admin')
 def post_member():
@@ -54,6 +86,39 @@ def post_member():
     member_dict['created_by'] = admin_display_name
     return member_dict, HTTPStatus.CREATED
 
+@members_bp.route("/members/import", methods=["POST"])
+@require_role('admin')
+def import_members():
+    """Bulk-import members from CSV or NDJSON - Admin only.
+
+    Send the file as multipart field 'file' or as the raw request body.
+    The format comes from ?format=csv|ndjson, else the upload's extension or
+    Content-Type. Returns a per-row error report.
+    """
+    admin = g.current_user
+    # Store admin display name before service call to avoid DetachedInstanceError
+    admin_display_name = admin.get_display_name()
+
+    if isinstance(admin, Admin) and not admin.can_manage_members():
+        raise ForbiddenError(
+            f"Admin '{admin_display_name}' does not have permission to manage members. "
+            f"Access level: {admin.access_level}"
+        )
+
+    upload = request.files.get("file")
+    fmt = request.args.get("format")
+    if fmt is None:
+        name = upload.filename if upload else ""
+        content_type = upload.mimetype if upload else request.mimetype
+        is_ndjson = name.endswith((".ndjson", ".jsonl")) or content_type in ("application/x-ndjson", "application/jsonl")
+        fmt = "ndjson" if is_ndjson else "csv"
+
+    stream = io.TextIOWrapper(upload.stream if upload else request.stream, encoding="utf-8-sig", newline="")
+    report = import_service.import_members(iter_rows(stream, fmt))
+
+    report['imported_by'] = admin_display_name
+    return report, HTTPStatus.OK
+
 @members_bp.route("/members/<int:member_id>", methods=["GET"])
 @require_role('admin')
 def get_member_by_id(member_id: int):
@@ -63,6 +128,24 @@ def get_member_by_id(member_id: int):
     member_dict = member_service.get_member(member_id)
     return member_dict, HTTPStatus.OK
 
+@members_bp.route("/members/<int:member_id>/profile", methods=["GET"])
+@query_budget(10)
+@login_required
+def get_member_profile(member_id: int):
+    """Member profile: details, subscriptions, workout plans, recent check-ins and payments.
+
+    Admin, trainer, or the member themself. Payments are included for admin
+    and self only.
+    """
+    current_user = g.current_user
+
+    if current_user.role not in ['admin', 'trainer'] and current_user.id != member_id:
+        raise ForbiddenError("You can only view your own profile")
+
+    include_payments = current_user.role == 'admin' or current_user.id == member_id
+    profile = member_service.get_member_profile(member_id, include_payments=include_payments)
+    return profile, HTTPStatus.OK
+
 @members_bp.route("/members/<int:member_id>", methods=["PUT"])
 @require_role('admin')
 def put_member(member_id: int):
@@ -96,7 +179,7 @@ def put_member(member_id: int):
 @members_bp.route("/members/<int:member_id>", methods=["DELETE"])
 @require_role('admin')
 def delete_member(member_id: int):
-    """Delete member - Admin only.
+    """Soft-delete member - Admin only.
     
     Uses Admin.can_manage_members() to validate admin permissions.
     """
@@ -111,5 +194,6 @@ def delete_member(member_id: int):
             f"Access level: {admin.access_level}"
         )
     
+    # Soft delete - related rows are purged later by the background purger
     member_service.delete_member(member_id)
-    return {"deleted": True, "id": member_id, "deleted_by": admin_display_name}, HTTPStatus.OK
+    return {"deleted": True, "purge_pending": True, "id": member_id, "deleted_by": admin_display_name}, HTTPStatus.OK
@@ -0,0 +1,11 @@
+from flask import Blueprint
+from http import HTTPStatus
+from services.metrics import registry
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus scrape endpoint (text exposition format)."""
+    return registry.render(), HTTPStatus.OK, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
@@ -31,6 +31,8 @@ def get_single_plan(plan_id: int):
 @require_role('admin')
 def post_plan():
     """Create subscription plan - ADMIN ONLY."""
+    # Store display name before service call to avoid DetachedInstanceError
+    admin_display_name = g.current_user.get_display_name()
     payload = PlanCreate.model_validate(request.get_json(force=True))
     plan = plan_service.create_plan(
         name=payload.name,
@@ -40,7 +42,7 @@ def post_plan():
         max_entries=payload.max_entries,
     )
     result = plan.to_dict()
-    result['created_by'] = g.current_user.get_display_name()
+    result['created_by'] = admin_display_name
     return result, HTTPStatus.CREATED
 
 @plans_bp.route("/plans/<int:plan_id>", methods=["PUT"])
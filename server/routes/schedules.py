@@ -0,0 +1,85 @@
+from flask import Blueprint, request, g
+from http import HTTPStatus
+from schemas.schedule_schema import ScheduleCreate, ScheduleUpdate, ScheduleGenerate
+from services.schedule_service import ScheduleService
+from utils.auth import require_role
+
+
+schedules_bp = Blueprint("schedules", __name__)
+schedule_service = ScheduleService()
+
+
+@schedules_bp.route("/schedules", methods=["GET"])
+@require_role('trainer', 'admin')
+def get_schedules():
+    """List recurring class schedules - Trainer and Admin only."""
+    schedules = schedule_service.list_schedules()
+    return [s.to_dict() for s in schedules], HTTPStatus.OK
+
+
+@schedules_bp.route("/schedules", methods=["POST"])
+@require_role('trainer', 'admin')
+def post_schedule():
+    """Create a recurring schedule and generate its occurrences for the horizon."""
+    payload = ScheduleCreate.model_validate(request.get_json(force=True))
+
+    # Pass trainer_id if current user is a trainer (for OOP permission check)
+    trainer_id = g.current_user.id if g.current_user.role == 'trainer' else None
+    # Store display name before service call (to avoid DetachedInstanceError)
+    display_name = g.current_user.get_display_name()
+
+    schedule, created = schedule_service.create_schedule(
+        title=payload.title,
+        instructor=payload.instructor,
+        days_of_week=payload.days_of_week,
+        start_time=payload.start_time,
+        duration_minutes=payload.duration_minutes,
+        capacity=payload.capacity,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        exception_dates=payload.exception_dates,
+        horizon_days=payload.horizon_days,
+        trainer_id=trainer_id,
+    )
+    result = schedule.to_dict()
+    result['generated'] = created
+    result['created_by'] = display_name
+    return result, HTTPStatus.CREATED
+
+
+@schedules_bp.route("/schedules/<int:schedule_id>", methods=["GET"])
+@require_role('trainer', 'admin')
+def get_one_schedule(schedule_id: int):
+    """Get a recurring schedule - Trainer and Admin only."""
+    schedule = schedule_service.get_schedule(schedule_id)
+    return schedule.to_dict(), HTTPStatus.OK
+
+
+@schedules_bp.route("/schedules/<int:schedule_id>", methods=["PUT"])
+@require_role('trainer', 'admin')
+def put_schedule(schedule_id: int):
+    """Edit a series - changes apply to future occurrences only."""
+    payload = ScheduleUpdate.model_validate(request.get_json(force=True))
+
+    # Pass trainer_id if current user is a trainer (for OOP permission check)
+    trainer_id = g.current_user.id if g.current_user.role == 'trainer' else None
+    # Store display name before service call (to avoid DetachedInstanceError)
+    display_name = g.current_user.get_display_name()
+    schedule, summary = schedule_service.update_schedule(
+        schedule_id=schedule_id,
+        changes=payload.model_dump(exclude_unset=True),
+        trainer_id=trainer_id,
+    )
+    result = schedule.to_dict()
+    result['occurrences'] = summary
+    result['updated_by'] = display_name
+    return result, HTTPStatus.OK
+
+
+@schedules_bp.route("/schedules/<int:schedule_id>/generate", methods=["POST"])
+@require_role('trainer', 'admin')
+def post_generate(schedule_id: int):
+    """Roll a schedule forward by materializing occurrences up to the horizon."""
+    payload = ScheduleGenerate.model_validate(request.get_json(silent=True) or {})
+    created = schedule_service.generate_occurrences(schedule_id, horizon_days=payload.horizon_days)
+    return {"schedule_id": schedule_id, "generated": created}, HTTPStatus.OK
@@ -1,12 +1,13 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
+from config.constants import MAX_CLASS_DURATION_MINUTES
 
 
 class ClassCreate(BaseModel):
     title: str = Field(min_length=2, max_length=120)
     instructor: str = Field(min_length=2, max_length=120)
     start_time: datetime
-    duration_minutes: int = Field(default=60, ge=15, le=300)
+    duration_minutes: int = Field(default=60, ge=15, le=MAX_CLASS_DURATION_MINUTES)
     capacity: int = Field(default=20, ge=1, le=300)
 
 
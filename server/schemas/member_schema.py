@@ -13,7 +13,8 @@ from config.constants import (
     PASSWORD_DIGIT_PATTERN,
     PASSWORD_SPECIAL_PATTERN,
     MemberStatus,
-    MAX_STATUS_LENGTH
+    MAX_STATUS_LENGTH,
+    MAX_EMAIL_LENGTH,
 )
 
 
@@ -50,3 +51,8 @@ class MemberUpdate(BaseModel):
         if v is not None and v not in MemberStatus.values():
             raise ValueError(f"Status must be one of: {', '.join(MemberStatus.values())}")
         return v
+
+
+class LoginRequest(BaseModel):
+    email: str = Field(min_length=3, max_length=MAX_EMAIL_LENGTH)
+    password: str = Field(min_length=1)
@@ -0,0 +1,54 @@
+from datetime import date, time
+from typing import Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from config.constants import (
+    DayOfWeek,
+    DEFAULT_SCHEDULE_HORIZON_DAYS,
+    MAX_SCHEDULE_HORIZON_DAYS,
+    MAX_CLASS_DURATION_MINUTES
+)
+
+
+class ScheduleCreate(BaseModel):
+    title: str = Field(min_length=2, max_length=120)
+    instructor: str = Field(min_length=2, max_length=120)
+    days_of_week: list[DayOfWeek] = Field(min_length=1, max_length=7)
+    start_time: time
+    duration_minutes: int = Field(default=60, ge=15, le=MAX_CLASS_DURATION_MINUTES)
+    capacity: int = Field(default=20, ge=1, le=300)
+    start_date: date
+    end_date: Optional[date] = None
+    exception_dates: list[date] = Field(default_factory=list)
+    horizon_days: int = Field(default=DEFAULT_SCHEDULE_HORIZON_DAYS, ge=1, le=MAX_SCHEDULE_HORIZON_DAYS)
+
+    @model_validator(mode="after")
+    def validate_dates(self):
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
+
+
+class ScheduleUpdate(BaseModel):
+    title: Optional[str] = Field(default=None, min_length=2, max_length=120)
+    instructor: Optional[str] = Field(default=None, min_length=2, max_length=120)
+    days_of_week: Optional[list[DayOfWeek]] = Field(default=None, min_length=1, max_length=7)
+    start_time: Optional[time] = None
+    duration_minutes: Optional[int] = Field(default=None, ge=15, le=MAX_CLASS_DURATION_MINUTES)
+    capacity: Optional[int] = Field(default=None, ge=1, le=300)
+    end_date: Optional[date] = None  # null makes the schedule open-ended
+    exception_dates: Optional[list[date]] = None
+
+    @field_validator(
+        "title", "instructor", "days_of_week", "start_time", "duration_minutes", "capacity", "exception_dates",
+        mode="before",
+    )
+    @classmethod
+    def reject_null(cls, value):
+        # Omit a field to leave it unchanged; these columns cannot be cleared
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class ScheduleGenerate(BaseModel):
+    horizon_days: int = Field(default=DEFAULT_SCHEDULE_HORIZON_DAYS, ge=1, le=MAX_SCHEDULE_HORIZON_DAYS)
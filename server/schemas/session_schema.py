@@ -1,5 +1,41 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+from config.constants import RegistrationMode, MAX_BULK_REGISTRATION
 
 
 class SessionCreate(BaseModel):
     member_id: int = Field(gt=0)
+
+
+class BulkSessionCreate(BaseModel):
+    member_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_REGISTRATION)
+    mode: RegistrationMode = RegistrationMode.ALL_OR_NOTHING
+    waitlist_overflow: bool = False
+
+    @field_validator("member_ids")
+    @classmethod
+    def validate_member_ids(cls, v: list[int]):
+        if any(member_id <= 0 for member_id in v):
+            raise ValueError("member_ids must be positive integers")
+        # Drop repeats but keep request order (it decides who gets the last seats)
+        return list(dict.fromkeys(v))
+
+
+class AttendanceMark(BaseModel):
+    attended: list[int] = Field(default_factory=list, max_length=MAX_BULK_REGISTRATION)
+    no_show: list[int] = Field(default_factory=list, max_length=MAX_BULK_REGISTRATION)
+
+    @field_validator("attended", "no_show")
+    @classmethod
+    def validate_member_ids(cls, v: list[int]):
+        if any(member_id <= 0 for member_id in v):
+            raise ValueError("member IDs must be positive integers")
+        return list(dict.fromkeys(v))
+
+    @model_validator(mode="after")
+    def validate_lists(self):
+        if not self.attended and not self.no_show:
+            raise ValueError("attended or no_show must contain at least one member ID")
+        overlap = set(self.attended) & set(self.no_show)
+        if overlap:
+            raise ValueError(f"members cannot be both attended and no-show: {sorted(overlap)}")
+        return self
@@ -1,8 +1,11 @@
+import argparse
+import time
 from datetime import datetime, timedelta, date
-import pymysql
 
-from config.db_config import get_database_uri
+from config.constants import DATAGEN_SEED, DATAGEN_CHUNK_SIZE, DATAGEN_PASSWORD
+from config.db_config import get_database_uri, is_sqlite_uri
 from services.db import init_db, create_all_tables, get_session
+from services.datagen import DatasetGenerator
 
 from models.user import User
 from models.member import Member
@@ -20,9 +23,10 @@ from models.checkin import Checkin
 
 
 def create_database_if_not_exists():
-    """Create the database if it doesn't exist."""
+    """Create the MySQL database if it doesn't exist."""
     import configparser
     import os
+    import pymysql
     
     config = configparser.ConfigParser()
     config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.ini')
@@ -53,16 +57,49 @@ def create_database_if_not_exists():
         raise
 
 
-def run_seed():
-    # Create database first
-    create_database_if_not_exists()
-    
+def prepare_database():
+    """Create the database (MySQL only) and all tables."""
     # Initialize database (read credentials from config.ini)
     database_uri = get_database_uri()
+
+    # Create database first (SQLite creates its file on connect)
+    if not is_sqlite_uri(database_uri):
+        create_database_if_not_exists()
+
     init_db(database_uri)
     create_all_tables()
     print("✓ Database tables created")
 
+
+def run_generate(members: int, months: int, seed: int = DATAGEN_SEED, chunk_size: int = DATAGEN_CHUNK_SIZE):
+    """Load a synthetic dataset of `members` members and `months` of history."""
+    prepare_database()
+
+    started = time.perf_counter()
+    reported = {}
+
+    def progress(table, rows):
+        # One line per table per 100k rows keeps the output readable at scale
+        if rows - reported.get(table, 0) >= 100_000:
+            reported[table] = rows
+            print(f"  {table}: {rows:,}")
+
+    generator = DatasetGenerator(members=members, months=months, seed=seed, chunk_size=chunk_size)
+    counts = generator.generate(progress=progress)
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "="*70)
+    print(f"✅ GENERATED {members:,} MEMBERS / {months} MONTHS IN {elapsed:.1f}s (seed={seed})")
+    print("="*70)
+    for table, rows in counts.items():
+        print(f"  {table:16s} {rows:>12,}")
+    print(f"\n  All generated users share the password: {DATAGEN_PASSWORD}")
+    print("="*70 + "\n")
+
+
+def run_seed():
+    prepare_database()
+
     session = get_session()
     try:
         # -------------------------
@@ -396,4 +433,16 @@ def run_seed():
 
 
 if __name__ == "__main__":
-    run_seed()
+    parser = argparse.ArgumentParser(
+        description="Seed demo data, or generate a large synthetic dataset with --members"
+    )
+    parser.add_argument("--members", type=int, help="Generate this many members (default: small demo seed)")
+    parser.add_argument("--months", type=int, default=12, help="Months of generated history (default: 12)")
+    parser.add_argument("--seed", type=int, default=DATAGEN_SEED, help="Random seed for reproducible data")
+    parser.add_argument("--chunk-size", type=int, default=DATAGEN_CHUNK_SIZE, help="Rows per INSERT batch")
+    args = parser.parse_args()
+
+    if args.members:
+        run_generate(args.members, args.months, seed=args.seed, chunk_size=args.chunk_size)
+    else:
+        run_seed()
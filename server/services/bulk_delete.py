@@ -0,0 +1,94 @@
+"""Set-based deletion of classes and members together with their dependent rows.
+
+Deleting through the ORM cascade (``session.delete(member)``) loads every
+related subscription, payment, check-in, ... into memory and deletes them one
+row at a time. These helpers instead issue one DELETE per table in foreign-key
+dependency order, so memory use is constant no matter how much history exists.
+
+With ``chunk_size`` set, each table is emptied in batches of at most that many
+rows and committed after every batch, which keeps transactions and lock times
+short for very large histories (used by background deletion).
+"""
+from sqlalchemy import select, delete
+
+from models.checkin import Checkin
+from models.gym_class import GymClass
+from models.member import Member
+from models.payment import Payment
+from models.session import Session
+from models.subscription import Subscription
+from models.user import User
+from models.waiting_list import WaitingList
+from models.workout_item import WorkoutItem
+from models.workout_plan import WorkoutPlan
+
+
+def _delete_where(session, table, condition, chunk_size: int | None = None, progress=None) -> int:
+    """Delete rows of `table` matching `condition`, optionally in committed chunks."""
+    if chunk_size is None:
+        return session.execute(delete(table).where(condition)).rowcount
+
+    total = 0
+    while True:
+        ids = session.execute(select(table.c.id).where(condition).limit(chunk_size)).scalars().all()
+        if not ids:
+            return total
+        total += session.execute(delete(table).where(table.c.id.in_(ids))).rowcount
+        session.commit()
+        if progress is not None:
+            progress(table.name, total)
+
+
+def member_delete_plan(member_id: int) -> list[tuple]:
+    """Return (table, condition) pairs that remove a member, children first."""
+    subscription_ids = select(Subscription.id).where(Subscription.member_id == member_id)
+    workout_plan_ids = select(WorkoutPlan.id).where(WorkoutPlan.member_id == member_id)
+    payments = Payment.__table__
+    workout_items = WorkoutItem.__table__
+    return [
+        (payments, payments.c.subscription_id.in_(subscription_ids)),
+        (Subscription.__table__, Subscription.__table__.c.member_id == member_id),
+        (workout_items, workout_items.c.plan_id.in_(workout_plan_ids)),
+        (WorkoutPlan.__table__, WorkoutPlan.__table__.c.member_id == member_id),
+        (Session.__table__, Session.__table__.c.member_id == member_id),
+        (WaitingList.__table__, WaitingList.__table__.c.member_id == member_id),
+        (Checkin.__table__, Checkin.__table__.c.member_id == member_id),
+        (Member.__table__, Member.__table__.c.id == member_id),
+        (User.__table__, User.__table__.c.id == member_id),
+    ]
+
+
+def delete_member_rows(session, member_id: int, chunk_size: int | None = None, progress=None) -> dict:
+    """Delete a member and everything that references it.
+
+    Args:
+        session: Database session (the caller commits when chunk_size is None)
+        member_id: The ID of the member
+        chunk_size: Delete and commit in batches of this many rows
+        progress: Optional callback(table_name, rows_deleted_so_far) after each chunk
+
+    Returns:
+        Dictionary of table name -> number of rows deleted
+    """
+    return {
+        table.name: _delete_where(session, table, condition, chunk_size, progress)
+        for table, condition in member_delete_plan(member_id)
+    }
+
+
+def delete_class_rows(session, class_id: int) -> dict:
+    """Delete a gym class together with its registrations and waiting list.
+
+    Args:
+        session: Database session (the caller commits)
+        class_id: The ID of the gym class
+
+    Returns:
+        Dictionary of table name -> number of rows deleted
+    """
+    plan = [
+        (WaitingList.__table__, WaitingList.__table__.c.gym_class_id == class_id),
+        (Session.__table__, Session.__table__.c.gym_class_id == class_id),
+        (GymClass.__table__, GymClass.__table__.c.id == class_id),
+    ]
+    return {table.name: _delete_where(session, table, condition) for table, condition in plan}
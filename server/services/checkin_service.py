@@ -1,6 +1,6 @@
 from datetime import datetime, date
 
-from services.db import get_session
+from services.db import get_session, read_only
 from services.exceptions import NotFoundError
 
 from models.member import Member
@@ -144,6 +144,7 @@ class CheckinService:
         finally:
             session.close()
 
+    @read_only
     def list_checkins(self, member_id: int | None = None):
         """List all checkins, optionally filtered by member.
         
@@ -155,7 +156,8 @@ class CheckinService:
         """
         session = get_session()
         try:
-            q = session.query(Checkin).order_by(Checkin.id.desc())
+            # The join hides check-ins of soft-deleted members (see models.user)
+            q = session.query(Checkin).join(Member, Member.id == Checkin.member_id).order_by(Checkin.id.desc())
             if member_id is not None:
                 q = q.filter(Checkin.member_id == member_id)
             return q.all()
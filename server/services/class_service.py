@@ -1,7 +1,16 @@
+import base64
+from datetime import datetime
+
+from sqlalchemy import and_, or_, func, exists
+
 from models.gym_class import GymClass
+from models.session import Session
 from models.trainer import Trainer
-from services.db import get_session
-from services.exceptions import NotFoundError, ForbiddenError
+from services.db import get_session, read_only
+from services.bulk_delete import delete_class_rows
+from services.conflict_index import instructor_index
+from services.exceptions import NotFoundError, ForbiddenError, BadRequestError, ConflictError
+from config.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 
 class ClassService:
@@ -29,6 +38,7 @@ class ClassService:
             
         Raises:
             ForbiddenError: If trainer doesn't have permission to manage classes
+            ConflictError: If the instructor is already booked at that time
         """
         session = get_session()
         try:
@@ -40,7 +50,9 @@ class ClassService:
                         f"Trainer '{trainer.get_display_name()}' is not authorized to manage classes. "
                         "Status must be 'active'."
                     )
-            
+
+            self._check_conflicts(session, instructor, start_time, duration_minutes)
+
             gym_class = GymClass(
                 title=title,
                 instructor=instructor,
@@ -51,6 +63,7 @@ class ClassService:
             session.add(gym_class)
             session.commit()
             session.refresh(gym_class)
+            instructor_index.add(gym_class.id, gym_class.instructor, gym_class.start_time, gym_class.duration_minutes)
             return gym_class
         except Exception:
             session.rollback()
@@ -58,15 +71,183 @@ class ClassService:
         finally:
             session.close()
 
-    def list_classes(self):
-        """List all gym classes ordered by start time.
-        
+    def _check_conflicts(self, session, instructor: str, start_time, duration_minutes: int, exclude_ids=()):
+        """Raise ConflictError if the instructor already teaches in that slot."""
+        conflicts = instructor_index.find_conflicts(
+            session, instructor, start_time, duration_minutes, exclude_ids=exclude_ids
+        )
+        if conflicts:
+            raise ConflictError(f"Instructor '{instructor}' is already booked at that time", conflicts=conflicts)
+
+    def update_class(self, class_id: int, title: str, instructor: str, start_time, duration_minutes: int, capacity: int) -> GymClass:
+        """Update an existing gym class.
+
+        Args:
+            class_id: The ID of the gym class
+            title: Title of the class
+            instructor: Instructor name
+            start_time: Start time of the class
+            duration_minutes: Duration in minutes
+            capacity: Maximum capacity
+
         Returns:
-            List of GymClass objects
+            Updated GymClass object
+
+        Raises:
+            NotFoundError: If class not found
+            ConflictError: If the instructor is already booked at the new time
         """
         session = get_session()
         try:
-            return session.query(GymClass).order_by(GymClass.start_time.asc()).all()
+            gym_class = session.query(GymClass).filter(GymClass.id == class_id).first()
+            if not gym_class:
+                raise NotFoundError("Class not found")
+
+            self._check_conflicts(session, instructor, start_time, duration_minutes, exclude_ids={class_id})
+
+            gym_class.title = title
+            gym_class.instructor = instructor
+            gym_class.start_time = start_time
+            gym_class.duration_minutes = duration_minutes
+            gym_class.capacity = capacity
+            session.commit()
+            session.refresh(gym_class)
+            instructor_index.update(gym_class.id, gym_class.instructor, gym_class.start_time, gym_class.duration_minutes)
+            return gym_class
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def delete_class(self, class_id: int) -> None:
+        """Delete a gym class with its registrations and waiting list.
+
+        Uses set-based DELETEs (see services.bulk_delete) instead of loading
+        every session through the ORM cascade.
+
+        Args:
+            class_id: The ID of the gym class
+
+        Raises:
+            NotFoundError: If class not found
+        """
+        session = get_session()
+        try:
+            deleted = delete_class_rows(session, class_id)
+            if not deleted[GymClass.__tablename__]:
+                raise NotFoundError("Class not found")
+
+            session.commit()
+            instructor_index.remove(class_id)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def encode_cursor(gym_class: GymClass) -> str:
+        """Build an opaque keyset cursor pointing just after the given class."""
+        raw = f"{gym_class.start_time.isoformat()}|{gym_class.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        """Decode a cursor produced by encode_cursor into (start_time, id).
+
+        Raises:
+            BadRequestError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            start_raw, id_raw = raw.rsplit("|", 1)
+            return datetime.fromisoformat(start_raw), int(id_raw)
+        except (ValueError, UnicodeError):
+            raise BadRequestError("Invalid cursor")
+
+    @read_only
+    def list_classes(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        instructor: str | None = None,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        member_id: int | None = None,
+    ):
+        """List one page of gym classes ordered by start time.
+
+        Uses keyset pagination on (start_time, id) so every page is an index
+        range scan on start_time, regardless of how much history exists.
+
+        Args:
+            start: Only classes starting at or after this time (defaults to now)
+            end: Only classes starting before this time
+            instructor: Only classes taught by this instructor
+            cursor: Cursor returned with the previous page
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            member_id: Only classes this member is actively registered in
+
+        Returns:
+            Tuple of (list of GymClass objects, next cursor or None)
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        if start is None:
+            start = datetime.utcnow()
+
+        session = get_session()
+        try:
+            q = session.query(GymClass).filter(GymClass.start_time >= start)
+            if end is not None:
+                q = q.filter(GymClass.start_time < end)
+            if instructor:
+                q = q.filter(GymClass.instructor == instructor)
+            if member_id is not None:
+                q = q.filter(exists().where(
+                    Session.gym_class_id == GymClass.id,
+                    Session.member_id == member_id,
+                    Session.status == "active",
+                ))
+            if cursor:
+                after_start, after_id = self.decode_cursor(cursor)
+                q = q.filter(or_(
+                    GymClass.start_time > after_start,
+                    and_(GymClass.start_time == after_start, GymClass.id > after_id),
+                ))
+
+            # Fetch one extra row to know whether another page exists
+            classes = q.order_by(GymClass.start_time.asc(), GymClass.id.asc()).limit(limit + 1).all()
+            next_cursor = None
+            if len(classes) > limit:
+                classes = classes[:limit]
+                next_cursor = self.encode_cursor(classes[-1])
+            return classes, next_cursor
+        finally:
+            session.close()
+
+    @read_only
+    def get_registration_counts(self, class_ids: list[int]) -> dict[int, dict]:
+        """Count registrations per status for a batch of classes in one query.
+
+        Args:
+            class_ids: IDs of the gym classes
+
+        Returns:
+            Dictionary mapping class ID to {"active": n, "canceled": n}
+        """
+        counts = {class_id: {"active": 0, "canceled": 0} for class_id in class_ids}
+        if not class_ids:
+            return counts
+
+        session = get_session()
+        try:
+            rows = session.query(Session.gym_class_id, Session.status, func.count(Session.id)).filter(
+                Session.gym_class_id.in_(class_ids)
+            ).group_by(Session.gym_class_id, Session.status).all()
+            for class_id, status, count in rows:
+                counts[class_id][status] = count
+            return counts
         finally:
             session.close()
 
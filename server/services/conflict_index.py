@@ -0,0 +1,156 @@
+"""In-process interval index of upcoming classes per instructor.
+
+Keeps, for each instructor, a list of (start, end, class_id) tuples sorted by
+start time. Because no class is longer than MAX_CLASS_DURATION_MINUTES, an
+overlap check only needs to bisect to `start - MAX_CLASS_DURATION_MINUTES` and
+scan forward until intervals begin after the candidate ends: O(log n + k)
+instead of a query per candidate.
+
+The index is loaded lazily from upcoming gym_classes and kept in sync by
+ClassService/ScheduleService on create, update and delete. Each worker
+process has its own copy, so it is also reloaded every
+CONFLICT_INDEX_REFRESH_SECONDS to pick up writes made by other workers.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from models.gym_class import GymClass
+from config.constants import MAX_CLASS_DURATION_MINUTES, CONFLICT_INDEX_REFRESH_SECONDS
+
+_MAX_DURATION = timedelta(minutes=MAX_CLASS_DURATION_MINUTES)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Compare aware and naive datetimes consistently (stored times are naive)."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class InstructorIntervalIndex:
+    """Sorted interval lists of upcoming classes, keyed by instructor."""
+
+    def __init__(self, refresh_seconds: int = CONFLICT_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.RLock()
+        self._by_instructor: dict[str, list[tuple]] = {}
+        self._by_class: dict[int, tuple[str, tuple]] = {}
+        self._loaded_at = None
+        self.hits = 0  # find_conflicts answered from memory
+        self.misses = 0  # find_conflicts that had to (re)load from the database
+
+    def _horizon_start(self) -> datetime:
+        # Classes that started up to MAX_DURATION ago may still be running
+        return datetime.utcnow() - _MAX_DURATION
+
+    def _load_rows(self, session, instructor: str | None = None):
+        stmt = select(GymClass.id, GymClass.instructor, GymClass.start_time, GymClass.duration_minutes).where(
+            GymClass.start_time >= self._horizon_start()
+        )
+        if instructor is not None:
+            stmt = stmt.where(GymClass.instructor == instructor)
+        return session.execute(stmt).all()
+
+    def _ensure_loaded(self, session):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            self.hits += 1
+            return
+        self.misses += 1
+        rows = self._load_rows(session)
+        with self._lock:
+            self._by_instructor = {}
+            self._by_class = {}
+            for class_id, instructor, start, duration in rows:
+                self._insert(class_id, instructor, start, duration)
+            self._loaded_at = time.monotonic()
+
+    def _insert(self, class_id: int, instructor: str, start: datetime, duration_minutes: int):
+        start = _naive_utc(start)
+        interval = (start, start + timedelta(minutes=duration_minutes), class_id)
+        insort(self._by_instructor.setdefault(instructor, []), interval)
+        self._by_class[class_id] = (instructor, interval)
+
+    def _discard(self, class_id: int):
+        entry = self._by_class.pop(class_id, None)
+        if entry is None:
+            return
+        instructor, interval = entry
+        intervals = self._by_instructor.get(instructor, [])
+        i = bisect_left(intervals, interval)
+        if i < len(intervals) and intervals[i] == interval:
+            del intervals[i]
+
+    def find_conflicts(self, session, instructor: str, start: datetime, duration_minutes: int, exclude_ids=()) -> list[dict]:
+        """Return the upcoming classes of an instructor that overlap [start, start + duration).
+
+        Args:
+            session: Database session used to (re)load the index when stale
+            instructor: Instructor name
+            start: Candidate start time
+            duration_minutes: Candidate duration
+            exclude_ids: Class IDs to ignore (e.g. the class being updated)
+
+        Returns:
+            List of {"class_id", "instructor", "start_time", "end_time"} dicts
+        """
+        self._ensure_loaded(session)
+        start = _naive_utc(start)
+        end = start + timedelta(minutes=duration_minutes)
+
+        conflicts = []
+        with self._lock:
+            intervals = self._by_instructor.get(instructor, [])
+            i = bisect_left(intervals, (start - _MAX_DURATION,))
+            while i < len(intervals) and intervals[i][0] < end:
+                other_start, other_end, class_id = intervals[i]
+                if other_end > start and class_id not in exclude_ids:
+                    conflicts.append({
+                        "class_id": class_id,
+                        "instructor": instructor,
+                        "start_time": other_start.isoformat(),
+                        "end_time": other_end.isoformat(),
+                    })
+                i += 1
+        return conflicts
+
+    def add(self, class_id: int, instructor: str, start: datetime, duration_minutes: int):
+        """Track a newly created class."""
+        if self._loaded_at is None:
+            return
+        with self._lock:
+            self._discard(class_id)
+            self._insert(class_id, instructor, start, duration_minutes)
+
+    def update(self, class_id: int, instructor: str, start: datetime, duration_minutes: int):
+        """Move a class to its new instructor/time."""
+        self.add(class_id, instructor, start, duration_minutes)
+
+    def remove(self, class_id: int):
+        """Stop tracking a deleted class."""
+        with self._lock:
+            self._discard(class_id)
+
+    def refresh_instructor(self, session, instructor: str):
+        """Reload one instructor's intervals, e.g. after a bulk insert."""
+        if self._loaded_at is None:
+            return
+        rows = self._load_rows(session, instructor)
+        with self._lock:
+            for _, _, class_id in self._by_instructor.get(instructor, []):
+                self._by_class.pop(class_id, None)
+            self._by_instructor[instructor] = []
+            for class_id, name, start, duration in rows:
+                self._insert(class_id, name, start, duration)
+
+    def invalidate(self):
+        """Force a full reload on next use."""
+        with self._lock:
+            self._loaded_at = None
+
+
+# Shared per-process index
+instructor_index = InstructorIntervalIndex()
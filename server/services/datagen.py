@@ -0,0 +1,463 @@
+"""Deterministic synthetic datasets for load testing and benchmarks.
+
+``DatasetGenerator(members=100_000, months=24).generate()`` fills the database
+with a gym's worth of history ending at ``today``: staff, a plan catalog,
+members who join over the whole window, back-to-back subscriptions with
+renewals, gaps and churn, one payment per subscription, check-ins while a
+subscription covers the day (plus a few denied attempts after it lapses),
+scheduled classes with bookings, attendance and cancellations, waiting lists
+on full upcoming classes, and workout plans.
+
+Rows are built as plain dicts and written with Core ``executemany`` INSERTs
+in chunks of ``chunk_size``, bypassing the ORM unit of work (the normalized
+search columns are therefore filled here). Primary keys are assigned by the
+generator, continuing after the highest existing id, so the same seed and
+reference date always produce the same rows on an empty database.
+"""
+import bisect
+import random
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import func, select
+
+from config.constants import (
+    DATAGEN_SEED,
+    DATAGEN_CHUNK_SIZE,
+    DATAGEN_PASSWORD,
+    DATAGEN_MEMBERS_PER_TRAINER,
+    DATAGEN_CLASSES_PER_TRAINER_DAY,
+    DATAGEN_FUTURE_DAYS,
+    DATAGEN_VISITS_PER_MONTH,
+    MemberStatus,
+    SubscriptionStatus,
+    PaymentStatus,
+    SessionStatus,
+)
+from services.db import get_session
+from services.password_hasher import hash_password
+from utils.validators import normalize_name, normalize_phone
+from models.admin import Admin
+from models.checkin import Checkin
+from models.gym_class import GymClass
+from models.member import Member
+from models.payment import Payment
+from models.plan import Plan
+from models.reception import Reception
+from models.session import Session
+from models.subscription import Subscription
+from models.trainer import Trainer
+from models.user import User
+from models.waiting_list import WaitingList
+from models.workout_item import WorkoutItem
+from models.workout_plan import WorkoutPlan
+
+FIRST_NAMES = (
+    "Dana", "Noam", "Yael", "Omer", "Maya", "Itai", "Shira", "Eitan", "Noa", "Amit",
+    "Tamar", "Yonatan", "Lior", "Roni", "Adi", "Daniel", "Michal", "Ariel", "Gal", "Tal",
+    "Sarah", "David", "Rachel", "Michael", "Hila", "Guy", "Inbar", "Ido", "Keren", "Nadav",
+)
+LAST_NAMES = (
+    "Cohen", "Levi", "Mizrahi", "Peretz", "Biton", "Dahan", "Avraham", "Friedman", "Azoulay", "Katz",
+    "Yosef", "Malka", "Amar", "Ohana", "Hadad", "Gabay", "Ben-David", "Shapiro", "Klein", "Rosen",
+)
+
+# (name, type, price, valid_days, max_entries, weight when a member picks a plan)
+PLAN_CATALOG = (
+    ("Monthly", "time", 199, 30, None, 55),
+    ("Quarterly", "time", 549, 90, None, 20),
+    ("Annual", "time", 1990, 365, None, 10),
+    ("10 Entries", "entries", 350, 120, 10, 15),
+)
+
+# (title, duration_minutes, capacity)
+CLASS_TYPES = (
+    ("Morning Strength", 60, 20),
+    ("Spinning", 45, 25),
+    ("Yoga Flow", 60, 15),
+    ("HIIT", 30, 20),
+    ("Pilates", 50, 12),
+    ("Boxing", 60, 16),
+    ("Functional", 45, 20),
+    ("Zumba", 60, 30),
+)
+
+EXERCISES = (
+    ("Squat", 4, 8, 60.0), ("Deadlift", 4, 5, 80.0), ("Bench Press", 4, 8, 50.0),
+    ("Overhead Press", 3, 10, 30.0), ("Pull-up", 3, 8, 0.0), ("Row", 3, 12, 40.0),
+    ("Lunge", 3, 12, 20.0), ("Plank", 3, 1, 0.0), ("Running", 1, 1, 0.0), ("Rowing Machine", 1, 1, 0.0),
+)
+
+CLASS_HOURS = (6, 7, 8, 9, 10, 12, 17, 18, 19, 20, 21)
+# Check-in hour distribution (morning and after-work peaks), each hour repeated
+# by its weight so a uniform pick from the pool follows the daily profile
+CHECKIN_HOUR_WEIGHTS = {6: 6, 7: 9, 8: 7, 9: 4, 10: 3, 11: 3, 12: 4, 13: 3, 14: 2,
+                        15: 2, 16: 4, 17: 8, 18: 10, 19: 9, 20: 6, 21: 3, 22: 1}
+CHECKIN_HOUR_POOL = tuple(hour for hour, weight in CHECKIN_HOUR_WEIGHTS.items() for _ in range(weight))
+
+
+class _ChunkedWriter:
+    """Buffer rows per table and INSERT them in chunks, parents first.
+
+    Every flush writes all buffered tables in registration order, so a child
+    row is never inserted before the parent it references.
+    """
+
+    def __init__(self, session, chunk_size: int, progress=None):
+        self.session = session
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table, row: dict):
+        buffer = self.buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        for table, rows in self.buffers.items():
+            if not rows:
+                continue
+            self.session.execute(table.insert(), rows)
+            self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+            if self.progress is not None:
+                self.progress(table.name, self.counts[table.name])
+            rows.clear()
+        self.session.commit()
+
+
+class DatasetGenerator:
+    """Generate a reproducible, production-shaped dataset."""
+
+    def __init__(
+        self,
+        members: int,
+        months: int,
+        seed: int = DATAGEN_SEED,
+        chunk_size: int = DATAGEN_CHUNK_SIZE,
+        today: date | None = None,
+    ):
+        """
+        Args:
+            members: Number of members to create
+            months: Length of the generated history, ending today
+            seed: Random seed; identical seeds give identical datasets
+            chunk_size: Rows per INSERT batch
+            today: Reference date (default: the current date)
+        """
+        if members < 1 or months < 1:
+            raise ValueError("members and months must be positive")
+        self.members = members
+        self.months = months
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        self.today = today or date.today()
+        self.start_date = self.today - timedelta(days=months * 30)
+        self.now = datetime.combine(self.today, time(12, 0))
+
+    def generate(self, progress=None) -> dict:
+        """Insert the dataset and return the number of rows written per table.
+
+        Args:
+            progress: Optional callable(table_name, rows_so_far) called after each chunk
+
+        Returns:
+            Dict of table name to inserted row count
+        """
+        session = get_session()
+        try:
+            writer = _ChunkedWriter(session, self.chunk_size, progress)
+            self._next_ids = {
+                table: (session.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+                for table in (User.__table__, Subscription.__table__, Payment.__table__, Checkin.__table__,
+                              GymClass.__table__, Session.__table__, WaitingList.__table__,
+                              WorkoutPlan.__table__, WorkoutItem.__table__)
+            }
+            self._password_hash = hash_password(DATAGEN_PASSWORD)
+            plans = self._ensure_plans(session)
+
+            # Register parents before children so flushes respect foreign keys
+            for table in (User.__table__, Trainer.__table__, Admin.__table__, Reception.__table__,
+                          Member.__table__, Subscription.__table__, Payment.__table__, Checkin.__table__,
+                          WorkoutPlan.__table__, WorkoutItem.__table__, GymClass.__table__,
+                          Session.__table__, WaitingList.__table__):
+                writer.buffers[table] = []
+
+            instructors = self._generate_staff(writer)
+            member_ids, join_dates = self._generate_members(writer)
+            writer.flush()
+
+            for member_id, joined, status in zip(member_ids, join_dates, self._member_statuses):
+                self._generate_member_history(writer, plans, member_id, joined, status)
+            writer.flush()
+
+            self._generate_classes(writer, instructors, member_ids, join_dates)
+            writer.flush()
+            return dict(writer.counts)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Reference data
+    # ------------------------------------------------------------------
+
+    def _next_id(self, table) -> int:
+        value = self._next_ids[table]
+        self._next_ids[table] = value + 1
+        return value
+
+    @staticmethod
+    def _ensure_plans(session) -> list[dict]:
+        """Create missing catalog plans; returns the catalog with database ids."""
+        existing = dict(session.execute(select(Plan.name, Plan.id)).all())
+        plans = []
+        for name, plan_type, price, valid_days, max_entries, weight in PLAN_CATALOG:
+            if name not in existing:
+                plan = Plan(name=name, type=plan_type, price=price, valid_days=valid_days, max_entries=max_entries)
+                session.add(plan)
+                session.flush()
+                existing[name] = plan.id
+            plans.append({
+                "id": existing[name], "price": price, "valid_days": valid_days,
+                "max_entries": max_entries, "weight": weight,
+            })
+        session.commit()
+        return plans
+
+    def _user_row(self, user_id: int, role: str, created_at: datetime, status: str = MemberStatus.ACTIVE.value,
+                  name: tuple[str, str] | None = None) -> dict:
+        first_name, last_name = name or (self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES))
+        phone = f"05{self.rng.randint(0, 99_999_999):08d}"
+        return {
+            "id": user_id,
+            "role": role,
+            "first_name": first_name,
+            "last_name": last_name,
+            "first_name_norm": normalize_name(first_name),
+            "last_name_norm": normalize_name(last_name),
+            "email": f"{role}{user_id}@example.com",
+            "phone": phone,
+            "phone_digits": normalize_phone(phone),
+            "date_of_birth": date(self.rng.randint(1960, 2006), self.rng.randint(1, 12), self.rng.randint(1, 28)),
+            "status": status,
+            "created_at": created_at,
+        }
+
+    def _generate_staff(self, writer) -> list[str]:
+        """Insert trainers, admins and reception; returns the instructor names."""
+        users, trainers = User.__table__, Trainer.__table__
+        created_at = datetime.combine(self.start_date, time(9, 0))
+        instructors = []
+        for index in range(max(2, self.members // DATAGEN_MEMBERS_PER_TRAINER)):
+            # Instructor names must be unique or their classes would look double-booked
+            first_name, rest = FIRST_NAMES[index % len(FIRST_NAMES)], index // len(FIRST_NAMES)
+            last_name = LAST_NAMES[rest % len(LAST_NAMES)] + (f" {rest // len(LAST_NAMES) + 1}" if rest >= len(LAST_NAMES) else "")
+            user = self._user_row(self._next_id(users), "trainer", created_at, name=(first_name, last_name))
+            writer.add(users, user)
+            writer.add(trainers, {
+                "id": user["id"], "password_hash": self._password_hash,
+                "specialization": self.rng.choice(CLASS_TYPES)[0], "certification": "NASM-CPT",
+            })
+            instructors.append(f"{user['first_name']} {user['last_name']}")
+        for access_level in ("full", "limited"):
+            user = self._user_row(self._next_id(users), "admin", created_at)
+            writer.add(users, user)
+            writer.add(trainers, {"id": user["id"], "password_hash": self._password_hash,
+                                  "specialization": "Management", "certification": "Admin"})
+            writer.add(Admin.__table__, {"id": user["id"], "access_level": access_level})
+        for _ in range(max(1, self.members // (DATAGEN_MEMBERS_PER_TRAINER * 2))):
+            user = self._user_row(self._next_id(users), "reception", created_at)
+            writer.add(users, user)
+            writer.add(Reception.__table__, {"id": user["id"]})
+        return instructors
+
+    def _generate_members(self, writer) -> tuple[list[int], list[date]]:
+        """Insert members, ids ascending by join date; returns (ids, join dates)."""
+        users, members = User.__table__, Member.__table__
+        window_days = (self.today - self.start_date).days
+        # Growth: more members joined recently than at the start of the window
+        join_dates = sorted(
+            self.start_date + timedelta(days=int(window_days * self.rng.random() ** 0.7))
+            for _ in range(self.members)
+        )
+        member_ids, self._member_statuses = [], []
+        for joined in join_dates:
+            roll = self.rng.random()
+            status = (MemberStatus.ACTIVE if roll < 0.92 else
+                      MemberStatus.INACTIVE if roll < 0.98 else MemberStatus.SUSPENDED).value
+            user = self._user_row(self._next_id(users), "member", datetime.combine(joined, time(10, 0)), status)
+            writer.add(users, user)
+            writer.add(members, {
+                "id": user["id"], "national_id": f"{user['id']:09d}",
+                "password_hash": self._password_hash, "no_show_count": 0,
+            })
+            member_ids.append(user["id"])
+            self._member_statuses.append(status)
+        return member_ids, join_dates
+
+    # ------------------------------------------------------------------
+    # Per-member history
+    # ------------------------------------------------------------------
+
+    def _generate_member_history(self, writer, plans, member_id: int, joined: date, status: str):
+        rng = self.rng
+        visits_per_month = min(25.0, rng.expovariate(1 / DATAGEN_VISITS_PER_MONTH))
+        weights = [plan["weight"] for plan in plans]
+        start = joined
+        while start <= self.today:
+            plan = rng.choices(plans, weights)[0]
+            end = start + timedelta(days=plan["valid_days"])
+            canceled = rng.random() < 0.03
+            if canceled:
+                end = start + timedelta(days=rng.randint(1, plan["valid_days"]))
+            current = end >= self.today and not canceled
+            self._add_subscription(writer, plan, member_id, start, end, current, canceled)
+
+            covered_days = (min(end, self.today) - start).days
+            remaining = plan["max_entries"]
+            visits = int(covered_days * visits_per_month / 30 + rng.random())
+            if remaining is not None:
+                visits = min(visits, remaining)
+            for offset in rng.sample(range(covered_days), min(visits, covered_days)):
+                self._add_checkin(writer, member_id, start + timedelta(days=offset), "approved", None)
+
+            # Renewal: mostly back-to-back, sometimes after a break, sometimes never
+            roll = rng.random()
+            if current or roll < 0.08 or (status != MemberStatus.ACTIVE.value and roll < 0.5):
+                break
+            if roll < 0.20:
+                for _ in range(rng.randint(1, 2)):
+                    attempt = end + timedelta(days=rng.randint(1, 10))
+                    if attempt <= self.today:
+                        self._add_checkin(writer, member_id, attempt, "denied", "Subscription expired")
+                end += timedelta(days=rng.randint(7, 90))
+            start = end + timedelta(days=1)
+
+        if rng.random() < 0.25:
+            self._add_workout_plans(writer, member_id, joined)
+
+    def _add_subscription(self, writer, plan, member_id, start, end, current, canceled):
+        rng = self.rng
+        subscription_id = self._next_id(Subscription.__table__)
+        frozen = current and rng.random() < 0.03
+        if canceled:
+            status = SubscriptionStatus.CANCELED
+        elif frozen:
+            status = SubscriptionStatus.FROZEN
+        elif current:
+            status = SubscriptionStatus.ACTIVE
+        else:
+            status = SubscriptionStatus.EXPIRED
+        remaining = plan["max_entries"]
+        if remaining is not None:
+            remaining = rng.randint(0, remaining) if current else 0
+        writer.add(Subscription.__table__, {
+            "id": subscription_id, "member_id": member_id, "plan_id": plan["id"],
+            "status": status.value, "start_date": start, "end_date": end,
+            "remaining_entries": remaining,
+            "frozen_until": self.today + timedelta(days=rng.randint(1, 30)) if frozen else None,
+            "created_at": datetime.combine(start, time(9, 0)),
+        })
+
+        paid_at = datetime.combine(start, time(rng.randint(8, 20), rng.randint(0, 59)))
+        if canceled:
+            payment_status = PaymentStatus.CANCELED
+        elif current and rng.random() < 0.08:
+            payment_status = PaymentStatus.PENDING
+        else:
+            payment_status = PaymentStatus.PAID
+        payment_id = self._next_id(Payment.__table__)
+        writer.add(Payment.__table__, {
+            "id": payment_id, "subscription_id": subscription_id, "amount": float(plan["price"]),
+            "status": payment_status.value, "reference": f"GEN-{payment_id:08d}",
+            "paid_at": paid_at if payment_status == PaymentStatus.PAID else None,
+            "created_at": paid_at,
+        })
+
+    def _add_checkin(self, writer, member_id: int, day: date, result: str, reason: str | None):
+        # Hot path (most generated rows are check-ins): avoid choices()/randint() overhead
+        roll = self.rng.random()
+        hour = CHECKIN_HOUR_POOL[int(roll * len(CHECKIN_HOUR_POOL))]
+        minute = int(roll * 3600) % 60
+        writer.add(Checkin.__table__, {
+            "id": self._next_id(Checkin.__table__), "member_id": member_id, "result": result,
+            "reason": reason, "created_at": datetime(day.year, day.month, day.day, hour, minute),
+        })
+
+    def _add_workout_plans(self, writer, member_id: int, joined: date):
+        rng = self.rng
+        count = rng.randint(1, 3)
+        for index in range(count):
+            plan_id = self._next_id(WorkoutPlan.__table__)
+            created = datetime.combine(joined + timedelta(days=rng.randint(0, (self.today - joined).days)), time(11, 0))
+            writer.add(WorkoutPlan.__table__, {
+                "id": plan_id, "member_id": member_id, "title": f"Program {index + 1}",
+                "trainer_name": f"Coach {rng.choice(FIRST_NAMES)}", "is_active": index == count - 1,
+                "created_at": created,
+            })
+            for name, sets, reps, weight in rng.sample(EXERCISES, rng.randint(4, 8)):
+                writer.add(WorkoutItem.__table__, {
+                    "id": self._next_id(WorkoutItem.__table__), "plan_id": plan_id, "exercise_name": name,
+                    "sets": sets, "reps": reps, "target_weight": weight, "notes": None, "created_at": created,
+                })
+
+    # ------------------------------------------------------------------
+    # Classes, bookings and waiting lists
+    # ------------------------------------------------------------------
+
+    def _generate_classes(self, writer, instructors, member_ids, join_dates):
+        """Schedule classes day by day; each instructor teaches at most once per hour slot."""
+        rng = self.rng
+        per_day = len(instructors) * DATAGEN_CLASSES_PER_TRAINER_DAY
+        day = self.start_date
+        last_day = self.today + timedelta(days=DATAGEN_FUTURE_DAYS)
+        while day <= last_day:
+            eligible = bisect.bisect_right(join_dates, day)
+            for slot in rng.sample(range(len(instructors) * len(CLASS_HOURS)), per_day):
+                instructor, hour = divmod(slot, len(CLASS_HOURS))
+                title, duration, capacity = rng.choice(CLASS_TYPES)
+                start_time = datetime.combine(day, time(CLASS_HOURS[hour], 0))
+                class_id = self._next_id(GymClass.__table__)
+                writer.add(GymClass.__table__, {
+                    "id": class_id, "title": title, "instructor": instructors[instructor],
+                    "start_time": start_time, "duration_minutes": duration, "capacity": capacity,
+                    "schedule_id": None, "created_at": start_time - timedelta(days=DATAGEN_FUTURE_DAYS),
+                })
+                self._add_bookings(writer, class_id, start_time, capacity, member_ids, eligible)
+            day += timedelta(days=1)
+
+    def _add_bookings(self, writer, class_id, start_time, capacity, member_ids, eligible):
+        rng = self.rng
+        upcoming = start_time > self.now
+        full = rng.random() < 0.2
+        booked = capacity if full else int(capacity * rng.betavariate(3, 3))
+        booked = min(booked, eligible)
+        picks = rng.sample(range(eligible), min(eligible, booked + (5 if full and upcoming else 0)))
+
+        for index in picks[:booked]:
+            registered_at = start_time - timedelta(hours=rng.randint(2, 7 * 24))
+            row = {
+                "id": self._next_id(Session.__table__), "gym_class_id": class_id,
+                "member_id": member_ids[index], "status": SessionStatus.ACTIVE.value, "attended": False,
+                "registered_at": registered_at, "canceled_at": None, "attendance_marked_at": None,
+                "created_at": registered_at,
+            }
+            if rng.random() < 0.07:
+                row["status"] = SessionStatus.CANCELED.value
+                row["canceled_at"] = registered_at + (start_time - registered_at) / 2
+            elif not upcoming:
+                row["status"] = SessionStatus.COMPLETED.value
+                row["attended"] = rng.random() < 0.85
+                row["attendance_marked_at"] = start_time + timedelta(hours=1)
+            writer.add(Session.__table__, row)
+
+        # Full upcoming classes have a queue of members waiting for a spot
+        for position, index in enumerate(picks[booked:booked + rng.randint(1, 5)]):
+            writer.add(WaitingList.__table__, {
+                "id": self._next_id(WaitingList.__table__), "gym_class_id": class_id,
+                "member_id": member_ids[index], "joined_at": start_time - timedelta(hours=24 - position),
+            })
@@ -3,9 +3,16 @@
 Database credentials are read from config.ini at project root via config.db_config module.
 This module handles SQLAlchemy engine initialization and session management.
 """
+import random
 from contextlib import contextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base, scoped_session
+from contextvars import ContextVar
+from functools import wraps
+
+from sqlalchemy import create_engine, event, Select, UniqueConstraint
+from sqlalchemy.orm import sessionmaker, declarative_base, scoped_session, Session as OrmSession
+from sqlalchemy.pool import StaticPool
+from services.sql_stats import instrument_engine
+from services.slow_query_log import slow_query_log
 
 """
 this is to create tables as classes
@@ -15,29 +22,149 @@ Base = declarative_base()
 
 # Global engine and session factory (will be initialized in init_db)
 engine = None
+replica_engines = []
 SessionLocal = None
 
+# True while a @read_only service method runs
+_read_only = ContextVar("read_only", default=False)
+
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+
+# Applied to every SQLite connection; WAL lets readers run alongside the single writer
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",  # Wait (ms) for the write lock instead of failing immediately
+    "PRAGMA synchronous=NORMAL",  # Safe with WAL, far fewer fsyncs than FULL
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Checkouts that left the pool with no idle connection and no overflow room
+pool_saturated_checkouts = 0
+
+
+def read_only(fn):
+    """Mark a service method as read-only so its SELECTs may go to a replica.
+
+    Replicas lag slightly behind the primary; only use this for listings and
+    reports that tolerate that. Once the request has written anything it is
+    pinned to the primary (see RoutingSession), so read-your-writes holds.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
+
+class RoutingSession(OrmSession):
+    """Session that sends read-only SELECTs to a replica and everything else to the primary.
+
+    The first write (flush or INSERT/UPDATE/DELETE) pins the session to the
+    primary. The scoped session lives for one request (close_session removes
+    it at teardown), so the pin lasts exactly until the end of the request.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        # The session's own bind: the primary engine, or a test fixture's connection
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if not replica_engines or self.info.get("pinned_to_primary"):
+            return primary
+        is_write = self._flushing or (clause is not None and getattr(clause, "is_dml", False))
+        if is_write:
+            self.info["pinned_to_primary"] = True
+            return primary
+        if _read_only.get() and isinstance(clause, Select):
+            return random.choice(replica_engines)
+        return primary
+
+
+def _create_sqlite_engine(database_uri: str):
+    """Create a SQLite engine: WAL + pragmas for files, one shared connection for :memory:."""
+    in_memory = database_uri in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in database_uri
+    if in_memory:
+        # Every session must see the same in-memory database
+        new_engine = create_engine(
+            database_uri,
+            echo=False,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        new_engine = create_engine(
+            database_uri,
+            echo=False,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+
+    @event.listens_for(new_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(new_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return new_engine
 
-def init_db(database_uri: str):
+
+def _create_engine(database_uri: str):
+    """Create an instrumented engine with the standard pool settings."""
+    if database_uri.startswith("sqlite"):
+        new_engine = _create_sqlite_engine(database_uri)
+    else:
+        new_engine = create_engine(
+            database_uri,
+            echo=False,
+            pool_pre_ping=True,
+            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_size=POOL_SIZE,  # Connection pool size
+            max_overflow=POOL_MAX_OVERFLOW  # Max connections beyond pool_size
+        )
+    # Per-request query counts, timings and N+1 detection
+    instrument_engine(new_engine)
+    return new_engine
+
+
+def init_db(database_uri: str, replica_uris: list[str] | None = None):
     """Initialize database engine and session factory.
     
     Args:
         database_uri: SQLAlchemy database URI (from config.db_config.get_database_uri())
+        replica_uris: Optional read replica URIs (from config.db_config.get_replica_uris())
     """
-    global engine, SessionLocal
+    global engine, replica_engines, SessionLocal
     
     try:
-        engine = create_engine(
-            database_uri,
-            echo=False,
-            pool_pre_ping=True,
-            pool_recycle=3600,  # Recycle connections after 1 hour
-            pool_size=10,  # Connection pool size
-            max_overflow=20  # Max connections beyond pool_size
-        )
+        engine = _create_engine(database_uri)
+        replica_engines = [_create_engine(uri) for uri in replica_uris or []]
+
+        @event.listens_for(engine, "checkout")
+        def _count_saturated_checkout(dbapi_connection, connection_record, connection_proxy):
+            global pool_saturated_checkouts
+            pool = engine.pool
+            if hasattr(pool, "checkedin") and pool.checkedin() == 0 and pool.overflow() >= POOL_MAX_OVERFLOW:
+                pool_saturated_checkouts += 1
         
+        # Statements over the threshold are logged with origin and EXPLAIN plan
+        slow_query_log.attach(engine)
+
         # Create scoped session factory  
         SessionLocal = scoped_session(sessionmaker(
+            class_=RoutingSession,
             autocommit=False,
             autoflush=False,
             bind=engine
@@ -47,7 +174,8 @@ def init_db(database_uri: str):
         if SessionLocal is None:
             raise RuntimeError("SessionLocal was not properly initialized")
         
-        print(f"Database initialized successfully: {database_uri.split('@')[1] if '@' in database_uri else 'database'}")
+        print(f"Database initialized successfully: {database_uri.split('@')[1] if '@' in database_uri else 'database'}"
+              + (f" (+{len(replica_engines)} read replica(s))" if replica_engines else ""))
     except Exception as e:
         print(f"ERROR: Failed to initialize database: {e}")
         raise
@@ -56,6 +184,10 @@ def init_db(database_uri: str):
 def create_all_tables():
     """Create all tables in the database."""
     Base.metadata.create_all(bind=engine)
+    # Local SQLite replicas have no replication to bring the schema over
+    for replica in replica_engines:
+        if replica.dialect.name == "sqlite":
+            Base.metadata.create_all(bind=replica)
 
 
 def get_session():
@@ -88,6 +220,37 @@ def session_scope():
         session.close()
 
 
+def unique_violation_field(error, columns: dict) -> str | None:
+    """Work out which unique column an IntegrityError was raised for.
+
+    Matches the driver message against the column's qualified name (SQLite:
+    "UNIQUE constraint failed: users.email") and the names of single-column
+    unique indexes/constraints on it (MySQL: "Duplicate entry ... for key
+    'users.ix_users_email'").
+
+    Args:
+        error: The IntegrityError raised on flush/commit
+        columns: Mapping of field name -> Column to check, e.g. {"email": User.__table__.c.email}
+
+    Returns:
+        The matching field name, or None if the violation is on another column
+    """
+    message = str(getattr(error, "orig", error))
+    for field, column in columns.items():
+        table = column.table
+        names = [f"{table.name}.{column.name}", f"'{column.name}'"]
+        for index in table.indexes:
+            if index.unique and index.name and [c.name for c in index.columns] == [column.name]:
+                names.append(index.name)
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint) and constraint.name \
+                    and [c.name for c in constraint.columns] == [column.name]:
+                names.append(constraint.name)
+        if any(name in message for name in names):
+            return field
+    return None
+
+
 def close_session():
     """Close the current scoped session."""
     if SessionLocal:
@@ -1,3 +1,4 @@
+import json
 from http import HTTPStatus
 from pydantic import ValidationError as PydanticValidationError
 from services.exceptions import FitTrackError
@@ -10,4 +11,5 @@ def register_error_handlers(app):
 
     @app.errorhandler(PydanticValidationError)
     def handle_pydantic_error(err):
-        return {"error": "Validation Error", "details": err.errors()}, HTTPStatus.BAD_REQUEST
+        # err.json() stringifies exceptions raised by custom validators
+        return {"error": "Validation Error", "details": json.loads(err.json())}, HTTPStatus.BAD_REQUEST
@@ -20,6 +20,40 @@ class BadRequestError(FitTrackError):
 class DuplicateError(FitTrackError):
     status_code = 409
 
+    def __init__(self, message="", field=None):
+        super().__init__(message)
+        self.field = field
+
+    def to_dict(self):
+        data = super().to_dict()
+        if self.field:
+            data["field"] = self.field
+        return data
+
+
+class UnauthorizedError(FitTrackError):
+    """Credentials are missing or wrong."""
+    status_code = 401
+
 
 class ForbiddenError(FitTrackError):
     status_code = 403
+
+
+class ServiceUnavailableError(FitTrackError):
+    """Temporarily overloaded (e.g. the password hashing queue is full)."""
+    status_code = 503
+
+
+class ConflictError(FitTrackError):
+    """Scheduling conflict; carries the overlapping bookings."""
+    status_code = 409
+
+    def __init__(self, message="", conflicts=None):
+        super().__init__(message)
+        self.conflicts = conflicts or []
+
+    def to_dict(self):
+        data = super().to_dict()
+        data["conflicts"] = self.conflicts
+        return data
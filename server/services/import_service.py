@@ -0,0 +1,251 @@
+"""Streaming bulk import of members from CSV or NDJSON.
+
+Rows are read lazily and processed in chunks of IMPORT_CHUNK_SIZE: each chunk
+is validated with the MemberCreate schema, checked for duplicates with one
+IN-query per unique column, password-hashed and inserted with a single bulk
+INSERT. Memory use is bounded by the chunk size, not the file size.
+
+Inside the web app (POST /members/import) passwords are hashed one at a time
+on the shared, bounded password_hasher, so an upload gets the same
+backpressure, 503s and queue metrics as logins and never takes more than one
+hashing worker away from them. The import_members.py CLI owns its process and
+passes `workers` to hash across a process pool instead.
+"""
+import csv
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from models.member import Member
+from models.user import User
+from schemas.member_schema import MemberCreate
+from services.db import get_session
+from services.exceptions import BadRequestError
+from services.password_hasher import hash_password, password_hasher
+from config.constants import DEFAULT_MEMBER_STATUS, IMPORT_CHUNK_SIZE
+from utils.validators import normalize_email, normalize_name, normalize_phone, sanitize_string
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+def iter_csv_rows(stream):
+    """Yield (line number, row dict) from a text CSV stream with a header row."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        if None in row:
+            # DictReader puts values beyond the header under the None key
+            yield reader.line_num, f"Row has {len(row[None])} more column(s) than the header"
+            continue
+        yield reader.line_num, row
+
+
+def iter_ndjson_rows(stream):
+    """Yield (line number, row dict) from a text NDJSON stream; blank lines are skipped.
+
+    Lines that are not JSON objects are yielded as an error string instead of a dict.
+    """
+    for line_num, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_num, f"Invalid JSON: {e.msg}"
+            continue
+        yield line_num, row if isinstance(row, dict) else "Row must be a JSON object"
+
+
+def iter_rows(stream, fmt: str):
+    """Dispatch to the row reader for `fmt` ('csv' or 'ndjson').
+
+    Raises:
+        BadRequestError: If the format is not supported
+    """
+    if fmt == "csv":
+        return iter_csv_rows(stream)
+    if fmt == "ndjson":
+        return iter_ndjson_rows(stream)
+    raise BadRequestError(f"Format must be one of: {', '.join(IMPORT_FORMATS)}")
+
+
+def _split_name(full_name: str) -> tuple[str, str]:
+    name_parts = full_name.strip().split(maxsplit=1)
+    first_name = name_parts[0] if name_parts else full_name
+    last_name = name_parts[1] if len(name_parts) > 1 else ""
+    return first_name, last_name
+
+
+class MemberImportService:
+    """Service class for bulk-importing members."""
+
+    def __init__(self, chunk_size: int = IMPORT_CHUNK_SIZE, workers: int | None = None):
+        """Initialize the MemberImportService.
+
+        Args:
+            chunk_size: Rows per validated/hashed/inserted batch
+            workers: Password hashing processes (CLI only); None hashes on the
+                shared password_hasher, as the web app must
+        """
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _hash_pool(self) -> ProcessPoolExecutor:
+        """The process pool used by all imports on this instance, created on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def _hash_passwords(self, passwords: list[str]) -> list[str]:
+        """Hash passwords, preserving order."""
+        if self.workers is None:
+            return [password_hasher.hash(password) for password in passwords]
+        return list(self._hash_pool().map(hash_password, passwords,
+                                          chunksize=max(1, len(passwords) // (4 * self.workers))))
+
+    def shutdown(self):
+        """Stop the hashing processes (a later import starts a new pool)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def import_members(self, rows) -> dict:
+        """Import members from an iterable of (line number, row) pairs.
+
+        Each chunk is committed on its own, so rows imported before a failure
+        stay imported and the report says exactly which rows were rejected.
+
+        Args:
+            rows: Iterable from iter_csv_rows / iter_ndjson_rows
+
+        Returns:
+            Report dict: total, imported, failed and errors
+            ([{"line": n, "errors": [...]}, ...])
+        """
+        report = {"total": 0, "imported": 0, "failed": 0, "errors": []}
+        # Unique values already accepted earlier in this file
+        seen = {"email": set(), "national_id": set()}
+
+        chunk = []
+        for line_num, row in rows:
+            report["total"] += 1
+            chunk.append((line_num, row))
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk, seen, report)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk, seen, report)
+
+        report["errors"].sort(key=lambda e: e["line"])
+        report["failed"] = len(report["errors"])
+        return report
+
+    def _import_chunk(self, chunk, seen, report):
+        errors = report["errors"]
+
+        # 1. Validate with the same rules as POST /members
+        valid = []
+        for line_num, row in chunk:
+            if isinstance(row, str):
+                errors.append({"line": line_num, "errors": [row]})
+                continue
+            try:
+                payload = MemberCreate.model_validate(row)
+            except ValidationError as e:
+                errors.append({"line": line_num, "errors": [
+                    f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+                ]})
+                continue
+            valid.append((line_num, payload, normalize_email(payload.email), sanitize_string(payload.national_id)))
+        if not valid:
+            return
+
+        # 2. Duplicates within the file and against the database (one IN-query per column)
+        session = get_session()
+        try:
+            users = User.__table__
+            members = Member.__table__
+            # Soft-deleted members have tombstoned email / national_id, so only live rows can collide
+            existing_emails = set(session.execute(
+                select(users.c.email).where(users.c.email.in_([v[2] for v in valid]))
+            ).scalars())
+            existing_ids = set(session.execute(
+                select(members.c.national_id).where(members.c.national_id.in_([v[3] for v in valid]))
+            ).scalars())
+        finally:
+            session.close()
+
+        accepted = []
+        for line_num, payload, email, national_id in valid:
+            row_errors = []
+            if email in existing_emails or email in seen["email"]:
+                row_errors.append("email: Email already exists")
+            if national_id in existing_ids or national_id in seen["national_id"]:
+                row_errors.append("national_id: National ID already exists")
+            if row_errors:
+                errors.append({"line": line_num, "errors": row_errors})
+                continue
+            seen["email"].add(email)
+            seen["national_id"].add(national_id)
+            accepted.append((line_num, payload, email, national_id))
+        if not accepted:
+            return
+
+        # 3. Hash passwords
+        hashes = self._hash_passwords([a[1].password for a in accepted])
+
+        # 4. One bulk INSERT for the chunk (the ORM fills users + members for joined inheritance)
+        records = []
+        for (line_num, payload, email, national_id), password_hash in zip(accepted, hashes):
+            first_name, last_name = _split_name(payload.full_name)
+            phone = sanitize_string(payload.phone)
+            records.append({
+                "line": line_num,
+                "values": {
+                    "role": "member",
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "first_name_norm": normalize_name(first_name),
+                    "last_name_norm": normalize_name(last_name),
+                    "email": email,
+                    "phone": phone,
+                    "phone_digits": normalize_phone(phone),
+                    "national_id": national_id,
+                    "password_hash": password_hash,
+                    "status": DEFAULT_MEMBER_STATUS.value,
+                },
+            })
+
+        session = get_session()
+        try:
+            session.execute(insert(Member), [r["values"] for r in records])
+            session.commit()
+            report["imported"] += len(records)
+        except IntegrityError:
+            # A concurrent writer took some of the values; retry row by row to isolate them
+            session.rollback()
+            self._insert_rows_individually(session, records, report)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _insert_rows_individually(session, records, report):
+        for record in records:
+            try:
+                session.execute(insert(Member), [record["values"]])
+                session.commit()
+                report["imported"] += 1
+            except IntegrityError:
+                session.rollback()
+                report["errors"].append({"line": record["line"], "errors": ["Email or national ID already exists"]})
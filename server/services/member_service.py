@@ -1,59 +1,86 @@
-import base64
-import os
+import re
+from datetime import datetime, timedelta
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from sqlalchemy import delete, func, select, union, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
-from services.db import get_session
-from services.exceptions import NotFoundError, DuplicateError
+from services.bulk_delete import delete_member_rows
+from services.db import get_session, unique_violation_field, read_only
+from services.exceptions import NotFoundError, DuplicateError, BadRequestError, ForbiddenError, UnauthorizedError
+from services.password_hasher import (  # noqa: F401
+    password_hasher, hash_password, verify_password, needs_rehash, dummy_password_hash,
+)
+from models.checkin import Checkin
 from models.member import Member
-from config.constants import DEFAULT_MEMBER_STATUS
-from utils.validators import normalize_email, sanitize_string
-
-
-def hash_password(password: str) -> str:
-    """Hash a password using PBKDF2-HMAC-SHA256.
-
-    Returns:
-        Hashed password in format: salt$hash (both base64 encoded)
-    """
-    salt = os.urandom(32)
-
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100_000,
-        backend=default_backend(),
-    )
-
-    key = kdf.derive(password.encode("utf-8"))
-
-    salt_b64 = base64.b64encode(salt).decode("utf-8")
-    key_b64 = base64.b64encode(key).decode("utf-8")
-    return f"{salt_b64}${key_b64}"
-
-
-def verify_password(password: str, stored_hash: str) -> bool:
-    """Verify a password against stored salt$hash."""
-    try:
-        salt_b64, key_b64 = stored_hash.split("$", 1)
-        salt = base64.b64decode(salt_b64.encode("utf-8"))
-        old_key = base64.b64decode(key_b64.encode("utf-8"))
-
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100_000,
-            backend=default_backend(),
-        )
+from models.payment import Payment
+from models.session import Session
+from models.subscription import Subscription
+from models.user import User
+from models.waiting_list import WaitingList
+from config.constants import (
+    DEFAULT_MEMBER_STATUS,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    MIN_SEARCH_QUERY_LENGTH,
+    PROFILE_RECENT_LIMIT,
+    PROFILE_WINDOW_DAYS,
+    MemberStatus,
+    UserRole,
+)
+from utils.validators import normalize_digits, normalize_email, normalize_name, normalize_phone, sanitize_string
+
+
+# Fields accepted by list_members(fields=...) -> columns they are built from
+MEMBER_LIST_FIELDS = {
+    "id": (User.__table__.c.id,),
+    "role": (User.__table__.c.role,),
+    "first_name": (User.__table__.c.first_name,),
+    "last_name": (User.__table__.c.last_name,),
+    "full_name": (User.__table__.c.first_name, User.__table__.c.last_name),
+    "email": (User.__table__.c.email,),
+    "phone": (User.__table__.c.phone,),
+    "date_of_birth": (User.__table__.c.date_of_birth,),
+    "status": (User.__table__.c.status,),
+    "created_at": (User.__table__.c.created_at,),
+    "national_id": (Member.__table__.c.national_id,),
+    "no_show_count": (Member.__table__.c.no_show_count,),
+}
+
+
+def _project_member_row(row, fields: list[str]) -> dict:
+    """Shape a projected row like Member.to_dict(), limited to the given fields."""
+    result = {}
+    for field in fields:
+        if field == "full_name":
+            result[field] = f"{row['first_name']} {row['last_name']}"
+        elif field in ("date_of_birth", "created_at"):
+            value = row[field]
+            result[field] = value.isoformat() if value else None
+        else:
+            result[field] = row[field]
+    return result
+
+
+def _duplicate_member_error(error: IntegrityError) -> Exception:
+    """Translate a unique-index violation on member insert/update into DuplicateError."""
+    field = unique_violation_field(error, {
+        "email": User.__table__.c.email,
+        "national_id": Member.__table__.c.national_id,
+    })
+    if field == "email":
+        return DuplicateError("Email already exists", field="email")
+    if field == "national_id":
+        return DuplicateError("National ID already exists", field="national_id")
+    return error
+
 
-        kdf.verify(password.encode("utf-8"), old_key)
-        return True
-    except Exception:
-        return False
+def _prefix(value: str) -> str:
+    """LIKE pattern matching values that start with `value` (wildcards escaped)."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
 
 
 class MemberService:
@@ -63,17 +90,160 @@ class MemberService:
         """Initialize the MemberService."""
         pass
 
-    def list_members(self):
-        """Retrieve all members from the database."""
+    @read_only
+    def list_members(
+        self,
+        fields: list[str] | None = None,
+        status: str | None = None,
+        role: str = UserRole.MEMBER.value,
+        cursor: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[dict], int | None]:
+        """List one page of users (members by default) ordered by id.
+
+        Selects only the requested columns as plain rows - no ORM entities are
+        built - and pages with a keyset on users.id, so every page is a primary
+        key range scan.
+
+        Args:
+            fields: Columns to return (defaults to every field in Member.to_dict)
+            status: Only users with this status
+            role: Only users with this role
+            cursor: Last id of the previous page
+            limit: Page size (capped at MAX_PAGE_SIZE)
+
+        Returns:
+            Tuple of (list of dicts, next cursor or None)
+
+        Raises:
+            BadRequestError: If a field, status or role is unknown
+        """
+        fields = fields or list(MEMBER_LIST_FIELDS)
+        unknown = [f for f in fields if f not in MEMBER_LIST_FIELDS]
+        if unknown:
+            raise BadRequestError(
+                f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(MEMBER_LIST_FIELDS)}"
+            )
+        if status is not None and status not in MemberStatus.values():
+            raise BadRequestError(f"Status must be one of: {', '.join(MemberStatus.values())}")
+        if role not in UserRole.values():
+            raise BadRequestError(f"Role must be one of: {', '.join(UserRole.values())}")
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        users = User.__table__
+        members = Member.__table__
+        columns = {users.c.id}
+        for field in fields:
+            columns.update(MEMBER_LIST_FIELDS[field])
+        needs_members = any(c.table is members for c in columns)
+
+        stmt = select(*sorted(columns, key=lambda c: (c.table.name, c.name)))
+        if needs_members:
+            stmt = stmt.select_from(users.outerjoin(members, members.c.id == users.c.id))
+        stmt = stmt.where(users.c.role == role, users.c.deleted_at.is_(None))
+        if status is not None:
+            stmt = stmt.where(users.c.status == status)
+        if cursor is not None:
+            stmt = stmt.where(users.c.id > cursor)
+        # Fetch one extra row to know whether another page exists
+        stmt = stmt.order_by(users.c.id.asc()).limit(limit + 1)
+
         session = get_session()
         try:
-            members = session.query(Member).all()
-            # Convert to dicts before closing session to avoid DetachedInstanceError
-            members_list = [m.to_dict() for m in members]
-            return members_list
+            rows = session.execute(stmt).mappings().all()
         finally:
             session.close()
 
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]["id"]
+        return [_project_member_row(row, fields) for row in rows], next_cursor
+
+    @read_only
+    def search_members(self, q: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[dict]:
+        """Typeahead search for members by prefix.
+
+        The query is routed to the normalized, indexed columns it can match:
+        an '@' means email; digits mean phone or national ID; anything else
+        matches first or last name (or "first last" for two words) and email.
+        Each branch is a separate index range scan on `col LIKE 'prefix%'`,
+        combined with UNION so no branch degrades into a table scan.
+
+        Args:
+            q: Search text (at least MIN_SEARCH_QUERY_LENGTH characters)
+            limit: Maximum results (capped at MAX_SEARCH_LIMIT)
+
+        Returns:
+            List of member dicts (id, full_name, email, phone, national_id, status)
+
+        Raises:
+            BadRequestError: If the query is too short or has no digits or letters
+        """
+        q = (q or "").strip()
+        if len(q) < MIN_SEARCH_QUERY_LENGTH:
+            raise BadRequestError(f"Search query must be at least {MIN_SEARCH_QUERY_LENGTH} characters")
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+
+        users = User.__table__
+        members = Member.__table__
+
+        def branch(*conditions, from_members=False):
+            source = members if from_members else users
+            # Wrapped so each limited branch is valid inside a UNION on every backend
+            limited = select(source.c.id).where(*conditions).limit(limit).subquery()
+            return select(limited.c.id)
+
+        if "@" in q:
+            branches = [branch(users.c.email.like(_prefix(normalize_email(q)), escape="\\"))]
+        elif re.fullmatch(r"\+?[\d\s-]+", q):
+            national_id = normalize_digits(q)
+            if not national_id:
+                # Only separators: an empty prefix would match every member
+                raise BadRequestError("Search query must contain digits or letters")
+            # Phone numbers are stored in local form (+972 -> 0); national IDs are plain digits
+            branches = [
+                branch(users.c.phone_digits.like(_prefix(normalize_phone(q)), escape="\\")),
+                branch(members.c.national_id.like(_prefix(national_id), escape="\\"), from_members=True),
+            ]
+        else:
+            words = normalize_name(q).split()
+            if len(words) >= 2:
+                first, last = words[0], " ".join(words[1:])
+                branches = [branch(
+                    users.c.first_name_norm.like(_prefix(first), escape="\\"),
+                    users.c.last_name_norm.like(_prefix(last), escape="\\"),
+                )]
+            else:
+                name = words[0]
+                branches = [
+                    branch(users.c.first_name_norm.like(_prefix(name), escape="\\")),
+                    branch(users.c.last_name_norm.like(_prefix(name), escape="\\")),
+                    branch(users.c.email.like(_prefix(name), escape="\\")),
+                ]
+
+        matched = (branches[0] if len(branches) == 1 else union(*branches)).subquery()
+        stmt = (
+            select(
+                users.c.id, users.c.first_name, users.c.last_name, users.c.email,
+                users.c.phone, users.c.status, members.c.national_id,
+            )
+            .join(members, members.c.id == users.c.id)
+            .where(users.c.id.in_(select(matched.c.id)), users.c.deleted_at.is_(None))
+            .order_by(users.c.last_name, users.c.first_name, users.c.id)
+            .limit(limit)
+        )
+
+        session = get_session()
+        try:
+            rows = session.execute(stmt).mappings().all()
+        finally:
+            session.close()
+        return [
+            _project_member_row(row, ["id", "full_name", "email", "phone", "national_id", "status"])
+            for row in rows
+        ]
+
     def get_member(self, member_id: int) -> dict:
         """Get a specific member by ID."""
         session = get_session()
@@ -87,8 +257,114 @@ class MemberService:
         finally:
             session.close()
 
-    def create_member(self, full_name: str, email: str, phone: str, national_id: str, password: str) -> Member:
-        """Create a new member."""
+    @read_only
+    def get_member_profile(self, member_id: int, include_payments: bool = True) -> dict:
+        """Build a member's profile screen in a fixed number of queries.
+
+        The member, subscriptions (with plans) and workout plans come from one
+        query plus selectinload batches; check-ins and payments are limited to
+        the newest PROFILE_RECENT_LIMIT rows and summarized over the last
+        PROFILE_WINDOW_DAYS with GROUP BY, so the cost does not grow with the
+        member's history. Nothing is written (subscription statuses are
+        derived on serialization), so the profile can be served by a replica.
+
+        Args:
+            member_id: The ID of the member
+            include_payments: Whether to include the payments section
+
+        Returns:
+            Dictionary with member, subscriptions, workout_plans, checkins and payments
+
+        Raises:
+            NotFoundError: If member doesn't exist
+        """
+        since = datetime.utcnow() - timedelta(days=PROFILE_WINDOW_DAYS)
+
+        session = get_session()
+        try:
+            member = (
+                session.query(Member)
+                .options(
+                    selectinload(Member.subscriptions).selectinload(Subscription.plan),
+                    selectinload(Member.workout_plans),
+                )
+                .filter(Member.id == member_id)
+                .first()
+            )
+            if not member:
+                raise NotFoundError("Member not found")
+
+            subscriptions = sorted(member.subscriptions, key=lambda sub: sub.start_date, reverse=True)
+            subscription_dicts = []
+            for sub in subscriptions:
+                sub_dict = sub.to_dict()
+                sub_dict["plan"] = sub.plan.to_dict() if sub.plan else None
+                subscription_dicts.append(sub_dict)
+
+            recent_checkins = (
+                session.query(Checkin)
+                .filter(Checkin.member_id == member_id)
+                .order_by(Checkin.created_at.desc())
+                .limit(PROFILE_RECENT_LIMIT)
+                .all()
+            )
+            checkin_counts = dict(
+                session.query(Checkin.result, func.count(Checkin.id))
+                .filter(Checkin.member_id == member_id, Checkin.created_at >= since)
+                .group_by(Checkin.result)
+                .all()
+            )
+
+            profile = {
+                "member": member.to_dict(),
+                "subscriptions": subscription_dicts,
+                "active_subscription_id": next(
+                    (sub["id"] for sub in subscription_dicts if sub["status"] == "active"), None
+                ),
+                "workout_plans": [plan.to_dict() for plan in member.workout_plans],
+                "checkins": {
+                    "recent": [c.to_dict() for c in recent_checkins],
+                    "window_days": PROFILE_WINDOW_DAYS,
+                    "counts": checkin_counts,
+                    "total": sum(checkin_counts.values()),
+                    "last_checkin_at": recent_checkins[0].created_at.isoformat() if recent_checkins else None,
+                },
+                "payments": None,
+            }
+
+            if include_payments:
+                subscription_ids = [sub.id for sub in subscriptions]
+                recent_payments = []
+                payment_summary = {}
+                if subscription_ids:
+                    recent_payments = (
+                        session.query(Payment)
+                        .filter(Payment.subscription_id.in_(subscription_ids))
+                        .order_by(Payment.created_at.desc())
+                        .limit(PROFILE_RECENT_LIMIT)
+                        .all()
+                    )
+                    payment_summary = {
+                        status: {"count": count, "amount": float(amount or 0)}
+                        for status, count, amount in (
+                            session.query(Payment.status, func.count(Payment.id), func.sum(Payment.amount))
+                            .filter(Payment.subscription_id.in_(subscription_ids), Payment.created_at >= since)
+                            .group_by(Payment.status)
+                            .all()
+                        )
+                    }
+                profile["payments"] = {
+                    "recent": [p.to_dict() for p in recent_payments],
+                    "window_days": PROFILE_WINDOW_DAYS,
+                    "by_status": payment_summary,
+                }
+
+            return profile
+        finally:
+            session.close()
+
+    def create_member(self, full_name: str, email: str, phone: str, national_id: str, password: str) -> dict:
+        """Create a new member; returns it as a dictionary."""
         email_norm = normalize_email(email)
         phone_norm = sanitize_string(phone)
         national_id_norm = sanitize_string(national_id)
@@ -98,38 +374,92 @@ class MemberService:
         first_name = name_parts[0] if name_parts else full_name
         last_name = name_parts[1] if len(name_parts) > 1 else ""
 
+        # Hash before opening the transaction so no connection is held during PBKDF2
+        password_hash = password_hasher.hash(password)
+
         session = get_session()
         try:
-            if session.query(Member).filter(Member.email == email_norm).first():
-                raise DuplicateError("Email already exists")
-
-            if session.query(Member).filter(Member.national_id == national_id_norm).first():
-                raise DuplicateError("National ID already exists")
-
             member = Member(
                 first_name=first_name,
                 last_name=last_name,
                 email=email_norm,
                 phone=phone_norm,
                 national_id=national_id_norm,
-                password_hash=hash_password(password),
+                password_hash=password_hash,
                 status=DEFAULT_MEMBER_STATUS.value,
             )
 
+            # Insert optimistically; the unique indexes on email and national_id
+            # reject duplicates atomically, even between concurrent requests
             session.add(member)
-            session.commit()
-            session.refresh(member)
-            # Convert to dict before closing session to avoid DetachedInstanceError
+            session.flush()
+            # Convert to dict before commit expires the instance (avoids a re-SELECT)
             member_dict = member.to_dict()
+            session.commit()
             return member_dict
+        except IntegrityError as e:
+            session.rollback()
+            raise _duplicate_member_error(e)
         except Exception:
             session.rollback()
             raise
         finally:
             session.close()
 
-    def update_member(self, member_id: int, full_name=None, email=None, phone=None, status=None) -> Member:
-        """Update an existing member."""
+    def authenticate(self, email: str, password: str) -> dict:
+        """Check a member's credentials, upgrading an outdated password hash.
+
+        Args:
+            email: Member email
+            password: Plain-text password
+
+        Returns:
+            Member as dictionary
+
+        Raises:
+            UnauthorizedError: If the email is unknown or the password is wrong
+            ForbiddenError: If the account cannot log in
+        """
+        email_norm = normalize_email(email)
+        session = get_session()
+        try:
+            member = session.query(Member).filter(Member.email == email_norm).first()
+            # Release the connection while PBKDF2 runs
+            member_dict = member.to_dict() if member else None
+            can_login = member.can_login() if member else False
+            stored_hash = member.password_hash if member else None
+        finally:
+            session.close()
+
+        # Unknown emails still pay for a full PBKDF2 check so timing does not reveal them
+        verified = password_hasher.verify(password, stored_hash or dummy_password_hash())
+        if member_dict is None or not verified:
+            raise UnauthorizedError("Invalid email or password")
+        if not can_login:
+            raise ForbiddenError("Account is not active")
+
+        if needs_rehash(stored_hash):
+            new_hash = password_hasher.hash(password)
+            session = get_session()
+            try:
+                members = Member.__table__
+                # Compare-and-set so a concurrent password change is not overwritten
+                session.execute(
+                    update(members)
+                    .where(members.c.id == member_dict["id"], members.c.password_hash == stored_hash)
+                    .values(password_hash=new_hash)
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        return member_dict
+
+    def update_member(self, member_id: int, full_name=None, email=None, phone=None, status=None) -> dict:
+        """Update an existing member; returns it as a dictionary."""
         session = get_session()
         try:
             member = session.query(Member).filter(Member.id == member_id).first()
@@ -137,16 +467,8 @@ class MemberService:
                 raise NotFoundError("Member not found")
 
             if email is not None:
-                email_norm = normalize_email(email)
-                if email_norm != member.email:
-                    # Check if email is used by any OTHER member
-                    existing = session.query(Member).filter(
-                        Member.email == email_norm,
-                        Member.id != member_id
-                    ).first()
-                    if existing:
-                        raise DuplicateError("Email already exists")
-                    member.email = email_norm
+                # Uniqueness is enforced by the email index on flush
+                member.email = normalize_email(email)
 
             if full_name is not None:
                 # Split full_name into first_name and last_name
@@ -162,11 +484,14 @@ class MemberService:
             if status is not None:
                 member.status = status
 
-            session.commit()
-            session.refresh(member)
-            # Convert to dict before closing session to avoid DetachedInstanceError
+            session.flush()
+            # Convert to dict before commit expires the instance (avoids a re-SELECT)
             member_dict = member.to_dict()
+            session.commit()
             return member_dict
+        except IntegrityError as e:
+            session.rollback()
+            raise _duplicate_member_error(e)
         except Exception:
             session.rollback()
             raise
@@ -174,22 +499,72 @@ class MemberService:
             session.close()
 
     def delete_member(self, member_id: int) -> None:
-        """Delete a member from the database.
-        
+        """Soft-delete a member.
+
+        Flags users.deleted_at, so the member immediately disappears from
+        listings, authentication and check-in. In the same transaction the
+        member's active class registrations are canceled and waiting-list
+        entries removed (so they stop holding seats), and the unique email and
+        national ID are replaced with tombstones so the same person can be
+        created again before the purge runs. Each step is one indexed UPDATE
+        or DELETE; everything else is removed later by PurgeService in small
+        chunks.
+
         Args:
             member_id: The ID of the member to delete
-            
+
         Raises:
-            NotFoundError: If member doesn't exist
+            NotFoundError: If member doesn't exist (or is already deleted)
         """
         session = get_session()
         try:
-            member = session.query(Member).filter(Member.id == member_id).first()
-            if not member:
+            users = User.__table__
+            flagged = session.execute(
+                update(users)
+                .where(users.c.id == member_id, users.c.role == "member", users.c.deleted_at.is_(None))
+                .values(deleted_at=datetime.utcnow(), email=f"deleted-{member_id}@deleted.invalid")
+            ).rowcount
+            if not flagged:
                 raise NotFoundError("Member not found")
-            
-            session.delete(member)
+            members = Member.__table__
+            session.execute(
+                update(members).where(members.c.id == member_id).values(national_id=f"deleted-{member_id}")
+            )
+            sessions = Session.__table__
+            session.execute(
+                update(sessions)
+                .where(sessions.c.member_id == member_id, sessions.c.status == "active")
+                .values(status="canceled")
+            )
+            waiting_lists = WaitingList.__table__
+            session.execute(delete(waiting_lists).where(waiting_lists.c.member_id == member_id))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def purge_member(self, member_id: int, chunk_size: int | None = None, progress=None) -> dict:
+        """Permanently delete a member and all related rows with set-based DELETEs.
+
+        Rows are removed in dependency order (payments, subscriptions, workout
+        plans, sessions, waiting lists, check-ins, then the member) without
+        loading them into memory.
+
+        Args:
+            member_id: The ID of the member to delete
+            chunk_size: Delete and commit in batches of this many rows
+            progress: Optional callback(table_name, rows_deleted_so_far)
+
+        Returns:
+            Dictionary of table name -> number of rows deleted
+        """
+        session = get_session()
+        try:
+            deleted = delete_member_rows(session, member_id, chunk_size=chunk_size, progress=progress)
             session.commit()
+            return deleted
         except Exception:
             session.rollback()
             raise
@@ -0,0 +1,224 @@
+"""In-process metrics registry rendered in the Prometheus text format.
+
+Counters and histograms keep plain Python numbers per label set. Recording
+takes no lock: an increment under the GIL costs well under a microsecond, and
+a rare lost update under contention is an acceptable trade for never making
+a request wait on metrics. Histograms use fixed buckets, so observing a
+value is a bisect plus an increment. Gauges are callbacks evaluated at
+scrape time (pool status, hashing queue depth, cache stats).
+
+Each worker process has its own registry; scrape every worker, or run one.
+"""
+import time
+from bisect import bisect_left
+
+from flask import g, request
+
+from services import db
+from services.conflict_index import instructor_index
+from services.password_hasher import password_hasher
+from services.sql_stats import statement_listeners
+from config.constants import REQUEST_LATENCY_BUCKETS, DB_QUERY_LATENCY_BUCKETS
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        """Increment the counter for the given label values."""
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        for label_values, value in list(self._values.items()):
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class Gauge:
+    """Metric whose samples come from a callback at scrape time.
+
+    The callback returns either a number or a {label_values_tuple: number} dict.
+    Use type_name="counter" for totals maintained elsewhere.
+    """
+
+    def __init__(self, name: str, help_text: str, callback, labels: tuple = (), type_name: str = "gauge"):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.callback = callback
+        self.type_name = type_name
+
+    def samples(self):
+        value = self.callback()
+        if value is None:
+            return
+        if isinstance(value, dict):
+            for label_values, sample in value.items():
+                yield self.name, _format_labels(self.labels, label_values), sample
+        else:
+            yield self.name, "", value
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple, labels: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, *label_values):
+        """Record one observation."""
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series.setdefault(label_values, [0] * (len(self.buckets) + 1) + [0.0])
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self):
+        for label_values, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket", _format_labels(self.labels, label_values, le), cumulative
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum", labels, series[-1]
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them for GET /api/metrics."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        """Add a metric (or return the one already registered under its name)."""
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, labels: tuple = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, callback, labels: tuple = (), type_name: str = "gauge") -> Gauge:
+        return self.register(Gauge(name, help_text, callback, labels, type_name))
+
+    def histogram(self, name: str, help_text: str, buckets: tuple, labels: tuple = ()) -> Histogram:
+        return self.register(Histogram(name, help_text, buckets, labels))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared per-process registry
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "fittrack_http_requests_total", "HTTP requests handled.", ("method", "endpoint", "status"))
+http_request_duration_seconds = registry.histogram(
+    "fittrack_http_request_duration_seconds", "HTTP request latency in seconds.",
+    REQUEST_LATENCY_BUCKETS, ("endpoint",))
+db_query_duration_seconds = registry.histogram(
+    "fittrack_db_query_duration_seconds", "SQL statement execution time in seconds.",
+    DB_QUERY_LATENCY_BUCKETS, ("operation",))
+
+
+def observe_statement(statement: str, parameters, seconds: float):
+    """sql_stats statement listener: time each statement by its verb."""
+    operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "unknown"
+    db_query_duration_seconds.observe(seconds, operation)
+
+
+def register_collectors():
+    """Register scrape-time gauges for the pool, hashing executor and caches."""
+    def pool_status():
+        pool = db.engine.pool if db.engine is not None else None
+        if pool is None or not hasattr(pool, "checkedout"):
+            return None
+        return {
+            ("size",): pool.size(),
+            ("checked_out",): pool.checkedout(),
+            ("checked_in",): pool.checkedin(),
+            ("overflow",): max(pool.overflow(), 0),
+        }
+
+    registry.gauge("fittrack_db_pool_connections", "Connection pool status.", pool_status, ("state",))
+    registry.gauge("fittrack_db_pool_saturated_checkouts_total",
+                   "Checkouts that left no idle connection and no overflow room (the next one waits).",
+                   lambda: db.pool_saturated_checkouts, type_name="counter")
+
+    registry.gauge("fittrack_password_hash_queue_depth", "Password hash jobs waiting for a worker.",
+                   lambda: password_hasher.get_metrics()["queue_depth"])
+    registry.gauge("fittrack_password_hash_in_flight", "Password hash jobs admitted (queued or running).",
+                   lambda: password_hasher.get_metrics()["in_flight"])
+    registry.gauge("fittrack_password_hash_rejected_total", "Password hash jobs rejected because the queue was full.",
+                   lambda: password_hasher.get_metrics()["rejected"], type_name="counter")
+
+    def cache_lookups():
+        return {
+            ("instructor_index", "hit"): instructor_index.hits,
+            ("instructor_index", "miss"): instructor_index.misses,
+        }
+
+    def cache_hit_ratio():
+        lookups = instructor_index.hits + instructor_index.misses
+        return {("instructor_index",): instructor_index.hits / lookups if lookups else 0.0}
+
+    registry.gauge("fittrack_cache_lookups_total", "In-process cache lookups.", cache_lookups, ("cache", "result"),
+                   type_name="counter")
+    registry.gauge("fittrack_cache_hit_ratio", "In-process cache hit ratio since start.", cache_hit_ratio, ("cache",))
+
+
+def register_metrics(app):
+    """Time every request and register scrape-time collectors."""
+    if observe_statement not in statement_listeners:
+        statement_listeners.append(observe_statement)
+    register_collectors()
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            endpoint = request.endpoint or "unmatched"
+            http_request_duration_seconds.observe(time.perf_counter() - started, endpoint)
+            http_requests_total.inc(request.method, endpoint, str(response.status_code))
+        return response
@@ -0,0 +1,199 @@
+"""Versioned PBKDF2 password hashing on a bounded executor.
+
+Hashes are stored as ``pbkdf2_sha256$<iterations>$<salt>$<hash>`` (salt and
+hash base64 encoded), so the cost can be raised through
+PASSWORD_HASH_ITERATIONS without invalidating existing passwords:
+``needs_rehash`` flags outdated values and MemberService.authenticate
+upgrades them on the next successful login. Unversioned ``<salt>$<hash>``
+values written before this format are still accepted.
+
+PBKDF2 is pure CPU work. Running it inline lets a burst of sign-ups or logins
+monopolise every web worker, so ``password_hasher`` runs it on a small thread
+pool (the ``cryptography`` backend releases the GIL while deriving) and admits
+at most HASH_WORKERS + HASH_QUEUE_LIMIT jobs at once; beyond that callers get
+ServiceUnavailableError instead of an ever-growing queue.
+"""
+import base64
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from services.exceptions import ServiceUnavailableError
+from config.constants import (
+    PASSWORD_HASH_ALGORITHM,
+    PASSWORD_HASH_ITERATIONS,
+    LEGACY_PASSWORD_HASH_ITERATIONS,
+    HASH_WORKERS,
+    HASH_QUEUE_LIMIT,
+    HASH_QUEUE_TIMEOUT_SECONDS,
+)
+
+
+def _kdf(salt: bytes, iterations: int) -> PBKDF2HMAC:
+    return PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+        backend=default_backend(),
+    )
+
+
+def _parse(stored_hash: str) -> tuple[str, int, bytes, bytes]:
+    """Split a stored hash into (algorithm, iterations, salt, key).
+
+    Raises:
+        ValueError: If the value is not in a known format
+    """
+    parts = stored_hash.split("$")
+    if len(parts) == 4:
+        algorithm, iterations, salt_b64, key_b64 = parts
+        iterations = int(iterations)
+    elif len(parts) == 2:
+        algorithm, iterations = PASSWORD_HASH_ALGORITHM, LEGACY_PASSWORD_HASH_ITERATIONS
+        salt_b64, key_b64 = parts
+    else:
+        raise ValueError("Unrecognized password hash format")
+    return algorithm, iterations, base64.b64decode(salt_b64), base64.b64decode(key_b64)
+
+
+def hash_password(password: str, iterations: int = PASSWORD_HASH_ITERATIONS) -> str:
+    """Hash a password using PBKDF2-HMAC-SHA256 (runs in the calling thread).
+
+    Returns:
+        Hashed password in format: pbkdf2_sha256$iterations$salt$hash
+    """
+    salt = os.urandom(32)
+    key = _kdf(salt, iterations).derive(password.encode("utf-8"))
+
+    salt_b64 = base64.b64encode(salt).decode("utf-8")
+    key_b64 = base64.b64encode(key).decode("utf-8")
+    return f"{PASSWORD_HASH_ALGORITHM}${iterations}${salt_b64}${key_b64}"
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """Verify a password against a versioned or legacy stored hash (runs in the calling thread)."""
+    try:
+        algorithm, iterations, salt, old_key = _parse(stored_hash)
+        if algorithm != PASSWORD_HASH_ALGORITHM:
+            return False
+        _kdf(salt, iterations).verify(password.encode("utf-8"), old_key)
+        return True
+    except Exception:
+        return False
+
+
+@functools.cache
+def dummy_password_hash() -> str:
+    """A current-format hash of a random password, computed once.
+
+    Verifying against it when a user is not found costs the same PBKDF2 work
+    as a real check, so response time does not reveal which emails exist.
+    create_app computes it at startup, so no login request pays for it.
+    """
+    return hash_password(base64.b64encode(os.urandom(16)).decode("utf-8"))
+
+
+def needs_rehash(stored_hash: str) -> bool:
+    """Whether a stored hash uses a legacy format or outdated parameters."""
+    if stored_hash.count("$") != 3:
+        return True
+    try:
+        algorithm, iterations, _, _ = _parse(stored_hash)
+    except ValueError:
+        return True
+    return algorithm != PASSWORD_HASH_ALGORITHM or iterations != PASSWORD_HASH_ITERATIONS
+
+
+class PasswordHasher:
+    """Bounded executor for password hashing with queue-depth metrics."""
+
+    def __init__(self, workers: int = HASH_WORKERS, queue_limit: int = HASH_QUEUE_LIMIT,
+                 timeout: float = HASH_QUEUE_TIMEOUT_SECONDS):
+        """Initialize the PasswordHasher.
+
+        Args:
+            workers: Threads deriving keys concurrently
+            queue_limit: Jobs allowed to wait for a free worker
+            timeout: Seconds to wait for admission before giving up
+        """
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    def _run(self, fn, *args):
+        """Run fn on the pool, blocking the caller until it finishes.
+
+        Raises:
+            ServiceUnavailableError: If the queue stays full for `timeout` seconds
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self._rejected += 1
+            raise ServiceUnavailableError("Password service is busy, please retry")
+
+        submitted = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._wait_seconds += started - submitted
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._run_seconds += time.perf_counter() - started
+
+        try:
+            return self._executor.submit(job).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        """Hash a password on the pool."""
+        return self._run(hash_password, password)
+
+    def verify(self, password: str, stored_hash: str) -> bool:
+        """Verify a password on the pool."""
+        return self._run(verify_password, password, stored_hash)
+
+    def get_metrics(self) -> dict:
+        """Snapshot of pool usage; queue_depth is jobs waiting for a worker."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._in_flight,
+                "running": self._running,
+                "queue_depth": self._in_flight - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(1000 * self._wait_seconds / self._completed, 2) if self._completed else 0.0,
+                "avg_run_ms": round(1000 * self._run_seconds / self._completed, 2) if self._completed else 0.0,
+            }
+
+
+# Shared per-process executor
+password_hasher = PasswordHasher()
@@ -1,6 +1,7 @@
 from datetime import datetime
-from services.db import get_session
+from services.db import get_session, read_only
 from services.exceptions import NotFoundError
+from models.member import Member
 from models.subscription import Subscription
 from models.payment import Payment
 from config.constants import DEFAULT_PAYMENT_STATUS, PaymentStatus
@@ -13,6 +14,18 @@ class PaymentService:
         """Initialize the PaymentService."""
         pass
 
+    @staticmethod
+    def _find_payment(session, payment_id: int) -> Payment | None:
+        """Load a payment unless its member is soft-deleted (the join applies the filter)."""
+        return (
+            session.query(Payment)
+            .join(Subscription, Subscription.id == Payment.subscription_id)
+            .join(Member, Member.id == Subscription.member_id)
+            .filter(Payment.id == payment_id)
+            .first()
+        )
+
+    @read_only
     def list_payments(self, subscription_id: int | None = None):
         """List all payments, optionally filtered by subscription.
         
@@ -24,7 +37,13 @@ class PaymentService:
         """
         session = get_session()
         try:
-            q = session.query(Payment).order_by(Payment.id.asc())
+            # The join hides payments of soft-deleted members (see models.user)
+            q = (
+                session.query(Payment)
+                .join(Subscription, Subscription.id == Payment.subscription_id)
+                .join(Member, Member.id == Subscription.member_id)
+                .order_by(Payment.id.asc())
+            )
             if subscription_id is not None:
                 q = q.filter(Payment.subscription_id == subscription_id)
             return q.all()
@@ -45,7 +64,7 @@ class PaymentService:
         """
         session = get_session()
         try:
-            payment = session.query(Payment).filter(Payment.id == payment_id).first()
+            payment = self._find_payment(session, payment_id)
             if not payment:
                 raise NotFoundError("Payment not found")
             return payment
@@ -68,7 +87,12 @@ class PaymentService:
         """
         session = get_session()
         try:
-            sub = session.query(Subscription).filter(Subscription.id == subscription_id).first()
+            sub = (
+                session.query(Subscription)
+                .join(Member, Member.id == Subscription.member_id)
+                .filter(Subscription.id == subscription_id)
+                .first()
+            )
             if not sub:
                 raise NotFoundError("Subscription not found")
 
@@ -100,7 +124,7 @@ class PaymentService:
         """
         session = get_session()
         try:
-            payment = session.query(Payment).filter(Payment.id == payment_id).first()
+            payment = self._find_payment(session, payment_id)
             if not payment:
                 raise NotFoundError("Payment not found")
                 
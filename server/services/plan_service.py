@@ -1,4 +1,6 @@
-from services.db import get_session
+from sqlalchemy.exc import IntegrityError
+
+from services.db import get_session, unique_violation_field
 from services.exceptions import NotFoundError, DuplicateError
 from models.plan import Plan
 
@@ -57,10 +59,7 @@ class PlanService:
         """
         session = get_session()
         try:
-            existing = session.query(Plan).filter(Plan.name == name).first()
-            if existing:
-                raise DuplicateError("Plan name already exists")
-
+            # Insert optimistically; the unique index on name rejects duplicates atomically
             plan = Plan(
                 name=name,
                 type=type,
@@ -72,6 +71,11 @@ class PlanService:
             session.commit()
             session.refresh(plan)
             return plan
+        except IntegrityError as e:
+            session.rollback()
+            if unique_violation_field(e, {"name": Plan.__table__.c.name}):
+                raise DuplicateError("Plan name already exists", field="name")
+            raise
         except Exception:
             session.rollback()
             raise
@@ -0,0 +1,173 @@
+"""Opt-in sampling profiler for production requests.
+
+Disabled unless FITTRACK_PROFILE_SAMPLE_RATE or FITTRACK_PROFILE_SECRET is
+set; when disabled no hooks are registered, so there is no per-request cost.
+
+- FITTRACK_PROFILE_SAMPLE_RATE=N profiles one request in N.
+- FITTRACK_PROFILE_SECRET=key profiles any request carrying
+  ``X-Profile: <unix time>.<hex HMAC-SHA256(key, unix time)>`` (see
+  sign_profile_request), valid for PROFILE_SIGNATURE_MAX_AGE_SECONDS.
+- FITTRACK_PROFILE_DIR overrides where profiles are written (PROFILE_DIR).
+
+Each profiled request is written as a cProfile pstats file; only the newest
+PROFILE_MAX_FILES are kept. Load one with ``python -m pstats <file>`` or
+snakeviz. Profiled responses carry an X-Profile-Id header naming the file.
+"""
+import cProfile
+import hashlib
+import hmac
+import itertools
+import logging
+import os
+import re
+import time
+from datetime import datetime
+
+from flask import g, request
+
+from services.exceptions import NotFoundError
+from config.constants import PROFILE_DIR, PROFILE_MAX_FILES, PROFILE_SIGNATURE_MAX_AGE_SECONDS
+
+logger = logging.getLogger("fittrack.profiler")
+
+_PROFILE_NAME_RE = re.compile(r"^[\w.-]+\.prof$")
+
+
+def sign_profile_request(secret: str, timestamp: int | None = None) -> str:
+    """Build an X-Profile header value for `secret` (for operators and scripts)."""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signature = hmac.new(secret.encode("utf-8"), str(timestamp).encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{timestamp}.{signature}"
+
+
+class RequestProfiler:
+    """Decides which requests to profile and manages the profile directory."""
+
+    def __init__(self, sample_rate: int = 0, secret: str | None = None, directory: str | None = None,
+                 max_files: int = PROFILE_MAX_FILES):
+        """Initialize the RequestProfiler.
+
+        Args:
+            sample_rate: Profile one request in this many (0 = no sampling)
+            secret: HMAC key for the X-Profile header (None = header ignored)
+            directory: Where profiles are written
+            max_files: Profiles kept before the oldest are deleted
+        """
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.directory = directory or os.path.join(os.path.dirname(os.path.dirname(__file__)), PROFILE_DIR)
+        self.max_files = max_files
+        self._counter = itertools.count(1)
+
+    @classmethod
+    def from_env(cls) -> "RequestProfiler":
+        """Build a profiler from the FITTRACK_PROFILE_* environment variables."""
+        return cls(
+            sample_rate=int(os.getenv("FITTRACK_PROFILE_SAMPLE_RATE", "0") or 0),
+            secret=os.getenv("FITTRACK_PROFILE_SECRET") or None,
+            directory=os.getenv("FITTRACK_PROFILE_DIR") or None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or bool(self.secret)
+
+    def _has_valid_signature(self) -> bool:
+        header = request.headers.get("X-Profile")
+        if not header or not self.secret:
+            return False
+        timestamp, _, signature = header.partition(".")
+        if not timestamp.isdigit() or abs(time.time() - int(timestamp)) > PROFILE_SIGNATURE_MAX_AGE_SECONDS:
+            return False
+        expected = sign_profile_request(self.secret, int(timestamp)).partition(".")[2]
+        return hmac.compare_digest(signature, expected)
+
+    def should_profile(self) -> bool:
+        """Whether the current request is sampled or explicitly requested."""
+        if self._has_valid_signature():
+            return True
+        return self.sample_rate > 0 and next(self._counter) % self.sample_rate == 0
+
+    def save(self, profile: cProfile.Profile, endpoint: str, elapsed_ms: float) -> str:
+        """Write a profile and rotate old ones.
+
+        Returns:
+            The profile file name
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        safe_endpoint = re.sub(r"[^\w.-]", "_", endpoint)
+        name = f"{stamp}_{safe_endpoint}_{int(elapsed_ms)}ms.prof"
+        profile.dump_stats(os.path.join(self.directory, name))
+        self._rotate()
+        return name
+
+    def _rotate(self):
+        profiles = self.list_profiles()
+        for entry in profiles[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, entry["name"]))
+            except OSError:
+                pass
+
+    def list_profiles(self) -> list[dict]:
+        """Saved profiles, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if not _PROFILE_NAME_RE.match(name):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            profiles.append({
+                "name": name,
+                "size_bytes": stat.st_size,
+                "created_at": datetime.utcfromtimestamp(stat.st_mtime).isoformat(),
+            })
+        return sorted(profiles, key=lambda p: p["name"], reverse=True)
+
+    def profile_path(self, name: str) -> str:
+        """Absolute path of a saved profile.
+
+        Raises:
+            NotFoundError: If the name is invalid or the file doesn't exist
+        """
+        path = os.path.join(self.directory, name)
+        if not _PROFILE_NAME_RE.match(name) or not os.path.isfile(path):
+            raise NotFoundError("Profile not found")
+        return path
+
+    def init_app(self, app):
+        """Register the profiling hooks (only when enabled)."""
+        if not self.enabled:
+            return
+
+        @app.before_request
+        def start_profile():
+            if not self.should_profile():
+                return
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another request on this process is already being profiled
+                return
+            g.profile = profile
+            g.profile_started = time.perf_counter()
+
+        @app.after_request
+        def finish_profile(response):
+            profile = g.pop("profile", None)
+            if profile is None:
+                return response
+            profile.disable()
+            elapsed_ms = (time.perf_counter() - g.pop("profile_started")) * 1000
+            try:
+                response.headers["X-Profile-Id"] = self.save(profile, request.endpoint or "unmatched", elapsed_ms)
+            except OSError:
+                logger.exception("Could not write request profile")
+            return response
+
+
+# Shared per-process profiler, configured from the environment
+request_profiler = RequestProfiler.from_env()
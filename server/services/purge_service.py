@@ -0,0 +1,172 @@
+"""Background purge of soft-deleted members.
+
+DELETE /members/<id> only sets users.deleted_at (and releases the member's
+seats and unique keys, see MemberService.delete_member). PurgeService later removes
+the member and all related rows table by table in small committed chunks,
+pausing between chunks so hot tables like checkins are never locked for long.
+Progress is kept in memory and exposed through GET /api/admin/purge.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import select, func
+
+from models.user import User
+from services.db import get_session, close_session
+from services.member_service import MemberService
+from config.constants import (
+    DELETE_CHUNK_SIZE,
+    PURGE_CHUNK_PAUSE_SECONDS,
+    PURGE_INTERVAL_SECONDS,
+    PURGE_OFF_PEAK_START_HOUR,
+    PURGE_OFF_PEAK_END_HOUR,
+)
+
+logger = logging.getLogger("fittrack.purge")
+
+
+class PurgeService:
+    """Service class that permanently removes soft-deleted members."""
+
+    def __init__(self):
+        """Initialize the PurgeService."""
+        self.member_service = MemberService()
+        self._lock = threading.Lock()
+        self._progress = {
+            "running": False,
+            "current_member_id": None,
+            "current_table": None,
+            "current_table_rows": 0,
+            "members_purged": 0,
+            "rows_deleted": 0,
+            "last_started_at": None,
+            "last_finished_at": None,
+            "last_error": None,
+        }
+
+    def _update(self, **fields):
+        with self._lock:
+            self._progress.update(fields)
+
+    def pending_member_ids(self, limit: int | None = None) -> list[int]:
+        """IDs of soft-deleted members waiting to be purged, oldest deletion first."""
+        session = get_session()
+        try:
+            stmt = (
+                select(User.id)
+                .where(User.deleted_at.is_not(None), User.role == "member")
+                .order_by(User.deleted_at.asc())
+                .limit(limit)
+                .execution_options(include_deleted=True)
+            )
+            return session.execute(stmt).scalars().all()
+        finally:
+            session.close()
+
+    def get_progress(self) -> dict:
+        """Return a snapshot of purge progress plus the current backlog size."""
+        session = get_session()
+        try:
+            pending = session.execute(
+                select(func.count(User.id))
+                .where(User.deleted_at.is_not(None), User.role == "member")
+                .execution_options(include_deleted=True)
+            ).scalar()
+        finally:
+            session.close()
+
+        with self._lock:
+            progress = dict(self._progress)
+        progress["pending_members"] = pending
+        for key in ("last_started_at", "last_finished_at"):
+            if progress[key] is not None:
+                progress[key] = progress[key].isoformat()
+        return progress
+
+    def purge_pending(self, max_members: int | None = None, chunk_size: int = DELETE_CHUNK_SIZE,
+                      pause_seconds: float = PURGE_CHUNK_PAUSE_SECONDS) -> int:
+        """Purge soft-deleted members in chunks.
+
+        Args:
+            max_members: Stop after this many members (None for the whole backlog)
+            chunk_size: Rows deleted and committed per statement
+            pause_seconds: Sleep between chunks to let other writers through
+
+        Returns:
+            Number of members purged in this run (0 if a run was already active)
+        """
+        with self._lock:
+            if self._progress["running"]:
+                return 0
+            self._progress.update(running=True, last_started_at=datetime.utcnow(), last_error=None)
+
+        def on_chunk(table_name: str, rows: int):
+            with self._lock:
+                if self._progress["current_table"] != table_name:
+                    self._progress["current_table"] = table_name
+                    self._progress["current_table_rows"] = 0
+                self._progress["rows_deleted"] += rows - self._progress["current_table_rows"]
+                self._progress["current_table_rows"] = rows
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        purged = 0
+        try:
+            for member_id in self.pending_member_ids(limit=max_members):
+                self._update(current_member_id=member_id, current_table=None, current_table_rows=0)
+                self.member_service.purge_member(member_id, chunk_size=chunk_size, progress=on_chunk)
+                purged += 1
+                with self._lock:
+                    self._progress["members_purged"] += 1
+                logger.info("Purged soft-deleted member %s", member_id)
+        except Exception as e:
+            self._update(last_error=str(e))
+            logger.exception("Member purge failed")
+        finally:
+            self._update(running=False, current_member_id=None, current_table=None,
+                         current_table_rows=0, last_finished_at=datetime.utcnow())
+        return purged
+
+    def start_in_background(self) -> bool:
+        """Run purge_pending once on a background thread.
+
+        Returns:
+            False if a run is already in progress
+        """
+        with self._lock:
+            if self._progress["running"]:
+                return False
+        threading.Thread(target=self._run_once, name="member-purge", daemon=True).start()
+        return True
+
+    def _run_once(self):
+        try:
+            self.purge_pending()
+        finally:
+            close_session()
+
+    @staticmethod
+    def is_off_peak(now: datetime | None = None) -> bool:
+        """Whether the local time falls inside the configured purge window."""
+        hour = (now or datetime.now()).hour
+        if PURGE_OFF_PEAK_START_HOUR <= PURGE_OFF_PEAK_END_HOUR:
+            return PURGE_OFF_PEAK_START_HOUR <= hour < PURGE_OFF_PEAK_END_HOUR
+        return hour >= PURGE_OFF_PEAK_START_HOUR or hour < PURGE_OFF_PEAK_END_HOUR
+
+    def start_scheduler(self, interval_seconds: int = PURGE_INTERVAL_SECONDS) -> threading.Thread:
+        """Start a daemon thread that purges the backlog during off-peak hours."""
+        def loop():
+            while True:
+                if self.is_off_peak():
+                    self._run_once()
+                time.sleep(interval_seconds)
+
+        thread = threading.Thread(target=loop, name="member-purge-scheduler", daemon=True)
+        thread.start()
+        return thread
+
+
+# Shared per-process instance (progress is reported from here)
+purge_service = PurgeService()
@@ -0,0 +1,329 @@
+from datetime import datetime, date, timedelta
+from sqlalchemy import insert
+
+from models.class_schedule import ClassSchedule
+from models.gym_class import GymClass
+from models.session import Session
+from models.trainer import Trainer
+from models.waiting_list import WaitingList
+from services.conflict_index import instructor_index
+from services.db import get_session
+from services.exceptions import NotFoundError, ForbiddenError, BadRequestError, ConflictError
+from config.constants import DEFAULT_SCHEDULE_HORIZON_DAYS
+
+# Schedule fields copied onto every future occurrence by a set-based UPDATE
+OCCURRENCE_FIELDS = ("title", "instructor", "duration_minutes", "capacity")
+# Schedule fields that change *when* occurrences happen
+RULE_FIELDS = ("days_of_week", "start_time", "end_date", "exception_dates")
+
+
+class ScheduleService:
+    """Service class for recurring class schedules.
+
+    A schedule is a weekly rule; its occurrences are ordinary GymClass rows
+    (linked by schedule_id) that are expanded for a horizon and bulk-inserted
+    in a single transaction.
+    """
+
+    def __init__(self):
+        """Initialize the ScheduleService."""
+        pass
+
+    @staticmethod
+    def _serialize_days(days) -> str:
+        """Store weekdays as a comma separated list in calendar order."""
+        unique = sorted(set(days), key=lambda d: d.weekday())
+        return ",".join(d.value for d in unique)
+
+    @staticmethod
+    def _serialize_dates(dates) -> str | None:
+        """Store exception dates as a comma separated list of ISO dates."""
+        if not dates:
+            return None
+        return ",".join(d.isoformat() for d in sorted(set(dates)))
+
+    def _check_trainer(self, session, trainer_id: int | None):
+        """Raise ForbiddenError if the trainer may not manage classes."""
+        if not trainer_id:
+            return
+        trainer = session.query(Trainer).filter(Trainer.id == trainer_id).first()
+        if trainer and not trainer.can_manage_classes():
+            raise ForbiddenError(
+                f"Trainer '{trainer.get_display_name()}' is not authorized to manage classes. "
+                "Status must be 'active'."
+            )
+
+    def _get_schedule(self, session, schedule_id: int) -> ClassSchedule:
+        schedule = session.query(ClassSchedule).filter(ClassSchedule.id == schedule_id).first()
+        if not schedule:
+            raise NotFoundError("Schedule not found")
+        return schedule
+
+    def _expand(self, session, schedule: ClassSchedule, until: date) -> list[dict]:
+        """Build GymClass rows for future occurrences up to `until` that don't exist yet."""
+        now = datetime.utcnow()
+        candidates = [dt for dt in schedule.iter_occurrences(now.date(), until) if dt > now]
+        if not candidates:
+            return []
+
+        existing = {
+            start for (start,) in session.query(GymClass.start_time).filter(
+                GymClass.schedule_id == schedule.id,
+                GymClass.start_time >= candidates[0],
+            )
+        }
+        return [
+            {
+                "title": schedule.title,
+                "instructor": schedule.instructor,
+                "start_time": start,
+                "duration_minutes": schedule.duration_minutes,
+                "capacity": schedule.capacity,
+                "schedule_id": schedule.id,
+            }
+            for start in candidates
+            if start not in existing
+        ]
+
+    def _check_conflicts(self, session, instructor: str, duration_minutes: int, starts, exclude_ids=()):
+        """Check every candidate start against the instructor interval index.
+
+        Raises:
+            ConflictError: Listing every clashing occurrence (nothing is written)
+        """
+        conflicts = []
+        for start in starts:
+            for clash in instructor_index.find_conflicts(
+                session, instructor, start, duration_minutes, exclude_ids=exclude_ids
+            ):
+                conflicts.append({"start_time": start.isoformat(), "conflicts_with": clash})
+        if conflicts:
+            raise ConflictError(
+                f"Instructor '{instructor}' is already booked for {len(conflicts)} occurrence(s)",
+                conflicts=conflicts,
+            )
+
+    def _insert_occurrences(self, session, rows: list[dict]) -> int:
+        """Insert occurrence rows with a single executemany INSERT."""
+        if rows:
+            session.execute(insert(GymClass), rows)
+        return len(rows)
+
+    def create_schedule(
+        self,
+        title: str,
+        instructor: str,
+        days_of_week,
+        start_time,
+        duration_minutes: int,
+        capacity: int,
+        start_date: date,
+        end_date: date | None = None,
+        exception_dates=None,
+        horizon_days: int = DEFAULT_SCHEDULE_HORIZON_DAYS,
+        trainer_id: int | None = None,
+    ) -> tuple[ClassSchedule, int]:
+        """Create a recurring schedule and generate its first occurrences.
+
+        Args:
+            title: Title of the classes
+            instructor: Instructor name
+            days_of_week: List of DayOfWeek values the class runs on
+            start_time: Time of day of every occurrence
+            duration_minutes: Duration in minutes
+            capacity: Maximum capacity of every occurrence
+            start_date: First day of the schedule
+            end_date: Last day of the schedule (None for open-ended)
+            exception_dates: Dates on which the class does not run
+            horizon_days: How many days ahead to generate occurrences
+            trainer_id: ID of trainer creating the schedule (optional for admins)
+
+        Returns:
+            Tuple of (created ClassSchedule, number of occurrences generated)
+
+        Raises:
+            ForbiddenError: If trainer doesn't have permission to manage classes
+            ConflictError: If the instructor is already booked for an occurrence
+        """
+        session = get_session()
+        try:
+            self._check_trainer(session, trainer_id)
+
+            schedule = ClassSchedule(
+                title=title,
+                instructor=instructor,
+                days_of_week=self._serialize_days(days_of_week),
+                start_time=start_time,
+                duration_minutes=duration_minutes,
+                capacity=capacity,
+                start_date=start_date,
+                end_date=end_date,
+                exception_dates=self._serialize_dates(exception_dates),
+            )
+            session.add(schedule)
+            session.flush()
+
+            until = date.today() + timedelta(days=horizon_days)
+            rows = self._expand(session, schedule, until)
+            self._check_conflicts(session, instructor, duration_minutes, [r["start_time"] for r in rows])
+            created = self._insert_occurrences(session, rows)
+
+            session.commit()
+            instructor_index.refresh_instructor(session, instructor)
+            session.refresh(schedule)
+            return schedule, created
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def list_schedules(self):
+        """List all recurring schedules ordered by ID."""
+        session = get_session()
+        try:
+            return session.query(ClassSchedule).order_by(ClassSchedule.id.asc()).all()
+        finally:
+            session.close()
+
+    def get_schedule(self, schedule_id: int) -> ClassSchedule:
+        """Get a specific schedule by ID.
+
+        Raises:
+            NotFoundError: If schedule not found
+        """
+        session = get_session()
+        try:
+            return self._get_schedule(session, schedule_id)
+        finally:
+            session.close()
+
+    def generate_occurrences(self, schedule_id: int, horizon_days: int = DEFAULT_SCHEDULE_HORIZON_DAYS) -> int:
+        """Materialize missing occurrences of a schedule up to the horizon.
+
+        Occurrences that already exist are left untouched, so this is safe to
+        run repeatedly (e.g. from a nightly job to roll the horizon forward).
+
+        Args:
+            schedule_id: The ID of the schedule
+            horizon_days: How many days ahead to generate occurrences
+
+        Returns:
+            Number of occurrences created
+
+        Raises:
+            NotFoundError: If schedule not found
+            ConflictError: If the instructor is already booked for an occurrence
+        """
+        session = get_session()
+        try:
+            schedule = self._get_schedule(session, schedule_id)
+            until = date.today() + timedelta(days=horizon_days)
+            rows = self._expand(session, schedule, until)
+            self._check_conflicts(session, schedule.instructor, schedule.duration_minutes, [r["start_time"] for r in rows])
+            created = self._insert_occurrences(session, rows)
+            session.commit()
+            instructor_index.refresh_instructor(session, schedule.instructor)
+            return created
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def update_schedule(self, schedule_id: int, changes: dict, trainer_id: int | None = None) -> tuple[ClassSchedule, dict]:
+        """Update a schedule and apply the change to its future occurrences only.
+
+        Title, instructor, duration and capacity are pushed to future
+        occurrences with one UPDATE. Rule changes (days, time, end date,
+        exceptions) delete future occurrences that no longer match and insert
+        the new ones; past occurrences are never modified.
+
+        Args:
+            schedule_id: The ID of the schedule
+            changes: Fields to update (keys of ScheduleUpdate that were set)
+            trainer_id: ID of trainer editing the schedule (optional for admins)
+
+        Returns:
+            Tuple of (updated ClassSchedule, {"updated": n, "removed": n, "created": n})
+
+        Raises:
+            NotFoundError: If schedule not found
+            ForbiddenError: If trainer doesn't have permission to manage classes
+            BadRequestError: If end_date is before start_date, or a removed occurrence
+                still has active registrations
+            ConflictError: If the instructor is already booked for a moved occurrence
+        """
+        session = get_session()
+        try:
+            self._check_trainer(session, trainer_id)
+            schedule = self._get_schedule(session, schedule_id)
+            old_instructor = schedule.instructor
+
+            end_date = changes.get("end_date")
+            if end_date is not None and end_date < schedule.start_date:
+                raise BadRequestError("end_date must not be before start_date")
+
+            now = datetime.utcnow()
+            future = (GymClass.schedule_id == schedule_id, GymClass.start_time > now)
+            existing = session.query(GymClass.id, GymClass.start_time).filter(*future).all()
+            own_ids = {class_id for class_id, _ in existing}
+
+            for field, value in changes.items():
+                if field == "days_of_week":
+                    value = self._serialize_days(value)
+                elif field == "exception_dates":
+                    value = self._serialize_dates(value)
+                setattr(schedule, field, value)
+            session.flush()
+
+            summary = {"updated": 0, "removed": 0, "created": 0}
+            stale_ids = []
+            new_rows = []
+
+            if any(f in changes for f in RULE_FIELDS):
+                until = max(
+                    (start.date() for _, start in existing),
+                    default=now.date() + timedelta(days=DEFAULT_SCHEDULE_HORIZON_DAYS),
+                )
+                expected = set(schedule.iter_occurrences(now.date(), until))
+                stale_ids = [class_id for class_id, start in existing if start not in expected]
+                new_rows = self._expand(session, schedule, until)
+
+            # Occurrences moving with the series never conflict with each other
+            starts = [r["start_time"] for r in new_rows]
+            if "instructor" in changes or "duration_minutes" in changes:
+                starts += [start for class_id, start in existing if class_id not in stale_ids]
+            self._check_conflicts(session, schedule.instructor, schedule.duration_minutes, starts, exclude_ids=own_ids)
+
+            occurrence_values = {f: changes[f] for f in OCCURRENCE_FIELDS if f in changes}
+            if occurrence_values:
+                summary["updated"] = session.query(GymClass).filter(*future).update(
+                    occurrence_values, synchronize_session=False
+                )
+
+            if stale_ids:
+                booked = session.query(Session.id).filter(
+                    Session.gym_class_id.in_(stale_ids),
+                    Session.status == "active",
+                ).first()
+                if booked:
+                    raise BadRequestError(
+                        "Cannot reschedule: future occurrences that would be removed have active registrations"
+                    )
+                session.query(WaitingList).filter(WaitingList.gym_class_id.in_(stale_ids)).delete(synchronize_session=False)
+                session.query(Session).filter(Session.gym_class_id.in_(stale_ids)).delete(synchronize_session=False)
+                summary["removed"] = session.query(GymClass).filter(GymClass.id.in_(stale_ids)).delete(synchronize_session=False)
+
+            summary["created"] = self._insert_occurrences(session, new_rows)
+
+            session.commit()
+            for instructor in {old_instructor, schedule.instructor}:
+                instructor_index.refresh_instructor(session, instructor)
+            session.refresh(schedule)
+            return schedule, summary
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
@@ -1,9 +1,13 @@
 from datetime import datetime
+from sqlalchemy import exists, func, insert, select, update, or_
+from models.gym_class import GymClass
 from models.session import Session
 from models.member import Member
+from models.waiting_list import WaitingList
 from services.db import get_session
 from services.exceptions import NotFoundError, DuplicateError
 from services.class_service import ClassService
+from config.constants import RegistrationMode
 
 
 class SessionService:
@@ -27,10 +31,14 @@ class SessionService:
             NotFoundError: If class or member not found
             DuplicateError: If member already registered or class is full
         """
-        gym_class = self.class_service.get_class(class_id)
-        
         session = get_session()
         try:
+            # Same class-row lock as register_members_bulk, so single and bulk
+            # registrations serialize on the seat count and cannot overbook each other
+            gym_class = session.query(GymClass).filter(GymClass.id == class_id).with_for_update().first()
+            if not gym_class:
+                raise NotFoundError("Class not found")
+
             member = session.query(Member).filter(Member.id == member_id).first()
             if not member:
                 raise NotFoundError("Member not found")
@@ -68,6 +76,199 @@ class SessionService:
         finally:
             session.close()
 
+    def register_members_bulk(
+        self,
+        class_id: int,
+        member_ids: list[int],
+        mode: RegistrationMode = RegistrationMode.ALL_OR_NOTHING,
+        waitlist_overflow: bool = False,
+    ) -> dict:
+        """Register a batch of members to a gym class in one transaction.
+
+        Existence and duplicate checks are single IN-queries for the whole
+        batch. The class row is locked (SELECT ... FOR UPDATE) while free seats
+        are counted and taken, so concurrent registrations cannot overbook.
+
+        Args:
+            class_id: The ID of the gym class
+            member_ids: Members to register; request order decides who gets the last seats
+            mode: ALL_OR_NOTHING fails the whole batch on any problem,
+                BEST_EFFORT registers whoever fits and reports the rest
+            waitlist_overflow: Put members that don't fit on the waiting list
+
+        Returns:
+            Dictionary with registered, waitlisted, already_registered and
+            not_found member ID lists, and rejected [{"member_id", "reason"}]
+            entries for members that got neither a seat nor a new waitlist spot
+
+        Raises:
+            NotFoundError: If class not found, or (all-or-nothing) a member is not found
+            DuplicateError: (all-or-nothing) If a member is already registered or
+                the class doesn't have enough free seats
+        """
+        mode = RegistrationMode(mode)
+        session = get_session()
+        try:
+            gym_class = session.query(GymClass).filter(GymClass.id == class_id).with_for_update().first()
+            if not gym_class:
+                raise NotFoundError("Class not found")
+
+            found = {member_id for (member_id,) in session.query(Member.id).filter(Member.id.in_(member_ids))}
+            existing = {
+                member_id: (session_id, status)
+                for session_id, member_id, status in session.query(
+                    Session.id, Session.member_id, Session.status
+                ).filter(Session.gym_class_id == class_id, Session.member_id.in_(member_ids))
+            }
+            active_count = session.query(func.count(Session.id)).filter(
+                Session.gym_class_id == class_id,
+                Session.status == "active"
+            ).scalar()
+
+            not_found = [m for m in member_ids if m not in found]
+            already_registered = [m for m in member_ids if m in existing and existing[m][1] == "active"]
+            candidates = [m for m in member_ids if m in found and m not in already_registered]
+
+            free_seats = max(0, gym_class.capacity - active_count)
+            seated, overflow = candidates[:free_seats], candidates[free_seats:]
+
+            if mode == RegistrationMode.ALL_OR_NOTHING:
+                if not_found:
+                    raise NotFoundError(f"Members not found: {not_found}")
+                if already_registered:
+                    raise DuplicateError(f"Members already registered: {already_registered}")
+                if overflow and not waitlist_overflow:
+                    raise DuplicateError(
+                        f"Class is full: {len(candidates)} requested, {free_seats} seats available"
+                    )
+
+            now = datetime.utcnow()
+            reactivate_ids = [existing[m][0] for m in seated if m in existing]
+            if reactivate_ids:
+                session.query(Session).filter(Session.id.in_(reactivate_ids)).update(
+                    {"status": "active", "canceled_at": None, "registered_at": now},
+                    synchronize_session=False
+                )
+            new_rows = [
+                {"gym_class_id": class_id, "member_id": m, "status": "active", "registered_at": now}
+                for m in seated if m not in existing
+            ]
+            if new_rows:
+                session.execute(insert(Session), new_rows)
+
+            waitlisted, rejected = [], []
+            if overflow and waitlist_overflow:
+                queued = {
+                    member_id for (member_id,) in session.query(WaitingList.member_id).filter(
+                        WaitingList.gym_class_id == class_id,
+                        WaitingList.member_id.in_(overflow)
+                    )
+                }
+                waitlisted = [m for m in overflow if m not in queued]
+                rejected = [{"member_id": m, "reason": "Already on waiting list"} for m in overflow if m in queued]
+                if waitlisted:
+                    session.execute(insert(WaitingList), [
+                        {"gym_class_id": class_id, "member_id": m, "joined_at": now} for m in waitlisted
+                    ])
+            elif overflow:
+                rejected = [{"member_id": m, "reason": "Class is full"} for m in overflow]
+
+            session.commit()
+            return {
+                "class_id": class_id,
+                "mode": mode.value,
+                "registered": seated,
+                "waitlisted": waitlisted,
+                "already_registered": already_registered,
+                "not_found": not_found,
+                "rejected": rejected,
+            }
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def mark_attendance(self, class_id: int, attended_ids: list[int], no_show_ids: list[int]) -> dict:
+        """Record attendance for a class with set-based updates.
+
+        Sessions are updated with one UPDATE per list. Each member's
+        no_show_count is adjusted only for sessions whose outcome actually
+        changes, so re-submitting the same attendance is idempotent.
+
+        Args:
+            class_id: The ID of the gym class
+            attended_ids: Members who showed up
+            no_show_ids: Members who were registered but did not show up
+
+        Returns:
+            Dictionary with counts of attended/no-show sessions updated and
+            the IDs that have no active registration in the class
+
+        Raises:
+            NotFoundError: If class not found
+        """
+        session = get_session()
+        try:
+            if session.get(GymClass, class_id) is None:
+                raise NotFoundError("Class not found")
+
+            active = (Session.gym_class_id == class_id, Session.status == "active")
+            requested = attended_ids + no_show_ids
+            registered = {
+                member_id for (member_id,) in session.query(Session.member_id).filter(
+                    *active, Session.member_id.in_(requested)
+                )
+            }
+            members = Member.__table__
+
+            # Adjust counters first - the subqueries read the previous attendance state
+            if no_show_ids:
+                newly_no_show = select(Session.member_id).where(
+                    *active,
+                    Session.member_id.in_(no_show_ids),
+                    or_(Session.attendance_marked_at.is_(None), Session.attended.is_(True)),
+                )
+                session.execute(
+                    update(members).where(members.c.id.in_(newly_no_show))
+                    .values(no_show_count=members.c.no_show_count + 1)
+                )
+            if attended_ids:
+                was_no_show = select(Session.member_id).where(
+                    *active,
+                    Session.member_id.in_(attended_ids),
+                    Session.attendance_marked_at.is_not(None),
+                    Session.attended.is_(False),
+                )
+                session.execute(
+                    update(members).where(members.c.id.in_(was_no_show))
+                    .values(no_show_count=members.c.no_show_count - 1)
+                )
+
+            now = datetime.utcnow()
+            attended_count = no_show_count = 0
+            if attended_ids:
+                attended_count = session.query(Session).filter(
+                    *active, Session.member_id.in_(attended_ids)
+                ).update({"attended": True, "attendance_marked_at": now}, synchronize_session=False)
+            if no_show_ids:
+                no_show_count = session.query(Session).filter(
+                    *active, Session.member_id.in_(no_show_ids)
+                ).update({"attended": False, "attendance_marked_at": now}, synchronize_session=False)
+
+            session.commit()
+            return {
+                "class_id": class_id,
+                "attended": attended_count,
+                "no_show": no_show_count,
+                "not_registered": [m for m in requested if m not in registered],
+            }
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def cancel_registration(self, class_id: int, member_id: int) -> Session:
         """Cancel a member's registration to a gym class.
         
@@ -104,6 +305,48 @@ class SessionService:
         finally:
             session.close()
 
+    def is_registered(self, class_id: int, member_id: int) -> bool:
+        """Check whether a member holds an active registration in a class.
+
+        Runs a single EXISTS query on the (gym_class_id, member_id, status)
+        index instead of loading the participant list.
+
+        Args:
+            class_id: The ID of the gym class
+            member_id: The ID of the member
+
+        Returns:
+            True if the member is actively registered
+        """
+        session = get_session()
+        try:
+            return session.query(exists().where(
+                Session.gym_class_id == class_id,
+                Session.member_id == member_id,
+                Session.status == "active",
+            )).scalar()
+        finally:
+            session.close()
+
+    def get_class_sessions(self, class_id: int):
+        """Get all registrations (any status) for a gym class.
+
+        Args:
+            class_id: The ID of the gym class
+
+        Returns:
+            List of Session objects
+        """
+        self.class_service.get_class(class_id)
+
+        session = get_session()
+        try:
+            return session.query(Session).filter(
+                Session.gym_class_id == class_id
+            ).order_by(Session.id.asc()).all()
+        finally:
+            session.close()
+
     def get_participants(self, class_id: int):
         """Get all active participants in a gym class.
         
@@ -117,11 +360,10 @@ class SessionService:
         
         session = get_session()
         try:
-            sessions = session.query(Session).filter(
+            return session.query(Member).join(Session, Session.member_id == Member.id).filter(
                 Session.gym_class_id == class_id,
                 Session.status == "active"
-            ).all()
-            return [s.member for s in sessions]
+            ).order_by(Session.id.asc()).all()
         finally:
             session.close()
 
@@ -135,23 +377,11 @@ class SessionService:
             Dictionary with class statistics
         """
         gym_class = self.class_service.get_class(class_id)
-        
-        session = get_session()
-        try:
-            active_count = session.query(Session).filter(
-                Session.gym_class_id == class_id,
-                Session.status == "active"
-            ).count()
-            canceled_count = session.query(Session).filter(
-                Session.gym_class_id == class_id,
-                Session.status == "canceled"
-            ).count()
-            return {
-                "class_id": class_id,
-                "capacity": gym_class.capacity,
-                "active_registrations": active_count,
-                "canceled_registrations": canceled_count,
-                "available_slots": max(0, gym_class.capacity - active_count),
-            }
-        finally:
-            session.close()
+        counts = self.class_service.get_registration_counts([class_id])[class_id]
+        return {
+            "class_id": class_id,
+            "capacity": gym_class.capacity,
+            "active_registrations": counts["active"],
+            "canceled_registrations": counts["canceled"],
+            "available_slots": max(0, gym_class.capacity - counts["active"]),
+        }
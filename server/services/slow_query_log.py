@@ -0,0 +1,179 @@
+"""Slow-query log with background EXPLAIN capture.
+
+Statements slower than the threshold (FITTRACK_SLOW_QUERY_MS, default
+SLOW_QUERY_THRESHOLD_MS) are grouped by shape - the parameterized SQL with
+IN-lists collapsed - and aggregated: count, total and max time, the routes and
+service methods that issued them, and the last few samples. Samples hold the
+timing and endpoint but never parameter values: those include password hashes
+and personal data, and the log is served over the admin API.
+
+The first time a shape is seen its plan is captured on a background thread
+(EXPLAIN on MySQL, EXPLAIN QUERY PLAN on SQLite), so the request that hit the
+slow statement never pays for it. GET /api/admin/slow-queries lists the top
+offenders by total time together with their plans.
+"""
+import logging
+import os
+import queue
+import re
+import threading
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+
+from flask import has_request_context, request
+from sqlalchemy.pool import StaticPool
+
+from services.sql_stats import statement_listeners
+from config.constants import SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_MAX_SHAPES, SLOW_QUERY_SAMPLES_PER_SHAPE
+
+logger = logging.getLogger("fittrack.slow_queries")
+
+_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IN_LIST_RE = re.compile(r"IN \((?:\s*(?:\?|%s|%\(\w+\)s)\s*,)+\s*(?:\?|%s|%\(\w+\)s)\s*\)", re.IGNORECASE)
+_EXPLAINABLE = ("select", "update", "delete", "with")
+# Frames in these modules are plumbing, not the code that issued the query
+_SKIP_ORIGINS = ("services/db.py", "services/sql_stats.py", "services/slow_query_log.py")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so calls differing only in IN-list length group together."""
+    return _IN_LIST_RE.sub("IN (...)", " ".join(statement.split()))
+
+
+def _origin() -> str | None:
+    """The innermost application frame (service or route) that issued the statement."""
+    for frame in reversed(traceback.extract_stack()):
+        path = os.path.abspath(frame.filename)
+        if not path.startswith(_SERVER_DIR):
+            continue
+        relative = os.path.relpath(path, _SERVER_DIR).replace(os.sep, "/")
+        if relative.endswith(_SKIP_ORIGINS):
+            continue
+        return f"{relative}:{frame.lineno} {frame.name}"
+    return None
+
+
+class SlowQueryLog:
+    """Aggregates slow statements per shape and captures their plans."""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, max_shapes: int = SLOW_QUERY_MAX_SHAPES):
+        """Initialize the SlowQueryLog.
+
+        Args:
+            threshold_ms: Statements at or above this duration are recorded
+            max_shapes: Distinct shapes kept; new shapes are dropped beyond this
+        """
+        self.threshold_ms = threshold_ms
+        self.max_shapes = max_shapes
+        self.engine = None
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._explain_queue = queue.Queue()
+        self._worker = None
+
+    def attach(self, engine):
+        """Start recording statements executed on `engine` (called from init_db)."""
+        self.engine = engine
+        if self.record not in statement_listeners:
+            statement_listeners.append(self.record)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._explain_loop, name="slow-query-explain", daemon=True)
+            self._worker.start()
+
+    def record(self, statement: str, parameters, seconds: float):
+        """sql_stats statement listener; cheap no-op for fast statements."""
+        elapsed_ms = seconds * 1000
+        if elapsed_ms < self.threshold_ms or threading.current_thread() is self._worker:
+            return
+
+        shape = statement_shape(statement)
+        endpoint = request.endpoint if has_request_context() else None
+        origin = _origin()
+        sample = {
+            "ms": round(elapsed_ms, 2),
+            "endpoint": endpoint,
+            "at": datetime.utcnow().isoformat(),
+        }
+
+        with self._lock:
+            entry = self._entries.get(shape)
+            if entry is None:
+                if len(self._entries) >= self.max_shapes:
+                    return
+                entry = self._entries[shape] = {
+                    "statement": shape,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "endpoints": Counter(),
+                    "origins": Counter(),
+                    "samples": deque(maxlen=SLOW_QUERY_SAMPLES_PER_SHAPE),
+                    "plan": None,
+                    "plan_error": None,
+                }
+                if statement.lstrip().lower().startswith(_EXPLAINABLE):
+                    self._explain_queue.put((shape, statement, parameters))
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            if endpoint:
+                entry["endpoints"][endpoint] += 1
+            if origin:
+                entry["origins"][origin] += 1
+            entry["samples"].append(sample)
+
+        logger.warning("Slow query (%.1f ms) from %s: %s", elapsed_ms, origin or endpoint, shape[:300])
+
+    def _explain_loop(self):
+        while True:
+            shape, statement, parameters = self._explain_queue.get()
+            plan, error = None, None
+            try:
+                plan = self._explain(statement, parameters)
+            except Exception as e:
+                error = str(e)[:500]
+            with self._lock:
+                entry = self._entries.get(shape)
+                if entry is not None:
+                    entry["plan"], entry["plan_error"] = plan, error
+
+    def _explain(self, statement: str, parameters) -> list[dict]:
+        if isinstance(parameters, list):
+            # executemany: one parameter set is enough for a plan
+            parameters = parameters[0] if parameters else ()
+        if isinstance(self.engine.pool, StaticPool):
+            raise RuntimeError("EXPLAIN skipped: in-memory SQLite shares one connection with requests")
+        prefix = "EXPLAIN QUERY PLAN " if self.engine.dialect.name == "sqlite" else "EXPLAIN "
+        with self.engine.connect() as conn:
+            result = conn.exec_driver_sql(prefix + statement, parameters or ())
+            return [dict(row._mapping) for row in result]
+
+    def top(self, limit: int = 20) -> list[dict]:
+        """Slow statement shapes ordered by total time, worst first."""
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e["total_ms"], reverse=True)[:limit]
+            return [
+                {
+                    "statement": e["statement"],
+                    "count": e["count"],
+                    "total_ms": round(e["total_ms"], 2),
+                    "avg_ms": round(e["total_ms"] / e["count"], 2),
+                    "max_ms": round(e["max_ms"], 2),
+                    "endpoints": dict(e["endpoints"].most_common(5)),
+                    "origins": dict(e["origins"].most_common(5)),
+                    "samples": list(e["samples"]),
+                    "plan": e["plan"],
+                    "plan_error": e["plan_error"],
+                }
+                for e in entries
+            ]
+
+    def reset(self):
+        """Forget all recorded statements."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared per-process log
+slow_query_log = SlowQueryLog(threshold_ms=float(os.getenv("FITTRACK_SLOW_QUERY_MS", SLOW_QUERY_THRESHOLD_MS)))
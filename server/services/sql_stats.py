@@ -0,0 +1,163 @@
+"""Per-request SQL instrumentation.
+
+instrument_engine() hooks the engine's cursor events (called from init_db);
+register_request_hooks() starts a RequestSqlStats for every Flask request
+and, after it, reports query count, total DB time, the slowest statements
+and any statement executed N_PLUS_ONE_THRESHOLD or more times (the usual
+N+1 shape). Every request gets one structured "sql" log line; in debug mode
+the numbers are also sent back as Server-Timing / X-Query-Count headers.
+
+Exceeding the endpoint's query budget (DEFAULT_QUERY_BUDGET, or the value
+set with @query_budget on the view) logs a warning.
+"""
+import heapq
+import json
+import logging
+import time
+from collections import Counter
+from functools import wraps
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from config.constants import DEFAULT_QUERY_BUDGET, N_PLUS_ONE_THRESHOLD, SLOWEST_STATEMENTS_TRACKED
+
+logger = logging.getLogger("fittrack.sql")
+
+# Callbacks invoked with (statement, parameters, duration_seconds) for every statement, request or not
+statement_listeners = []
+
+# Transaction control sent as SQL (SQLite's explicit BEGIN, savepoints) is not counted as a query,
+# so query counts are the same on every backend
+TRANSACTION_CONTROL_PREFIXES = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+class RequestSqlStats:
+    """SQL statistics for a single request."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes = Counter()
+        self._slowest = []  # min-heap of (seconds, sequence, statement)
+
+    def record(self, statement: str, seconds: float):
+        """Record one executed statement (SQLAlchemy statements are already parameterized)."""
+        self.count += 1
+        self.total_seconds += seconds
+        self.shapes[statement] += 1
+        entry = (seconds, self.count, statement)
+        if len(self._slowest) < SLOWEST_STATEMENTS_TRACKED:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    def slowest(self) -> list[dict]:
+        """Slowest statements, slowest first."""
+        return [
+            {"ms": round(seconds * 1000, 2), "statement": _shorten(statement)}
+            for seconds, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list[dict]:
+        """Statements executed at least `threshold` times (likely N+1 loops)."""
+        return [
+            {"count": count, "statement": _shorten(statement)}
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+def _shorten(statement: str, limit: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def query_budget(max_queries: int):
+    """Set the per-request query budget for a view (defaults to DEFAULT_QUERY_BUDGET).
+
+    Usage: @query_budget(10) directly below the route decorator.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            return f(*args, **kwargs)
+        decorated_function.query_budget = max_queries
+        return decorated_function
+    return decorator
+
+
+def instrument_engine(engine):
+    """Time every statement executed on `engine` and feed the active request's stats."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+        if statement.lstrip()[:9].upper().startswith(TRANSACTION_CONTROL_PREFIXES):
+            return
+        if has_request_context():
+            stats = g.get("sql_stats")
+            if stats is not None:
+                stats.record(statement, seconds)
+        for listener in statement_listeners:
+            listener(statement, parameters, seconds)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute; drop its start time
+        conn = exception_context.connection
+        if conn is not None and exception_context.execution_context is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+def register_request_hooks(app):
+    """Collect and report SQL statistics for every request."""
+
+    @app.before_request
+    def start_sql_stats():
+        g.sql_stats = RequestSqlStats()
+
+    @app.after_request
+    def report_sql_stats(response):
+        stats = g.pop("sql_stats", None)
+        if stats is None:
+            return response
+
+        view = app.view_functions.get(request.endpoint)
+        budget = getattr(view, "query_budget", DEFAULT_QUERY_BUDGET)
+        repeated = stats.repeated()
+        db_ms = round(stats.total_seconds * 1000, 2)
+
+        record = {
+            "event": "sql",
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "queries": stats.count,
+            "db_ms": db_ms,
+            "budget": budget,
+            "slowest": stats.slowest(),
+        }
+        if repeated:
+            record["n_plus_one"] = repeated
+        logger.info(json.dumps(record))
+
+        if stats.count > budget:
+            logger.warning("Query budget exceeded on %s: %d queries (budget %d)",
+                           request.endpoint, stats.count, budget)
+        if repeated:
+            logger.warning("Possible N+1 on %s: %s", request.endpoint,
+                           "; ".join(f"{r['count']}x {r['statement']}" for r in repeated))
+
+        if app.debug:
+            response.headers["Server-Timing"] = f'db;dur={db_ms};desc="{stats.count} queries"'
+            response.headers["X-Query-Count"] = str(stats.count)
+            if repeated:
+                response.headers["X-N-Plus-One"] = str(len(repeated))
+        return response
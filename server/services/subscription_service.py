@@ -14,6 +14,16 @@ class SubscriptionService:
         """Initialize the SubscriptionService."""
         pass
 
+    @staticmethod
+    def _find_subscription(session, subscription_id: int) -> Subscription | None:
+        """Load a subscription unless its member is soft-deleted (the join applies the filter)."""
+        return (
+            session.query(Subscription)
+            .join(Member, Member.id == Subscription.member_id)
+            .filter(Subscription.id == subscription_id)
+            .first()
+        )
+
     def list_member_subscriptions(self, member_id: int):
         """List all subscriptions for a specific member.
         
@@ -49,7 +59,7 @@ class SubscriptionService:
         """
         session = get_session()
         try:
-            sub = session.query(Subscription).filter(Subscription.id == subscription_id).first()
+            sub = self._find_subscription(session, subscription_id)
             if not sub:
                 raise NotFoundError("Subscription not found")
             return sub
@@ -127,7 +137,7 @@ class SubscriptionService:
         """
         session = get_session()
         try:
-            sub = session.query(Subscription).filter(Subscription.id == subscription_id).first()
+            sub = self._find_subscription(session, subscription_id)
             if not sub:
                 raise NotFoundError("Subscription not found")
                 
@@ -154,7 +164,7 @@ class SubscriptionService:
         """
         session = get_session()
         try:
-            sub = session.query(Subscription).filter(Subscription.id == subscription_id).first()
+            sub = self._find_subscription(session, subscription_id)
             if not sub:
                 raise NotFoundError("Subscription not found")
                 
@@ -180,7 +190,7 @@ class SubscriptionService:
         """
         session = get_session()
         try:
-            sub = session.query(Subscription).filter(Subscription.id == subscription_id).first()
+            sub = self._find_subscription(session, subscription_id)
             if not sub:
                 raise NotFoundError("Subscription not found")
             
@@ -206,7 +216,7 @@ class SubscriptionService:
             return {"member_id": member_id, "has_subscription": False, "status": "none"}
 
         sub = subs[-1]
-        sub.recompute_status()
+        status = sub.current_status()
 
         today = date.today()
         days_left = (sub.end_date - today).days
@@ -217,7 +227,7 @@ class SubscriptionService:
             "member_id": member_id,
             "has_subscription": True,
             "subscription_id": sub.id,
-            "status": sub.status,
+            "status": status,
             "days_left": days_left,
             "remaining_entries": sub.remaining_entries,
             "frozen_until": sub.frozen_until.isoformat() if sub.frozen_until else None,
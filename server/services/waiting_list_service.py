@@ -1,3 +1,6 @@
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
 from services.db import get_session
 from services.exceptions import NotFoundError, DuplicateError
 from models.waiting_list import WaitingList
@@ -6,12 +9,32 @@ from models.member import Member
 
 
 class WaitingListService:
-    """Service for managing gym class waiting lists."""
+    """Service for managing gym class waiting lists.
+
+    Queue order is WaitingList.id: the database hands out ids monotonically, so
+    concurrent joins can never collide on a position and removals never leave
+    gaps. The (gym_class_id, member_id) unique constraint rejects double joins.
+    """
 
     def __init__(self):
         """Initialize the WaitingListService."""
         pass
 
+    def _position_of(self, session, entry: WaitingList) -> int:
+        """Return the 1-based rank of an entry within its class queue."""
+        return session.query(func.count(WaitingList.id)).filter(
+            WaitingList.gym_class_id == entry.gym_class_id,
+            WaitingList.id <= entry.id
+        ).scalar()
+
+    @staticmethod
+    def _check_exists(session, class_id: int, member_id: int):
+        """Raise NotFoundError if the class or (non-deleted) member does not exist."""
+        if session.get(GymClass, class_id) is None:
+            raise NotFoundError("Class not found")
+        if session.get(Member, member_id) is None:
+            raise NotFoundError("Member not found")
+
     def add_to_waitlist(self, class_id: int, member_id: int) -> WaitingList:
         """Add a member to the waiting list for a class.
         
@@ -28,37 +51,25 @@ class WaitingListService:
         """
         session = get_session()
         try:
-            # Verify class exists
-            gym_class = session.query(GymClass).filter(GymClass.id == class_id).first()
-            if not gym_class:
-                raise NotFoundError("Class not found")
-
-            # Verify member exists
-            member = session.query(Member).filter(Member.id == member_id).first()
-            if not member:
-                raise NotFoundError("Member not found")
-
-            # Check if already on waiting list
-            existing = session.query(WaitingList).filter(
-                WaitingList.gym_class_id == class_id,
-                WaitingList.member_id == member_id
-            ).first()
-            if existing:
+            # INSERT first - the unique constraint rejects duplicates and the foreign
+            # keys reject unknown ids. Writing before reading also means the transaction
+            # takes its write lock up front (SQLite cannot upgrade a read snapshot that
+            # a concurrent join has already made stale).
+            entry = WaitingList(gym_class_id=class_id, member_id=member_id)
+            session.add(entry)
+            try:
+                session.flush()
+            except IntegrityError:
+                session.rollback()
+                self._check_exists(session, class_id, member_id)
                 raise DuplicateError("Member already on waiting list")
 
-            # Get next position
-            max_position = session.query(WaitingList).filter(
-                WaitingList.gym_class_id == class_id
-            ).count()
-
-            entry = WaitingList(
-                gym_class_id=class_id,
-                member_id=member_id,
-                position=max_position + 1
-            )
-            session.add(entry)
+            # Soft-deleted members still satisfy the foreign key
+            self._check_exists(session, class_id, member_id)
             session.commit()
+
             session.refresh(entry)
+            entry.position = self._position_of(session, entry)
             return entry
         except Exception:
             session.rollback()
@@ -73,13 +84,20 @@ class WaitingListService:
             class_id: The ID of the gym class
             
         Returns:
-            List of WaitingList entries
+            List of WaitingList entries with position set
         """
         session = get_session()
         try:
-            return session.query(WaitingList).filter(
+            position = func.row_number().over(order_by=WaitingList.id.asc()).label("position")
+            rows = session.query(WaitingList, position).filter(
                 WaitingList.gym_class_id == class_id
-            ).order_by(WaitingList.position.asc()).all()
+            ).order_by(WaitingList.id.asc()).all()
+
+            entries = []
+            for entry, rank in rows:
+                entry.position = rank
+                entries.append(entry)
+            return entries
         finally:
             session.close()
 
@@ -95,15 +113,14 @@ class WaitingListService:
         """
         session = get_session()
         try:
-            entry = session.query(WaitingList).filter(
+            deleted = session.query(WaitingList).filter(
                 WaitingList.gym_class_id == class_id,
                 WaitingList.member_id == member_id
-            ).first()
-            
-            if not entry:
+            ).delete(synchronize_session=False)
+
+            if not deleted:
                 raise NotFoundError("Waiting list entry not found")
 
-            session.delete(entry)
             session.commit()
         except Exception:
             session.rollback()
@@ -122,8 +139,11 @@ class WaitingListService:
         """
         session = get_session()
         try:
-            return session.query(WaitingList).filter(
+            entry = session.query(WaitingList).filter(
                 WaitingList.gym_class_id == class_id
-            ).order_by(WaitingList.position.asc()).first()
+            ).order_by(WaitingList.id.asc()).first()
+            if entry is not None:
+                entry.position = 1
+            return entry
         finally:
             session.close()
@@ -0,0 +1,161 @@
+"""
+Transactional pytest fixtures.
+
+The schema is created once per test session (in-memory SQLite unless
+TEST_DATABASE_URL is set) and template data is committed once. Each test
+then runs inside an outer transaction on a single connection that the app's
+scoped session is bound to with join_transaction_mode="create_savepoint":
+every commit made by services or routes only releases a SAVEPOINT, and the
+outer transaction is rolled back when the test ends. Tests therefore always
+start from the template data, without dropping or reseeding anything.
+
+Usage:
+    def test_get_member(client, template_data, auth_headers):
+        member_id = template_data["members"][0]
+        response = client.get(f"/api/members/{member_id}", headers=auth_headers("admin"))
+        assert response.status_code == 200
+"""
+import os
+
+# Must be set before the app (and its engine) is imported
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", "sqlite://")
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+os.environ.pop("FITTRACK_PURGER", None)
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import create_app
+from services import db
+from services.conflict_index import instructor_index
+from services.password_hasher import hash_password
+from models.admin import Admin
+from models.gym_class import GymClass
+from models.member import Member
+from models.plan import Plan
+from models.reception import Reception
+from models.trainer import Trainer
+
+# Password of every template user (hashed once per session)
+TEMPLATE_PASSWORD = "Passw0rd!"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The Flask app; creating it initializes the engine and creates the schema once."""
+    flask_app = create_app()
+    flask_app.config.update(TESTING=True)
+    return flask_app
+
+
+@pytest.fixture(scope="session")
+def template_data(app):
+    """Commit the shared template rows once; returns their IDs.
+
+    Tests may modify these rows freely - the per-test rollback restores them.
+    """
+    password_hash = hash_password(TEMPLATE_PASSWORD)
+    now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    session = db.get_session()
+    try:
+        members = [
+            Member(first_name=f"Member{i}", last_name="Test", email=f"member{i}@example.com",
+                   phone="0501234567", national_id=f"{100000000 + i}", password_hash=password_hash)
+            for i in range(5)
+        ]
+        admin = Admin(first_name="Admin", last_name="Test", email="admin@example.com",
+                      phone="0501234567", password_hash=password_hash, access_level="full")
+        trainer = Trainer(first_name="Trainer", last_name="Test", email="trainer@example.com",
+                          phone="0501234567", password_hash=password_hash)
+        reception = Reception(first_name="Reception", last_name="Test", email="reception@example.com",
+                              phone="0501234567")
+        plan = Plan(name="Monthly", type="time", price=250, valid_days=30)
+        classes = [
+            GymClass(title=f"Class {i}", instructor="Trainer Test",
+                     start_time=now + timedelta(days=1, hours=2 * i), duration_minutes=60, capacity=10)
+            for i in range(3)
+        ]
+        session.add_all(members + [admin, trainer, reception, plan] + classes)
+        session.commit()
+
+        return {
+            "members": [m.id for m in members],
+            "admin": admin.id,
+            "trainer": trainer.id,
+            "reception": reception.id,
+            "plan": plan.id,
+            "classes": [c.id for c in classes],
+        }
+    finally:
+        session.close()
+        db.close_session()
+
+
+@pytest.fixture
+def db_connection(app, template_data):
+    """Run the test inside an outer transaction that is rolled back afterwards."""
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    db.close_session()
+    db.SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    # In-process caches must not leak rows from a rolled-back test
+    instructor_index.invalidate()
+    try:
+        yield connection
+    finally:
+        db.close_session()
+        db.SessionLocal.configure(bind=db.engine, join_transaction_mode="conservative_savepoint")
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
+        instructor_index.invalidate()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """The scoped session services use, bound to the test transaction."""
+    return db.get_session()
+
+
+@pytest.fixture
+def client(app, db_connection):
+    """Flask test client whose requests share the test transaction."""
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(template_data):
+    """Build X-User-ID headers: auth_headers("admin"), auth_headers("member", 2) or auth_headers(user_id=7)."""
+    def build(role: str | None = None, index: int = 0, user_id: int | None = None) -> dict:
+        if user_id is None:
+            user_id = template_data["members"][index] if role == "member" else template_data[role]
+        return {"X-User-ID": str(user_id)}
+    return build
+
+
+@pytest.fixture
+def isolated_database(tmp_path, monkeypatch):
+    """A throwaway file database with independent connections, for concurrency tests.
+
+    Unlike db_connection, every thread gets its own connection and real
+    transaction, so constraints and locks behave as they do in production.
+    Yields the engine; services pick it up through get_session().
+    """
+    from sqlalchemy.orm import scoped_session, sessionmaker
+
+    engine = db._create_engine(f"sqlite:///{tmp_path / 'isolated.db'}")
+    db.Base.metadata.create_all(bind=engine)
+    db.close_session()
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", scoped_session(sessionmaker(
+        class_=db.RoutingSession, autocommit=False, autoflush=False, bind=engine,
+    )))
+    instructor_index.invalidate()
+    try:
+        yield engine
+    finally:
+        db.close_session()
+        engine.dispose()
+        instructor_index.invalidate()
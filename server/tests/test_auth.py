@@ -0,0 +1,53 @@
+"""POST /auth/login: 401 for bad credentials, with the same hashing work for unknown emails."""
+import pytest
+
+from models.member import Member
+from services.password_hasher import dummy_password_hash, password_hasher
+from tests.conftest import TEMPLATE_PASSWORD
+
+
+@pytest.fixture
+def verified_hashes(monkeypatch):
+    """Record the stored hash of every password check."""
+    seen = []
+    verify = password_hasher.verify
+
+    def spy(password, stored_hash):
+        seen.append(stored_hash)
+        return verify(password, stored_hash)
+
+    monkeypatch.setattr(password_hasher, "verify", spy)
+    return seen
+
+
+def login(client, email, password):
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def test_valid_credentials(client, template_data):
+    response = login(client, "member0@example.com", TEMPLATE_PASSWORD)
+    assert response.status_code == 200
+    assert response.get_json()["id"] == template_data["members"][0]
+
+
+def test_wrong_password_is_unauthorized(client):
+    response = login(client, "member0@example.com", "Wr0ngPassword")
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "Invalid email or password"
+
+
+def test_unknown_email_is_checked_against_the_dummy_hash(client, verified_hashes):
+    response = login(client, "nobody@example.com", TEMPLATE_PASSWORD)
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "Invalid email or password"
+    assert verified_hashes == [dummy_password_hash()]
+
+
+def test_inactive_account_is_forbidden(client, db_session, template_data):
+    db_session.get(Member, template_data["members"][0]).status = "inactive"
+    db_session.commit()
+    assert login(client, "member0@example.com", TEMPLATE_PASSWORD).status_code == 403
+
+
+def test_dummy_hash_is_computed_at_startup(app):
+    assert dummy_password_hash.cache_info().currsize == 1
@@ -0,0 +1,62 @@
+"""The transactional fixtures isolate tests: nothing a test commits survives it.
+
+Tests in this module run in order; the *_is_gone tests check what the
+previous test committed.
+"""
+from sqlalchemy import select
+
+from models.member import Member
+from models.plan import Plan
+from services.member_service import MemberService
+from services.plan_service import PlanService
+
+
+def test_route_write_is_visible_inside_the_test(client, db_session, auth_headers):
+    response = client.post(
+        "/api/plans",
+        json={"name": "Fixture Plan", "type": "time", "price": 10, "valid_days": 5},
+        headers=auth_headers("admin"),
+    )
+    assert response.status_code == 201
+    assert db_session.scalar(select(Plan.id).where(Plan.name == "Fixture Plan")) is not None
+
+
+def test_route_write_is_gone(db_session):
+    assert db_session.scalar(select(Plan.id).where(Plan.name == "Fixture Plan")) is None
+
+
+def test_service_commit_only_releases_a_savepoint(db_connection, db_session):
+    # create_member commits internally; with the fixture that commit is a SAVEPOINT release
+    member = MemberService().create_member(
+        full_name="Fixture Person", email="fixture.person@example.com",
+        phone="0501234567", national_id="300000001", password="Passw0rd!",
+    )
+    assert member["id"] is not None
+    assert db_connection.in_transaction()
+    assert db_session.scalar(select(Member.id).where(Member.email == "fixture.person@example.com")) == member["id"]
+
+
+def test_service_commit_is_gone(db_session):
+    assert db_session.scalar(select(Member.id).where(Member.email == "fixture.person@example.com")) is None
+
+
+def test_template_changes_are_rolled_back(db_session, template_data):
+    member = db_session.get(Member, template_data["members"][0])
+    member.first_name = "Changed"
+    db_session.commit()
+    assert db_session.get(Member, template_data["members"][0]).first_name == "Changed"
+
+
+def test_template_data_is_restored(db_session, template_data):
+    assert db_session.get(Member, template_data["members"][0]).first_name == "Member0"
+    assert PlanService().get_plan(template_data["plan"]).name == "Monthly"
+
+
+def test_nested_savepoint_rolls_back_independently(db_session, template_data):
+    member = db_session.get(Member, template_data["members"][1])
+    with db_session.begin_nested() as savepoint:
+        member.first_name = "Inner"
+        db_session.flush()
+        savepoint.rollback()
+    db_session.expire_all()
+    assert db_session.get(Member, template_data["members"][1]).first_name == "Member1"
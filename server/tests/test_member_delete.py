@@ -0,0 +1,64 @@
+"""Soft-deleting a member releases their seats and unique keys and hides their rows."""
+import pytest
+
+from models.gym_class import GymClass
+from models.session import Session
+from models.waiting_list import WaitingList
+from services.checkin_service import CheckinService
+from services.exceptions import NotFoundError
+from services.payment_service import PaymentService
+from services.session_service import SessionService
+from services.subscription_service import SubscriptionService
+
+
+@pytest.fixture
+def deleted_member(client, db_session, template_data, auth_headers):
+    """Member0 with a subscription, payment, check-in, class seat and waitlist spot, then soft-deleted."""
+    member_id = template_data["members"][0]
+    sub = SubscriptionService().create_subscription(member_id, template_data["plan"])
+    payment = PaymentService().create_payment(sub.id, 250)
+    CheckinService().checkin_member(member_id)
+    SessionService().register_member_to_class(template_data["classes"][0], member_id)
+    db_session.add(WaitingList(gym_class_id=template_data["classes"][1], member_id=member_id))
+    db_session.commit()
+
+    response = client.delete(f"/api/members/{member_id}", headers=auth_headers("admin"))
+    assert response.status_code == 200
+    db_session.expire_all()
+    return {"id": member_id, "subscription": sub.id, "payment": payment.id}
+
+
+def test_active_registrations_stop_holding_seats(deleted_member, db_session, template_data):
+    statuses = db_session.query(Session.status).filter(Session.member_id == deleted_member["id"]).all()
+    assert statuses == [("canceled",)]
+    assert db_session.query(WaitingList).filter(WaitingList.member_id == deleted_member["id"]).count() == 0
+
+    gym_class = db_session.get(GymClass, template_data["classes"][0])
+    gym_class.capacity = 1
+    db_session.commit()
+    SessionService().register_member_to_class(gym_class.id, template_data["members"][1])
+
+
+def test_payments_and_checkins_are_hidden(deleted_member, client, auth_headers):
+    payments = client.get("/api/payments", headers=auth_headers("admin")).get_json()
+    assert deleted_member["payment"] not in [p["id"] for p in payments]
+    checkins = client.get("/api/checkins", headers=auth_headers("reception")).get_json()
+    assert deleted_member["id"] not in [c["member_id"] for c in checkins]
+
+
+def test_subscriptions_and_payments_by_id_are_not_found(deleted_member):
+    with pytest.raises(NotFoundError):
+        SubscriptionService().get_subscription(deleted_member["subscription"])
+    with pytest.raises(NotFoundError):
+        PaymentService().get_payment(deleted_member["payment"])
+    with pytest.raises(NotFoundError):
+        PaymentService().create_payment(deleted_member["subscription"], 10)
+
+
+def test_same_person_can_be_created_again(deleted_member, client, auth_headers):
+    response = client.post("/api/members", json={
+        "full_name": "Member0 Test", "email": "member0@example.com", "phone": "0501234567",
+        "national_id": "100000000", "password": "Passw0rd!",
+    }, headers=auth_headers("admin"))
+    assert response.status_code == 201
+    assert response.get_json()["id"] != deleted_member["id"]
@@ -0,0 +1,43 @@
+"""Member import: per-row report; the web path hashes on the bounded password_hasher."""
+from routes.members import import_service
+from services.import_service import MemberImportService
+from services.password_hasher import password_hasher
+
+HEADER = "full_name,email,phone,national_id,password\n"
+
+
+def post_csv(client, auth_headers, body):
+    return client.post("/api/members/import?format=csv", data=(HEADER + body).encode(),
+                       headers=auth_headers("admin"))
+
+
+def test_rows_with_extra_columns_are_rejected(client, auth_headers):
+    response = post_csv(client, auth_headers,
+                        "Import One,import.one@example.com,0501234567,400000001,Passw0rd!\n"
+                        "Import Two,import.two@example.com,0501234567,400000002,Passw0rd!,surplus\n")
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report["total"], report["imported"], report["failed"]) == (2, 1, 1)
+    assert report["errors"] == [{"line": 3, "errors": ["Row has 1 more column(s) than the header"]}]
+
+
+def test_web_import_hashes_on_the_bounded_password_hasher(client, auth_headers):
+    completed = password_hasher.get_metrics()["completed"]
+    response = post_csv(client, auth_headers,
+                        "Import Three,import.three@example.com,0501234567,400000003,Passw0rd!\n"
+                        "Import Four,import.four@example.com,0501234567,400000004,Passw0rd!\n")
+    assert response.get_json()["imported"] == 2
+    assert password_hasher.get_metrics()["completed"] == completed + 2
+    assert import_service._pool is None
+
+
+def test_cli_import_hashes_across_a_process_pool(db_session):
+    service = MemberImportService(workers=1)
+    rows = [(2, {"full_name": "Import Five", "email": "import.five@example.com", "phone": "0501234567",
+                 "national_id": "400000005", "password": "Passw0rd!"})]
+    try:
+        report = service.import_members(rows)
+        assert service._pool is not None
+    finally:
+        service.shutdown()
+    assert report["imported"] == 1
@@ -0,0 +1,35 @@
+"""GET /members/<id>/profile is a pure read."""
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from models.subscription import Subscription
+from services import db
+
+
+def test_profile_derives_subscription_status_without_writing(client, db_connection, db_session,
+                                                            template_data, auth_headers):
+    member_id = template_data["members"][0]
+    sub = Subscription(member_id=member_id, plan_id=template_data["plan"], status="active",
+                       start_date=date.today() - timedelta(days=60), end_date=date.today() - timedelta(days=30))
+    db_session.add(sub)
+    db_session.commit()
+    sub_id = sub.id
+
+    writes = []
+
+    def record_writes(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE", "RELEASE")):
+            writes.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record_writes)
+    try:
+        response = client.get(f"/api/members/{member_id}/profile", headers=auth_headers("admin"))
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record_writes)
+
+    assert response.status_code == 200
+    assert [s["status"] for s in response.get_json()["subscriptions"]] == ["expired"]
+    assert writes == []
+    db_session.expire_all()
+    assert db_session.get(Subscription, sub_id).status == "active"
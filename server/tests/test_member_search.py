@@ -0,0 +1,33 @@
+"""Member search routes digit queries to phone and national ID prefixes."""
+import pytest
+
+from models.member import Member
+
+
+@pytest.fixture
+def member_972(db_session):
+    member = Member(first_name="Prefix", last_name="Person", email="prefix.person@example.com",
+                    phone="0529999999", national_id="972123456", password_hash="x")
+    db_session.add(member)
+    db_session.commit()
+    return member.id
+
+
+def search(client, auth_headers, q):
+    return client.get("/api/members/search", query_string={"q": q}, headers=auth_headers("reception"))
+
+
+def test_national_id_starting_with_972_is_matched_as_typed(client, auth_headers, member_972):
+    response = search(client, auth_headers, "972123")
+    assert response.status_code == 200
+    assert [r["id"] for r in response.get_json()["results"]] == [member_972]
+
+
+def test_international_phone_prefix_matches_local_form(client, auth_headers, member_972):
+    response = search(client, auth_headers, "+972-52-999")
+    assert [r["id"] for r in response.get_json()["results"]] == [member_972]
+
+
+@pytest.mark.parametrize("q", ["--", "+-", " - - "])
+def test_query_without_digits_is_rejected(client, auth_headers, q):
+    assert search(client, auth_headers, q).status_code == 400
@@ -0,0 +1,72 @@
+"""The hard query budgets of bench/gate.py, asserted on the template data.
+
+Query counts do not depend on dataset size for these endpoints, so the
+budgets are checked here on every test run; bench.gate adds the latency
+and baseline comparisons on generated datasets.
+"""
+import pytest
+
+from bench.gate import QUERY_BUDGETS
+from services.payment_service import PaymentService
+from services.session_service import SessionService
+from services.sql_stats import statement_listeners
+from services.subscription_service import SubscriptionService
+
+
+@pytest.fixture
+def budget_data(db_session, template_data):
+    """Member0 subscribed, paid and booked; the other members have no subscription.
+
+    Depends on db_session so the service writes land in the per-test transaction.
+    """
+    member_id = template_data["members"][0]
+    sub = SubscriptionService().create_subscription(member_id, template_data["plan"])
+    PaymentService().create_payment(sub.id, 250)
+    SessionService().register_member_to_class(template_data["classes"][0], member_id)
+    return template_data
+
+
+@pytest.fixture
+def query_counter():
+    """Counts statements (transaction control excluded), like bench/run.py."""
+    counter = [0]
+
+    def count_statement(statement, parameters, seconds):
+        counter[0] += 1
+
+    statement_listeners.append(count_statement)
+    yield counter
+    statement_listeners.remove(count_statement)
+
+
+def _requests(data: dict) -> dict:
+    """Endpoint name (as in QUERY_BUDGETS) -> (method, path, json body, user id)."""
+    subscribed, unsubscribed = data["members"][0], data["members"][1]
+    return {
+        "POST /checkins": ("POST", "/api/checkins", {"member_id": subscribed}, subscribed),
+        "GET /classes (member)": ("GET", "/api/classes", None, subscribed),
+        "GET /classes (trainer)": ("GET", "/api/classes", None, data["trainer"]),
+        "POST /classes/<id>/sessions": (
+            "POST", f"/api/classes/{data['classes'][1]}/sessions", {"member_id": unsubscribed}, data["admin"]
+        ),
+        "GET /members": ("GET", "/api/members", None, data["admin"]),
+        "GET /payments": ("GET", "/api/payments", None, data["admin"]),
+        "POST /members/<id>/subscriptions": (
+            "POST", f"/api/members/{unsubscribed}/subscriptions", {"plan_id": data["plan"]}, data["admin"]
+        ),
+    }
+
+
+def test_every_budget_is_covered(template_data):
+    assert set(_requests(template_data)) == set(QUERY_BUDGETS)
+
+
+@pytest.mark.parametrize("name", sorted(QUERY_BUDGETS))
+def test_endpoint_stays_within_query_budget(name, client, budget_data, query_counter):
+    method, path, body, user_id = _requests(budget_data)[name]
+    before = query_counter[0]
+    response = client.open(path, method=method, json=body, headers={"X-User-ID": str(user_id)})
+    queries = query_counter[0] - before
+
+    assert response.status_code < 300, response.get_json()
+    assert queries <= QUERY_BUDGETS[name], f"{name}: {queries} queries, budget is {QUERY_BUDGETS[name]}"
@@ -0,0 +1,85 @@
+"""Read-replica routing with two local SQLite files (primary + DATABASE_REPLICA_URLS).
+
+The replica is deliberately not a copy of the primary: each database holds a
+member the other lacks, so every response shows which one served it.
+"""
+import pytest
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from config.db_config import get_replica_uris
+from models.admin import Admin
+from models.member import Member
+from services import db
+from services.member_service import MemberService
+
+
+def _member(name: str, national_id: str) -> Member:
+    return Member(first_name=name, last_name="Routing", email=f"{name.lower()}@example.com",
+                  phone="0501234567", national_id=national_id, password_hash="x")
+
+
+@pytest.fixture
+def replicated_database(tmp_path, monkeypatch):
+    """Primary and replica SQLite files wired into the app; yields the seeded IDs."""
+    monkeypatch.setenv("DATABASE_REPLICA_URLS", f"sqlite:///{tmp_path / 'replica.db'}")
+    primary = db._create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replicas = [db._create_engine(uri) for uri in get_replica_uris()]
+    for engine in [primary] + replicas:
+        db.Base.metadata.create_all(bind=engine)
+
+    with Session(bind=primary) as session:
+        admin = Admin(first_name="Admin", last_name="Routing", email="admin.routing@example.com",
+                      phone="0501234567", password_hash="x", access_level="full")
+        on_primary = _member("Primary", "500000001")
+        session.add_all([admin, on_primary])
+        session.commit()
+        ids = {"admin": admin.id, "primary_member": on_primary.id}
+    with Session(bind=replicas[0]) as session:
+        on_replica = _member("Replica", "500000002")
+        session.add(on_replica)
+        session.commit()
+        ids["replica_member"] = on_replica.id
+
+    db.close_session()
+    monkeypatch.setattr(db, "engine", primary)
+    monkeypatch.setattr(db, "replica_engines", replicas)
+    monkeypatch.setattr(db, "SessionLocal", scoped_session(sessionmaker(
+        class_=db.RoutingSession, autocommit=False, autoflush=False, bind=primary,
+    )))
+    try:
+        yield ids
+    finally:
+        db.close_session()
+        for engine in [primary] + replicas:
+            engine.dispose()
+
+
+def listed_names(client, admin_id):
+    response = client.get("/api/members", headers={"X-User-ID": str(admin_id)})
+    assert response.status_code == 200
+    return [m["first_name"] for m in response.get_json()["members"]]
+
+
+def test_read_only_listing_reads_from_the_replica(client, replicated_database):
+    assert listed_names(client, replicated_database["admin"]) == ["Replica"]
+
+
+def test_other_reads_go_to_the_primary(client, replicated_database):
+    headers = {"X-User-ID": str(replicated_database["admin"])}
+    response = client.get(f"/api/members/{replicated_database['primary_member']}", headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()["first_name"] == "Primary"
+    assert client.get(f"/api/members/{replicated_database['replica_member']}", headers=headers).status_code == 404
+
+
+def test_session_that_has_written_stays_on_the_primary(replicated_database):
+    # One scoped session == one request: the write pins it until close_session
+    service = MemberService()
+    service.create_member(full_name="Written Routing", email="written.routing@example.com",
+                          phone="0501234567", national_id="500000003", password="Passw0rd!")
+    members, _ = service.list_members()
+    assert sorted(m["first_name"] for m in members) == ["Primary", "Written"]
+
+    db.close_session()
+    members, _ = service.list_members()
+    assert [m["first_name"] for m in members] == ["Replica"]
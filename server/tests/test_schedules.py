@@ -0,0 +1,50 @@
+"""Editing recurring schedules through the API."""
+from datetime import date, timedelta
+
+import pytest
+
+from models.trainer import Trainer
+from services.exceptions import ForbiddenError
+from services.schedule_service import ScheduleService
+
+
+@pytest.fixture
+def schedule_id(client, auth_headers):
+    response = client.post("/api/schedules", json={
+        "title": "Morning Yoga",
+        "instructor": "Trainer Test",
+        "days_of_week": ["Monday", "Thursday"],
+        "start_time": "07:00:00",
+        "start_date": (date.today() + timedelta(days=1)).isoformat(),
+        "horizon_days": 14,
+    }, headers=auth_headers("admin"))
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["id"]
+
+
+@pytest.mark.parametrize("field", ["title", "instructor", "days_of_week", "start_time", "capacity"])
+def test_update_rejects_null_for_required_fields(client, auth_headers, schedule_id, field):
+    response = client.put(f"/api/schedules/{schedule_id}", json={field: None}, headers=auth_headers("admin"))
+    assert response.status_code == 400
+
+
+def test_update_allows_clearing_end_date(client, auth_headers, schedule_id):
+    response = client.put(f"/api/schedules/{schedule_id}", json={"end_date": None}, headers=auth_headers("admin"))
+    assert response.status_code == 200
+    assert response.get_json()["end_date"] is None
+
+
+def test_update_rejects_end_date_before_start_date(client, auth_headers, schedule_id):
+    response = client.put(f"/api/schedules/{schedule_id}", json={"end_date": date.today().isoformat()},
+                          headers=auth_headers("admin"))
+    assert response.status_code == 400
+
+
+def test_update_checks_trainer_permission(db_session, template_data, schedule_id):
+    # Same check as create_schedule: a trainer who may not manage classes cannot edit a series
+    db_session.get(Trainer, template_data["trainer"]).status = "inactive"
+    db_session.commit()
+
+    with pytest.raises(ForbiddenError):
+        ScheduleService().update_schedule(schedule_id, {"instructor": "Someone Else"},
+                                          trainer_id=template_data["trainer"])
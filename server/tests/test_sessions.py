@@ -0,0 +1,42 @@
+"""Class registration: single and bulk paths share the class-row lock and the seat count."""
+import pytest
+
+from models.gym_class import GymClass
+from models.waiting_list import WaitingList
+from services.exceptions import DuplicateError
+from services.session_service import RegistrationMode, SessionService
+
+
+@pytest.fixture
+def small_class(db_session, template_data):
+    gym_class = db_session.get(GymClass, template_data["classes"][0])
+    gym_class.capacity = 2
+    db_session.commit()
+    return gym_class.id
+
+
+def test_single_registration_respects_bulk_registrations(small_class, template_data):
+    members = template_data["members"]
+    SessionService().register_members_bulk(small_class, members[:2])
+    with pytest.raises(DuplicateError, match="Class is full"):
+        SessionService().register_member_to_class(small_class, members[2])
+
+
+def test_bulk_overflow_rejects_members_with_a_reason(small_class, template_data):
+    members = template_data["members"]
+    result = SessionService().register_members_bulk(small_class, members[:4], mode=RegistrationMode.BEST_EFFORT)
+    assert result["registered"] == members[:2]
+    assert result["rejected"] == [{"member_id": m, "reason": "Class is full"} for m in members[2:4]]
+
+
+def test_bulk_overflow_reports_members_already_on_the_waitlist(db_session, small_class, template_data):
+    members = template_data["members"]
+    db_session.add(WaitingList(gym_class_id=small_class, member_id=members[3]))
+    db_session.commit()
+
+    result = SessionService().register_members_bulk(
+        small_class, members[:4], mode=RegistrationMode.BEST_EFFORT, waitlist_overflow=True
+    )
+    assert result["registered"] == members[:2]
+    assert result["waitlisted"] == [members[2]]
+    assert result["rejected"] == [{"member_id": members[3], "reason": "Already on waiting list"}]
@@ -0,0 +1,16 @@
+"""The slow-query log keeps statement shapes and timings, never parameter values."""
+import json
+
+from services.slow_query_log import SlowQueryLog
+
+
+def test_samples_do_not_contain_parameter_values():
+    log = SlowQueryLog(threshold_ms=0)
+    statement = "UPDATE members SET password_hash=? WHERE members.id = ?"
+    log.record(statement, ("pbkdf2_sha256$600000$c2FsdA==$a2V5", 42), 0.25)
+
+    [entry] = log.top()
+    assert entry["statement"] == statement
+    assert entry["count"] == 1
+    assert entry["samples"][0]["ms"] == 250.0
+    assert "pbkdf2" not in json.dumps(entry, default=str)
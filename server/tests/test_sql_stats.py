@@ -0,0 +1,22 @@
+"""SQL instrumentation and app logging setup."""
+import logging
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import configure_logging
+
+
+def test_failed_statement_does_not_leak_its_start_time(db_connection):
+    db_connection.exec_driver_sql("SELECT 1")
+    with pytest.raises(OperationalError):
+        db_connection.exec_driver_sql("SELECT * FROM no_such_table")
+    assert db_connection.info["query_start"] == []
+
+
+def test_configure_logging_leaves_root_logger_alone():
+    root = logging.getLogger()
+    level, handlers = root.level, list(root.handlers)
+    configure_logging()
+    assert (root.level, root.handlers) == (level, handlers)
+    assert logging.getLogger("fittrack").level == logging.INFO
@@ -0,0 +1,117 @@
+"""Waiting list ordering and duplicate protection under concurrent joins."""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from models.gym_class import GymClass
+from models.member import Member
+from models.waiting_list import WaitingList
+from services import db
+from services.exceptions import DuplicateError, NotFoundError
+from services.waiting_list_service import WaitingListService
+
+THREADS = 12
+
+
+def _seed_class_and_members(count: int) -> tuple[int, list[int]]:
+    session = db.get_session()
+    try:
+        gym_class = GymClass(title="Full Class", instructor="Trainer Test",
+                             start_time=datetime.utcnow() + timedelta(days=1), duration_minutes=60, capacity=1)
+        members = [
+            Member(first_name=f"Waiter{i}", last_name="Test", email=f"waiter{i}@example.com",
+                   phone="0501234567", national_id=f"{200000000 + i}", password_hash="x")
+            for i in range(count)
+        ]
+        session.add_all([gym_class] + members)
+        session.commit()
+        return gym_class.id, [m.id for m in members]
+    finally:
+        session.close()
+        db.close_session()
+
+
+def _run_concurrently(calls) -> list:
+    """Start every call at the same moment, one thread each; returns results or raised exceptions."""
+    barrier = threading.Barrier(len(calls))
+    results = [None] * len(calls)
+
+    def run(index, call):
+        barrier.wait()
+        try:
+            results[index] = call()
+        except Exception as e:
+            results[index] = e
+        finally:
+            db.close_session()
+
+    threads = [threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_joins_keep_one_row_per_member_and_gap_free_positions(isolated_database):
+    class_id, member_ids = _seed_class_and_members(THREADS // 2)
+    service = WaitingListService()
+    # Every member tries to join twice, all at once
+    calls = [lambda m=m: service.add_to_waitlist(class_id, m).id for m in member_ids * 2]
+
+    results = _run_concurrently(calls)
+
+    unexpected = [r for r in results if isinstance(r, Exception) and not isinstance(r, DuplicateError)]
+    assert not unexpected
+    assert sum(isinstance(r, DuplicateError) for r in results) == len(member_ids)
+
+    session = db.get_session()
+    try:
+        duplicates = session.execute(
+            select(WaitingList.member_id, func.count())
+            .where(WaitingList.gym_class_id == class_id)
+            .group_by(WaitingList.member_id)
+            .having(func.count() > 1)
+        ).all()
+    finally:
+        session.close()
+    assert duplicates == []
+
+    waitlist = service.get_waitlist(class_id)
+    assert sorted(entry.member_id for entry in waitlist) == sorted(member_ids)
+    assert [entry.position for entry in waitlist] == list(range(1, len(member_ids) + 1))
+
+
+def test_positions_close_gaps_after_removal(isolated_database):
+    class_id, member_ids = _seed_class_and_members(4)
+    service = WaitingListService()
+    for member_id in member_ids:
+        service.add_to_waitlist(class_id, member_id)
+
+    service.remove_from_waitlist(class_id, member_ids[1])
+
+    waitlist = service.get_waitlist(class_id)
+    assert [entry.member_id for entry in waitlist] == [member_ids[0], member_ids[2], member_ids[3]]
+    assert [entry.position for entry in waitlist] == [1, 2, 3]
+
+
+def test_duplicate_join_raises(isolated_database):
+    class_id, member_ids = _seed_class_and_members(1)
+    service = WaitingListService()
+    entry = service.add_to_waitlist(class_id, member_ids[0])
+    assert entry.position == 1
+
+    with pytest.raises(DuplicateError):
+        service.add_to_waitlist(class_id, member_ids[0])
+
+
+def test_unknown_class_or_member_raises_not_found(isolated_database):
+    class_id, member_ids = _seed_class_and_members(1)
+    service = WaitingListService()
+
+    with pytest.raises(NotFoundError):
+        service.add_to_waitlist(class_id + 1000, member_ids[0])
+    with pytest.raises(NotFoundError):
+        service.add_to_waitlist(class_id, member_ids[0] + 1000)
@@ -109,3 +109,46 @@ def normalize_email(email: str) -> str:
     if not email:
         return ""
     return email.strip().lower()
+
+
+def normalize_digits(value: str) -> str:
+    """Strip everything but digits, e.g. for national IDs.
+    
+    Args:
+        value: Text to normalize
+        
+    Returns:
+        Digits only, e.g. '972-123-456' -> '972123456'
+    """
+    if not value:
+        return ""
+    return re.sub(r"\D", "", value)
+
+
+def normalize_phone(phone: str) -> str:
+    """Normalize a phone number to digits in local form (+972 becomes a leading 0).
+    
+    Args:
+        phone: Phone number to normalize
+        
+    Returns:
+        Digits only, e.g. '+972-50-123-4567' -> '0501234567'
+    """
+    digits = normalize_digits(phone)
+    if digits.startswith("972"):
+        digits = "0" + digits[3:]
+    return digits
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for case-insensitive prefix search.
+    
+    Args:
+        name: Name to normalize
+        
+    Returns:
+        Trimmed, lowercased name
+    """
+    if not name:
+        return ""
+    return name.strip().lower()